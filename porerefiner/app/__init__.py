@@ -5,6 +5,7 @@ from subprocess import run
 
 app = application = Flask(__name__)
 app.config['config_file'] = os.environ.get('POREREFINER_CONFIG', Path.home() / '.porerefiner' / 'config.yaml')
+app.config['socket'] = os.environ.get('POREREFINER_SOCKET') # otherwise the one named in the config file
 app.config['host'] = os.environ.get('HOSTNAME', run(["hostname"], capture_output=True, text=True).stdout.strip())
 
 from . import main
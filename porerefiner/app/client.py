@@ -0,0 +1,108 @@
+"One event loop and gRPC channel for the web app, shared by every request"
+
+import asyncio
+import logging
+import threading
+
+import yaml
+
+from datetime import datetime
+
+from grpclib.client import Channel
+from grpclib.exceptions import StreamTerminatedError
+
+from porerefiner.protocols.porerefiner.rpc.porerefiner_grpc import PoreRefinerStub
+from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import RunListRequest, RunView
+
+log = logging.getLogger('porerefiner.app')
+
+
+def configured_socket(config_file):
+    "The service socket named in a config file, as the command line client finds it."
+    with open(config_file, 'r') as config:
+        return yaml.safe_load(config)['server']['socket']
+
+
+class ServiceClient:
+    "Keeps a channel to the porerefiner service open on a private event loop, for calls from any request thread"
+
+    def __init__(self, socket, use_ssl=False, timeout=30):
+        self.socket = socket
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self._loop = None
+        self._thread = None
+        self._channel = None
+        self._stub = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name='porerefiner-client', daemon=True)
+            self._thread.start()
+
+    def _reset(self):
+        if self._channel:
+            self._channel.close()
+        self._channel = self._stub = None
+
+    async def _call(self, method, request):
+        for attempt in range(2):
+            if self._channel is None:
+                self._channel = Channel(path=self.socket, ssl=self.use_ssl)
+                self._stub = PoreRefinerStub(self._channel)
+            try:
+                return await getattr(self._stub, method)(request)
+            except OSError as e: # couldn't (re)connect or the socket went away; the request never reached the service
+                self._reset()
+                if attempt:
+                    raise
+                log.warning(f"Reconnecting to porerefiner service at {self.socket}: {e}")
+            except StreamTerminatedError: # the service may have seen the request, so don't send it twice
+                self._reset()
+                raise
+
+    def call(self, method, request):
+        "Make a unary call on the shared channel and wait for its reply."
+        self._start()
+        return asyncio.run_coroutine_threadsafe(self._call(method, request), self._loop).result(self.timeout)
+
+    def close(self):
+        if not self._loop:
+            return
+        async def closer():
+            self._reset()
+        asyncio.run_coroutine_threadsafe(closer(), self._loop).result(self.timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(self.timeout)
+        self._loop.close()
+        self._loop = self._thread = None
+
+
+def service(app):
+    "The app's shared client, created on first use."
+    client = app.extensions.get('porerefiner')
+    if client is None: # a racing request may build one too, but only the first stored is ever started
+        socket = app.config.get('socket') or configured_socket(app.config['config_file'])
+        client = app.extensions.setdefault('porerefiner', ServiceClient(socket, app.config.get('use_ssl', False)))
+    return client
+
+
+def run_list_request(args, limit=0, offset=0, view=RunView.FULL):
+    "RunListRequest for the filters and ordering in a query string: status, tags, after, before (ISO dates), sort and desc."
+    req = RunListRequest(all=True,
+                         view=view,
+                         status=[st for st in args.getlist('status') if st], # a form's "any" sends an empty one
+                         tags=[str(t) for t in args.getlist('tags') if t],
+                         order_by=args.get('sort', ''),
+                         descending=args.get('desc', '').lower() in ('1', 'true', 'yes', 'on'),
+                         limit=limit,
+                         offset=offset)
+    if args.get('after'):
+        req.started_after.FromDatetime(datetime.fromisoformat(args['after']).astimezone())
+    if args.get('before'):
+        req.started_before.FromDatetime(datetime.fromisoformat(args['before']).astimezone())
+    return req
@@ -1,39 +1,53 @@
 from porerefiner.app import app
-from porerefiner.cli_utils import server
+from porerefiner.app.client import service, run_list_request
 from porerefiner.samplesheets import load_from_csv
-from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import RunRequest, RunListRequest, RunAttachRequest, RunRsyncRequest
+from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import RunRequest, RunAttachRequest, RunRsyncRequest, RunView
 
-from asyncio import run
-from flask import render_template, current_app
+from flask import render_template, current_app, request, abort, url_for
+from math import ceil
 import subprocess
 
 from os import environ
 
-async def list_run_runner():
-    config = current_app.config['config_file']
-    with server(config) as serv:
-        return await serv.GetRuns(RunListRequest(all=True))
-
-def list_runs():
-    return run(list_run_runner()).runs.runs
+PER_PAGE = 50
+
+def list_runs(args):
+    "The page of runs a listing view displays, newest first unless the query string says otherwise, and links to its neighbours."
+    per_page = max(args.get('per_page', PER_PAGE, type=int), 1)
+    page = max(args.get('page', 1, type=int), 1)
+    try:
+        req = run_list_request(args, per_page, (page - 1) * per_page, RunView.SUMMARY)
+    except ValueError as e:
+        abort(400, str(e))
+    if 'desc' not in args:
+        req.descending = True
+    resp = service(current_app).call('GetRuns', req)
+    if resp.HasField('error'):
+        abort(400, resp.error.err_message)
+    pages = max(1, ceil(resp.runs.total / per_page))
+    def page_url(number):
+        return url_for(request.endpoint, **{**args.to_dict(flat=False), 'page': number})
+    return resp.runs.runs, dict(page=page,
+                                pages=pages,
+                                total=resp.runs.total,
+                                prev_url=page_url(page - 1) if page > 1 else None,
+                                next_url=page_url(page + 1) if page < pages else None)
 
 @app.route('/attach')
 @app.route('/api/form/attach')
 def form():
-    return render_template('submit.html', runs=list_runs(), hostname=current_app.config['host'])
+    runs, pager = list_runs(request.args)
+    return render_template('submit.html', runs=runs, pager=pager, hostname=current_app.config['host'])
 
 @app.route('/')
 @app.route('/view')
 def runs():
-    return render_template('view.html', runs=list_runs(), hostname=current_app.config['host'])
+    runs, pager = list_runs(request.args)
+    return render_template('view.html', runs=runs, pager=pager, args=request.args, hostname=current_app.config['host'])
 
 @app.route('/view/<int:run_id>')
 def view_run(run_id):
-    async def get_run(run_id):
-        config = current_app.config['config_file']
-        with server(config) as serv:
-            return await serv.GetRunInfo(RunRequest(id=run_id))
-    return render_template('run_view.html', run=run(get_run(run_id)).run)
+    return render_template('run_view.html', run=service(current_app).call('GetRunInfo', RunRequest(id=run_id)).run)
 
 @app.route('/template')
 def template():
@@ -0,0 +1,83 @@
+"Serialized run messages for finished runs, so repeated listings don't rebuild them"
+
+import logging
+
+from collections import OrderedDict, defaultdict
+
+log = logging.getLogger('porerefiner.cache')
+
+
+class RunCache:
+    "LRU of serialized run messages, bounded by total bytes. Every write to a run bumps its version, and entries built from an older version are never served."
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.versions = defaultdict(int) # run id -> writes seen
+        self.entries = OrderedDict() # (run id, view) -> (version, serialized message), least recently used first
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, run_cache_bytes=None, *a, **k):
+        "Apply settings from the porerefiner section of the config."
+        if run_cache_bytes is not None:
+            self.max_bytes = run_cache_bytes
+            self._evict()
+
+    def bump(self, *run_ids):
+        "Note that something about these runs changed."
+        for run_id in run_ids:
+            if run_id is not None:
+                self.versions[run_id] += 1
+
+    def get(self, run_id, view=0):
+        "Serialized message for a run as of its current version, or None."
+        key = (run_id, view)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        version, data = entry
+        if version != self.versions[run_id]:
+            self._drop(key)
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return data
+
+    def put(self, run_id, view, data):
+        "Store a message built from the database as it is now; builds are synchronous, so no write can have slipped in."
+        key = (run_id, view)
+        if key in self.entries:
+            self._drop(key)
+        if len(data) > self.max_bytes:
+            return
+        self.entries[key] = (self.versions[run_id], data)
+        self.size += len(data)
+        self._evict()
+
+    def _drop(self, key):
+        _, data = self.entries.pop(key)
+        self.size -= len(data)
+
+    def _evict(self):
+        while self.size > self.max_bytes and self.entries:
+            _, (_, data) = self.entries.popitem(last=False)
+            self.size -= len(data)
+
+    def clear(self):
+        self.entries.clear()
+        self.versions.clear()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        return dict(entries=len(self.entries),
+                    bytes=self.size,
+                    max_bytes=self.max_bytes,
+                    hits=self.hits,
+                    misses=self.misses)
+
+RUN_CACHE = RunCache()
@@ -0,0 +1,213 @@
+"Checksumming of run output files, off the event loop"
+
+import asyncio
+import hashlib
+import logging
+import os
+import zlib
+
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger('porerefiner.checksums')
+
+
+class RollingChecksum:
+    "hashlib-style wrapper around a CRC function of the form func(data, value) -> int"
+
+    def __init__(self, name, func, value=0):
+        self.name = name
+        self.func = func
+        self.value = value
+
+    def update(self, data):
+        self.value = self.func(data, self.value)
+
+    def hexdigest(self):
+        return f"{self.value:08x}"
+
+    def copy(self):
+        return RollingChecksum(self.name, self.func, self.value)
+
+
+ALGORITHMS = {
+    # name -> zero-argument factory for a hashlib-style object
+    'md5': hashlib.md5,
+    'sha256': hashlib.sha256,
+    'blake2b': hashlib.blake2b,
+    'crc32': lambda: RollingChecksum('crc32', zlib.crc32),
+}
+
+DEFAULT_ALGORITHM = 'md5' # what File.checksum has always held; rows without an algorithm tag are md5
+
+# Formats the sequencer only ever appends to. Only these are hashed incrementally as they grow; anything
+# else might be rewritten in place (a summary or report regenerated at the end of a run), which would leave
+# a digest of bytes that are no longer there, so it's hashed from scratch once it goes quiet.
+APPEND_ONLY_SUFFIXES = ('.fastq', '.fq', '.fastq.gz', '.fq.gz', '.bam')
+
+def appends_only(path):
+    return str(path).lower().endswith(APPEND_ONLY_SUFFIXES)
+
+# Faster algorithms from optional packages (pip install porerefiner[checksums])
+
+try:
+    import xxhash
+    ALGORITHMS['xxh64'] = xxhash.xxh64
+    ALGORITHMS['xxh3_64'] = xxhash.xxh3_64
+    ALGORITHMS['xxh3_128'] = xxhash.xxh3_128
+except ImportError:
+    pass
+
+try:
+    import blake3
+    ALGORITHMS['blake3'] = lambda: blake3.blake3(max_threads=blake3.blake3.AUTO)
+except ImportError:
+    pass
+
+try:
+    import crc32c
+    ALGORITHMS['crc32c'] = lambda: RollingChecksum('crc32c', crc32c.crc32c)
+except ImportError:
+    pass
+
+
+def new_hasher(algorithm=DEFAULT_ALGORITHM):
+    try:
+        return ALGORITHMS[algorithm]()
+    except KeyError:
+        raise ValueError(f"Checksum algorithm '{algorithm}' not available; choose from {', '.join(ALGORITHMS)}.") from None
+
+
+class RunningChecksum:
+    "Digest of the first `offset` bytes of a file that may still be growing"
+
+    def __init__(self, algorithm=DEFAULT_ALGORITHM, hasher=None, offset=0):
+        self.algorithm = algorithm
+        self.hasher = hasher or new_hasher(algorithm)
+        self.offset = offset
+
+    def hexdigest(self):
+        return self.hasher.hexdigest()
+
+    def reset(self):
+        self.hasher = new_hasher(self.algorithm)
+        self.offset = 0
+
+    @property
+    def state(self):
+        "Serialized digest state, or None for algorithms (md5, sha, xxhash, blake) whose state can't be exported."
+        if isinstance(self.hasher, RollingChecksum):
+            return self.hasher.value.to_bytes(4, 'big')
+
+    @classmethod
+    def resume(cls, algorithm, offset=0, state=None, stored_algorithm=None):
+        "Pick up from persisted state if it was produced by the same algorithm; otherwise start from byte zero."
+        if state and stored_algorithm == algorithm:
+            hasher = new_hasher(algorithm)
+            if isinstance(hasher, RollingChecksum):
+                hasher.value = int.from_bytes(state, 'big')
+                return cls(algorithm, hasher, offset)
+        return cls(algorithm)
+
+
+def consume(running, path, chunk_size=8 * 1024 * 1024, progress=None):
+    "Feed the bytes appended to a file since running.offset into its digest, calling progress(offset, total_bytes)."
+    total = os.stat(path).st_size
+    if total < running.offset: # truncated or replaced, not appended to
+        running.reset()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as fh:
+        fh.seek(running.offset)
+        while (n := fh.readinto(buffer)):
+            running.hasher.update(view[:n]) # hashlib and friends release the GIL for large updates
+            running.offset += n
+            if progress:
+                progress(running.offset, total)
+    return running
+
+
+def checksum_file(path, algorithm=DEFAULT_ALGORITHM, chunk_size=8 * 1024 * 1024, progress=None):
+    "Stream a file through a checksum in large chunks, calling progress(bytes_read, total_bytes) as it goes."
+    return consume(RunningChecksum(algorithm), path, chunk_size, progress).hexdigest()
+
+
+class HashingPool:
+    "Bounded pool of worker threads that checksums files in parallel without blocking the event loop"
+
+    def __init__(self, workers=None, algorithm=DEFAULT_ALGORITHM, chunk_size=8 * 1024 * 1024, progress_interval=1024 ** 3):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.algorithm = algorithm
+        self.chunk_size = chunk_size
+        self.progress_interval = progress_interval
+        self.in_progress = {} # path -> (bytes read, total bytes)
+        self.running = {} # file id -> RunningChecksum of a file that's still being written
+        self._locks = {}
+        self._executor = None
+
+    def configure(self, hashing_workers=None, hashing_chunk_size=None, checksum_algorithm=None, *a, **k):
+        "Apply settings from the porerefiner section of the config."
+        if checksum_algorithm:
+            new_hasher(checksum_algorithm) # fail fast on an unavailable algorithm
+        self.shutdown()
+        self.workers = hashing_workers or self.workers
+        self.chunk_size = hashing_chunk_size or self.chunk_size
+        self.algorithm = checksum_algorithm or self.algorithm
+
+    @property
+    def executor(self):
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='porerefiner-hash')
+        return self._executor
+
+    def _reporter(self, path):
+        "Progress callback for one file; logs roughly every progress_interval bytes."
+        next_report = [self.progress_interval]
+        def progress(read, total):
+            self.in_progress[path] = (read, total)
+            if read >= next_report[0] and read < total:
+                next_report[0] += self.progress_interval
+                log.info(f"Hashing {path}: {read / 2**20:.0f} of {total / 2**20:.0f} MiB")
+        return progress
+
+    async def checksum(self, path):
+        "Checksum a file on a worker thread. At most `workers` files are hashed at once; the rest queue."
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, checksum_file, path, self.algorithm, self.chunk_size, self._reporter(path))
+        finally:
+            self.in_progress.pop(path, None)
+
+    async def follow(self, file_id, path, offset=0, state=None, stored_algorithm=None):
+        "Hash whatever has been appended to a growing file since the last call; returns its RunningChecksum."
+        lock = self._locks.setdefault(file_id, asyncio.Lock())
+        async with lock:
+            running = self.running.get(file_id)
+            if not running or running.algorithm != self.algorithm:
+                running = RunningChecksum.resume(self.algorithm, offset, state, stored_algorithm)
+            loop = asyncio.get_running_loop()
+            try:
+                self.running[file_id] = await loop.run_in_executor(self.executor, consume, running, path, self.chunk_size, self._reporter(path))
+            finally:
+                self.in_progress.pop(path, None)
+            return running
+
+    async def finish(self, file_id, path, offset=0, state=None, stored_algorithm=None):
+        "Checksum of a file that's gone quiet. For append-only formats only bytes not already consumed by follow() are read; anything else is hashed from scratch."
+        if not appends_only(path):
+            self.forget(file_id)
+            offset, state = 0, None
+        try:
+            return (await self.follow(file_id, path, offset, state, stored_algorithm)).hexdigest()
+        finally:
+            self.forget(file_id)
+
+    def forget(self, file_id):
+        self.running.pop(file_id, None)
+        self._locks.pop(file_id, None)
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+HASHING = HashingPool()
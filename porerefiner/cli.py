@@ -9,9 +9,9 @@ from asyncio import run
 from pathlib import Path
 from functools import wraps, partial
 
-from porerefiner.cli_utils import VALID_RUN_ID, server, hr_formatter, json_formatter, xml_formatter, handle_connection_errors
+from porerefiner.cli_utils import VALID_RUN_ID, TAG_QUERY, server, stream_runs, hr_formatter, json_formatter, xml_formatter, handle_connection_errors
 from porerefiner.samplesheets import load_from_csv, load_from_excel
-from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import RunRequest, RunListRequest, RunAttachRequest, RunRsyncRequest, TagRequest
+from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import RunRequest, RunAttachRequest, RunRsyncRequest, TagRequest, TriggerRequest, RunStreamRequest, RunView
 
 # prfr front-end should no longer use the package config support, it needs to do its own thing
 
@@ -66,7 +66,7 @@ def with_remote(cmd):
 # )
 
 def with_output_formatting(cmd):
-    cmd = click.option('-h', '--human-readable', 'output_format', flag_value=hr_formatter, help='Output in a human-readable table.', default=hr_formatter)(cmd)
+    cmd = click.option('-h', '--human-readable', 'output_format', flag_value=hr_formatter, help='Output in a human-readable table.', default=True)(cmd)
     cmd = click.option('-j', '--json', 'output_format', flag_value=json_formatter, help='Output in JSON.')(cmd)
     cmd = click.option('-x', '--xml', 'output_format', flag_value=xml_formatter, help='Output in schemaless XML.')(cmd)
     cmd = click.option('-e', '--extended', 'extend', default=False, is_flag=True, help="Extended output format.")(cmd)
@@ -95,30 +95,32 @@ def cli():
 # @click.option('-x', '--xml', 'output_format', flag_value=xml_formatter, help='Output in schemaless XML.')
 # @click.option('-e', '--extended', 'extend', default=False, is_flag=True, help="Extended output format.")
 @with_output_formatting
-@click.option('-t', '--tag', 'tags', multiple=True)
+@click.option('-t', '--tag', 'tags', multiple=True, type=TAG_QUERY, help="Tag, namespace:name=value triple tag, or a query joining them with AND, OR, NOT and parentheses. Runs matching any --tag are shown.")
+@click.option('--verify', is_flag=True, default=False, help="Check file sizes on disk instead of reporting the last known ones.")
 @coroutine
-async def ps(remote, output_format, extend, all=False, tags=[], use_ssl=False):
+async def ps(remote, output_format, extend, all=False, tags=[], verify=False, use_ssl=False):
     "Show runs in progress, or every tracked run (--all), or with a particular tag (--tag)."
     with server(remote, use_ssl) as serv:
         with output_format(extend) as formatter:
-            resp = await serv.GetRuns(RunListRequest(all=all, tags=tags))
-            for run in resp.runs.runs:
+            view = RunView.SUMMARY if output_format is hr_formatter and not extend else RunView.FULL # the short table only shows counts
+            async for run in stream_runs(serv, RunStreamRequest(all=all, tags=tags, verify=verify, view=view)):
                 formatter(run)
 
 @cli.command()
 @handle_connection_errors
 #@with_config
 @with_remote
-@click.option('-h', '--human-readable', 'output_format', flag_value=hr_formatter, help='Output in a human-readable table.', default=hr_formatter)
+@click.option('-h', '--human-readable', 'output_format', flag_value=hr_formatter, help='Output in a human-readable table.', default=True)
 @click.option('-j', '--json', 'output_format', flag_value=json_formatter, help='Output in JSON.')
 @click.option('-x', '--xml', 'output_format', flag_value=xml_formatter, help='Output in schemaless XML.')
+@click.option('--verify', is_flag=True, default=False, help="Check file sizes on disk instead of reporting the last known ones.")
 @click.argument('run_id', type=VALID_RUN_ID)
 @coroutine
-async def info(remote, output_format, run_id, use_ssl=False):
+async def info(remote, output_format, run_id, verify=False, use_ssl=False):
     "Return information about a run, historical or in progress."
     with server(remote, use_ssl) as serv:
         with output_format(extend=True) as formatter:
-            req = RunRequest()
+            req = RunRequest(verify=verify)
             if isinstance(run_id, str):
                 req.name = run_id
             else:
@@ -176,6 +178,20 @@ def untag(remote, run_id, tag=[], use_ssl=False):
     "Remove one or more tags from a run."
     run(tag_runner(remote, run_id, tag, untag=True, use_ssl=use_ssl))
 
+@cli.command()
+@handle_connection_errors
+@with_remote
+@click.argument('task', type=click.Choice(['runs', 'jobs', 'modifications']))
+@coroutine
+async def poll(remote, task, use_ssl=False):
+    "Run a periodic server task (run polling, job polling, modification flushing) now."
+    with server(remote, use_ssl) as serv:
+        resp = await serv.Trigger(TriggerRequest(task=task))
+        if resp.HasField('error'):
+            click.echo(f"ERROR: {resp.error.err_message}", err=True)
+            quit(1)
+        click.echo(f"{task} polled in {resp.duration.ToTimedelta().total_seconds():.2f}s")
+
 @cli.command()
 @handle_connection_errors
 #@with_config
@@ -5,6 +5,7 @@ import csv
 import datetime
 import json
 import sys
+import textwrap
 from pathlib import Path
 from contextlib import contextmanager
 from collections import defaultdict
@@ -66,6 +67,20 @@ class ValidRunID(click.ParamType):
 
 VALID_RUN_ID = ValidRunID()
 
+class TagQuery(click.ParamType):
+
+    name = "tag query"
+
+    def convert(self, value, param, ctx):
+        from porerefiner.tagquery import parse, TagQueryError
+        try:
+            parse(value)
+        except TagQueryError as e:
+            self.fail(str(e), param, ctx)
+        return value
+
+TAG_QUERY = TagQuery()
+
 class PathPath(click.Path):
 
     name = "path"
@@ -103,18 +118,32 @@ def server(socket, use_ssl=False):
     finally:
         channel.close()
 
+async def stream_runs(client, request):
+    "Yield runs from the StreamRuns RPC as the server sends them."
+    async with client.StreamRuns.open() as stream:
+        await stream.send_message(request, end=True)
+        async for run in stream:
+            yield run
+
 #formatters for run output
 
+HR_PAGE_SIZE = 50 # runs per printed table, so long listings print as they arrive
+
 @contextmanager
-def hr_formatter(extend=False):
+def hr_formatter(extend=False, page_size=HR_PAGE_SIZE):
     rec = []
+    runs = [0]
     def print_run(run):
+        if runs[0] and not runs[0] % page_size:
+            print(tabulate(rec, headers="keys"))
+            rec.clear()
+        runs[0] += 1
         rec.append(dict(id=run.id,
                         name=run.name,
                         nickname=run.mnemonic_name,
                         status=run.status,
-                        samples=len(run.samples),
-                        files=sum([len(sam.files) for sam in run.samples]) + len(run.files),
+                        samples=run.sample_count or len(run.samples),
+                        files=run.file_count or sum([len(sam.files) for sam in run.samples]) + len(run.files),
                         tags=",".join(list(run.tags) + [f"{ttag.namespace}:{ttag.name}={ttag.value}" for ttag in run.trip_tags])))
         if extend:
             rec[-1]['path'] = run.path
@@ -150,11 +179,14 @@ class MessageAwareEncoder(json.JSONEncoder):
 
 @contextmanager
 def json_formatter(extend=False):
-    rec = []
+    "Writes the same JSON array json.dumps would, one run at a time."
+    count = [0]
     def print_run(run):
-        rec.append(run)
+        item = textwrap.indent(json.dumps(run, cls=MessageAwareEncoder, indent=2), '  ')
+        click.echo(("[\n" if not count[0] else ",\n") + item, nl=False)
+        count[0] += 1
     yield print_run
-    click.echo(json.dumps(rec, cls=MessageAwareEncoder, indent=2))
+    click.echo("\n]" if count[0] else "[]")
 
 @contextmanager
 def xml_formatter(extend=False): #TODO
@@ -103,6 +103,20 @@ class Config(metaclass=DictLikeClass):
             defaults['porerefiner']['log_level'] = logging.INFO
             defaults['porerefiner']['run_polling_interval'] = 600
             defaults['porerefiner']['job_polling_interval'] = 1800
+            defaults['porerefiner']['scheduler_jitter'] = 0.1
+            defaults['porerefiner']['modification_flush_interval'] = 5
+            defaults['porerefiner']['modification_buffer_size'] = 1000
+            defaults['porerefiner']['path_index_size'] = 100000
+            defaults['porerefiner']['hashing_workers'] = 4
+            defaults['porerefiner']['run_cache_bytes'] = 64 * 1024 * 1024
+            defaults['porerefiner']['hashing_chunk_size'] = 8 * 1024 * 1024
+            defaults['porerefiner']['checksum_algorithm'] = 'md5'
+            defaults['porerefiner']['ssh_max_channels'] = 8 # below OpenSSH's default MaxSessions of 10
+            defaults['porerefiner']['ssh_max_connections'] = 2
+            defaults['porerefiner']['ssh_idle_timeout'] = 300
+            defaults['porerefiner']['ssh_keepalive_interval'] = 30
+            defaults['porerefiner']['job_concurrency'] = 8 # submissions in flight per submitter
+            defaults['porerefiner']['job_max_attempts'] = 3
             defaults['database']['path'] = database_path or porerefiner_dir / 'database.db' # '/Users/justin.payne/.porerefiner/database.db'
             defaults['database']['pragmas']['foreign_keys'] = 1
             defaults['database']['pragmas']['journal_mode'] = 'wal'
@@ -0,0 +1,126 @@
+"Hands ready jobs to their submitters a bounded number at a time, highest priority first and taking turns between runs"
+
+import asyncio
+import logging
+
+from itertools import chain, zip_longest
+
+log = logging.getLogger('porerefiner.dispatch')
+
+
+class SubmitterQueue:
+    "A submitter's slots for submissions in flight, and how many are waiting for one"
+
+    def __init__(self, limit):
+        self.slots = asyncio.Semaphore(limit)
+        self.limit = limit
+        self.queued = 0
+        self.running = 0
+        self.submitted = 0
+        self.failed = 0
+
+    def stats(self):
+        return dict(limit=self.limit,
+                    queued=self.queued,
+                    running=self.running,
+                    submitted=self.submitted,
+                    failed=self.failed)
+
+
+class JobDispatcher:
+    "Submits ready duties with at most `concurrency` submissions in flight per submitter. A failed submission is logged and retried next cycle, up to `max_attempts`, without holding up the others."
+
+    def __init__(self, concurrency=8, max_attempts=3):
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.queues = {} # id(submitter) -> (submitter, SubmitterQueue); dataclass submitters aren't hashable
+
+    def configure(self, job_concurrency=None, job_max_attempts=None, *a, **k):
+        "Apply settings from the porerefiner section of the config."
+        if job_concurrency:
+            self.concurrency = job_concurrency
+            self.queues.clear()
+        if job_max_attempts:
+            self.max_attempts = job_max_attempts
+
+    def queue(self, submitter):
+        if id(submitter) not in self.queues:
+            self.queues[id(submitter)] = (submitter, SubmitterQueue(getattr(submitter, 'concurrency', None) or self.concurrency))
+        return self.queues[id(submitter)][1]
+
+    @staticmethod
+    def priority(configured_job):
+        "Sample sheet jobs first, then run jobs, then the many file jobs."
+        from porerefiner.jobs import FileJob, RunJob
+        if isinstance(configured_job, FileJob):
+            return 2
+        if isinstance(configured_job, RunJob):
+            return 1
+        return 0
+
+    @staticmethod
+    def runs_of(jobs):
+        "Run id each duty belongs to, looking up file duties' runs in one query."
+        from porerefiner.models import File
+        file_ids = [job.file_id for job in jobs if job.run_id is None and job.file_id is not None]
+        file_runs = dict(File.select(File.id, File.run).where(File.id << file_ids).tuples()) if file_ids else {}
+        return {job.id: job.run_id if job.run_id is not None else file_runs.get(job.file_id) for job in jobs}
+
+    def plan(self, jobs):
+        "Ready duties as (submitter, batch) submissions in the order they should start."
+        from porerefiner.jobs import CONFIGURED_JOB_REGISTRY
+        runs = self.runs_of(jobs)
+        groups = {} # (priority, job class) -> run id -> duties
+        for job in jobs:
+            configured_job = CONFIGURED_JOB_REGISTRY[job.job_class]
+            groups.setdefault((self.priority(configured_job), job.job_class), {}).setdefault(runs[job.id], []).append(job)
+        plan = []
+        for (_, job_class), by_run in sorted(groups.items(), key=lambda item: item[0][0]):
+            submitter = CONFIGURED_JOB_REGISTRY[job_class].submitter
+            fair = [job for job in chain.from_iterable(zip_longest(*by_run.values())) if job is not None] # one from each run in turn
+            size = max(1, getattr(submitter, 'max_batch', 1))
+            plan.extend((submitter, fair[i:i + size]) for i in range(0, len(fair), size))
+        return plan
+
+    async def _submit(self, submitter, batch):
+        queue = self.queue(submitter)
+        queue.queued += 1
+        try:
+            await queue.slots.acquire()
+        finally:
+            queue.queued -= 1
+        queue.running += 1
+        job_ids = [job.job_id for job in batch]
+        try:
+            outcomes = await submitter._submit_many(batch)
+        except Exception as e:
+            outcomes = [e] * len(batch)
+        finally:
+            queue.running -= 1
+            queue.slots.release()
+        submitted = 0
+        for job, job_id, outcome in zip(batch, job_ids, outcomes):
+            if outcome is not None and job.job_id == job_id:
+                log.error(f"error in {type(submitter).__name__} submitting {job.job_class} job {job.id}: {outcome}")
+                queue.failed += 1
+                job.attempts += 1
+                job.status = 'FAILED' if job.attempts >= self.max_attempts else 'READY'
+                job.save()
+                continue
+            if outcome is not None: # it reached the scheduler before failing, so trying again would run it twice
+                log.error(f"error in {type(submitter).__name__} after submitting {job.job_class} job {job.id}: {outcome}")
+            submitted += 1
+        queue.submitted += submitted
+        return submitted
+
+    async def dispatch(self, jobs):
+        "Submit ready duties; returns how many were submitted."
+        jobs = list(jobs)
+        if not jobs:
+            return 0
+        return sum(await asyncio.gather(*[self._submit(submitter, batch) for submitter, batch in self.plan(jobs)]))
+
+    def stats(self):
+        return {repr(submitter): queue.stats() for submitter, queue in self.queues.values()}
+
+DISPATCHER = JobDispatcher()
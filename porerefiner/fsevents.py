@@ -1,9 +1,7 @@
 import asyncio
-import aiofile
 import aiohttp
 import click
 import datetime
-import hashlib
 import json
 import logging
 import subprocess
@@ -11,18 +9,24 @@ import sys
 import watchdog
 
 from asyncio import run, gather, wait
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from grpclib.server import Server
 from grpclib.utils import graceful_exit
 from hachiko.hachiko import AIOEventHandler, AIOWatchdog
-from itertools import chain
-from peewee import JOIN
+from heapq import heappush, heappop
+from itertools import chain, count
+from peewee import JOIN, Case
 from porerefiner import models
-from porerefiner.models import Run, Qa, File, Duty, SampleSheet, Sample, Tag, TagJunction, TTagJunction
+from porerefiner.models import Run, Qa, File, Duty, SampleSheet, Sample, Tag, TagJunction, TTagJunction, runs_of_files
+from porerefiner.cache import RUN_CACHE
 from porerefiner.cli_utils import relativize_path as r, absolutize_path as a, json_formatter
 from porerefiner.jobs import poll_jobs, CLASS_REGISTRY, JOBS
-from os.path import split, getmtime
-from os import remove
+from porerefiner.checksums import HASHING, appends_only
+from porerefiner.scheduler import SCHEDULER
+from porerefiner.dispatch import DISPATCHER
+from os.path import split
+from os import remove, scandir
 from pathlib import Path
 
 # from porerefiner.protocols.minknow.rpc.manager_grpc import ManagerServiceStub
@@ -39,6 +43,175 @@ from porerefiner.rpc import get_run
 log = logging.getLogger('porerefiner.fs')
 
 
+class ModificationBuffer:
+    "Coalesce file modification events in memory and write them behind in bulk"
+
+    chunk_size = 500 # keep each UPDATE well under SQLite's bound-parameter limit
+
+    def __init__(self, max_pending=1000):
+        self.max_pending = max_pending
+        self.pending = {} # path -> (file id, last modification time)
+        self.grown = {} # file id -> path, for files flushed since the last take_grown()
+
+    def __len__(self):
+        return len(self.pending)
+
+    def __contains__(self, path):
+        return r(path) in self.pending
+
+    def touch(self, path, file_id=None, when=None):
+        "Record a modification to a known file. Returns True once the buffer is due to be flushed."
+        path = r(path)
+        if file_id is None:
+            file_id, _ = self.pending[path]
+        self.pending[path] = (file_id, when or datetime.now())
+        return len(self.pending) >= self.max_pending
+
+    def discard(self, path):
+        file_id, _ = self.pending.pop(r(path), (None, None))
+        self.grown.pop(file_id, None)
+
+    def clear(self):
+        self.pending.clear()
+        self.grown.clear()
+
+    def take_grown(self):
+        "Files that have been modified since the last call."
+        grown, self.grown = self.grown, {}
+        return grown
+
+    def flush(self):
+        "Write all buffered modification times in a single transaction."
+        if not self.pending:
+            return 0
+        pending, self.pending = self.pending, {}
+        updates = list(pending.values())
+        self.grown.update((file_id, path) for path, (file_id, _) in pending.items())
+        with File._meta.database.atomic():
+            for i in range(0, len(updates), self.chunk_size):
+                chunk = updates[i:i + self.chunk_size]
+                (File.update(last_modified=Case(File.id, chunk))
+                     .where(File.id << [file_id for file_id, _ in chunk])
+                     .execute())
+                times = dict(chunk)
+                for file_id, run_id in File.select(File.id, File.run).where(File.id << list(times)).tuples():
+                    FILE_ACTIVITY.touch(file_id, times[file_id])
+                    if run_id is not None:
+                        RUN_ACTIVITY.touch(run_id, times[file_id])
+                        RUN_CACHE.bump(run_id)
+        log.debug(f"Flushed {len(updates)} file modifications.")
+        return len(updates)
+
+MODIFICATIONS = ModificationBuffer()
+
+
+class ActivityWatch:
+    "Latest-modification watermarks plus a heap of quiet deadlines, so things that have stopped changing are found without a scan"
+
+    def __init__(self, quiet_period=timedelta(hours=1)):
+        self.quiet_period = quiet_period
+        self.watermarks = {} # key -> latest modification time
+        self._heap = [] # (deadline, sequence, key); at most one entry per key, possibly earlier than its watermark allows
+        self._scheduled = set()
+        self._sequence = count()
+
+    def __contains__(self, key):
+        return key in self.watermarks
+
+    def __len__(self):
+        return len(self.watermarks)
+
+    def touch(self, key, when=None):
+        when = when or datetime.now()
+        mark = self.watermarks.get(key)
+        if mark is None or when > mark:
+            self.watermarks[key] = when
+        if key not in self._scheduled: # a moved watermark is caught up with when its old deadline comes up
+            self._scheduled.add(key)
+            heappush(self._heap, (self.watermarks[key] + self.quiet_period, next(self._sequence), key))
+
+    def discard(self, key):
+        self.watermarks.pop(key, None)
+
+    def clear(self):
+        self.watermarks.clear()
+        self._heap.clear()
+        self._scheduled.clear()
+
+    def pop_quiet(self, now=None):
+        "Remove and return the keys that haven't been touched for the quiet period."
+        now = now or datetime.now()
+        quiet = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, key = heappop(self._heap)
+            self._scheduled.discard(key)
+            mark = self.watermarks.get(key)
+            if mark is None:
+                continue
+            if mark + self.quiet_period <= now:
+                del self.watermarks[key]
+                quiet.append(key)
+            else:
+                self.touch(key, mark)
+        return quiet
+
+    def next_deadline(self):
+        return self._heap[0][0] if self._heap else None
+
+RUN_ACTIVITY = ActivityWatch()
+FILE_ACTIVITY = ActivityWatch()
+
+
+class PathIndex:
+    "Bounded LRU index of file paths to File ids and run directories to Run ids"
+
+    def __init__(self, max_files=100000, max_runs=1000):
+        self.max_files = max_files
+        self.max_runs = max_runs
+        self.files = OrderedDict()
+        self.runs = OrderedDict()
+
+    @staticmethod
+    def _get(table, path):
+        path = r(path)
+        if path in table:
+            table.move_to_end(path)
+            return table[path]
+
+    @staticmethod
+    def _put(table, path, value, limit):
+        path = r(path)
+        table[path] = value
+        table.move_to_end(path)
+        while len(table) > limit:
+            table.popitem(last=False)
+        return value
+
+    def file_id(self, path):
+        return self._get(self.files, path)
+
+    def add_file(self, path, file_id):
+        return self._put(self.files, path, file_id, self.max_files)
+
+    def discard_file(self, path):
+        self.files.pop(r(path), None)
+
+    def run_id(self, path):
+        return self._get(self.runs, path)
+
+    def add_run(self, path, run_id):
+        return self._put(self.runs, path, run_id, self.max_runs)
+
+    def discard_run(self, path):
+        self.runs.pop(r(path), None)
+
+    def clear(self):
+        self.files.clear()
+        self.runs.clear()
+
+PATHS = PathIndex()
+
+
 
 async def register_new_flowcell(flow, nanopore_api=None):
     "Hook for new flowcells"
@@ -86,28 +259,55 @@ async def attach_samplesheet_to_run(sheet, run_id=None):
 
 
 
-async def poll_file(file):
-    if datetime.now() - file.last_modified > timedelta(hours=1):
-        await end_file(file)
-        return True
-    return False
-
-async def poll_active_run():
-    "Scan run(s) in progress, close out runs that have been stable for an hour"
-    runs = Run.select().where(Run.status == 'RUNNING')
-    i = 0
-    for i, run in enumerate(runs, 1):
-        if len(run.files) and all([await poll_file(file) for file in run.files]):
-            await end_run(run)
-    return i
+async def poll_active_run(sweep=True):
+    "Close out files and runs that have been quiet for an hour"
+    MODIFICATIONS.flush()
+    now = datetime.now()
+    file_ids = FILE_ACTIVITY.pop_quiet(now)
+    for i in range(0, len(file_ids), ModificationBuffer.chunk_size):
+        files = File.select().where(File.id << file_ids[i:i + ModificationBuffer.chunk_size])
+        await gather(*[end_file(file) for file in files]) # closeout hashes in parallel
+    run_ids = RUN_ACTIVITY.pop_quiet(now)
+    ended = 0
+    if sweep: # catch quiet runs that aren't being watched, e.g. ones whose files were never seen by this process
+        swept = [run_id for run_id, _ in Run.get_quiet_runs(now - RUN_ACTIVITY.quiet_period)
+                 if run_id not in RUN_ACTIVITY and run_id not in run_ids]
+        for ended, run in enumerate(Run.select().where(Run.id << swept, Run.status == 'RUNNING'), 1):
+            await close_run(run)
+    runs = list(Run.select().where(Run.id << run_ids, Run.status == 'RUNNING')) if run_ids else []
+    for run in runs:
+        await end_run(run)
+    return ended + len(runs)
+
+async def close_run(run):
+    "End a run now, closing out whichever of its files haven't been already. Runs that have already ended are left alone."
+    if run.status == 'DONE':
+        return
+    MODIFICATIONS.flush()
+    files = [file for file in run.all_files if not file.checksum or file.id in FILE_ACTIVITY]
+    for file in files:
+        FILE_ACTIVITY.discard(file.id)
+    await gather(*[end_file(file) for file in files])
+    await end_run(run)
+
+def next_quiet_deadline():
+    "When the next file or run could go quiet, or None if nothing is being watched."
+    deadlines = [d for d in (FILE_ACTIVITY.next_deadline(), RUN_ACTIVITY.next_deadline()) if d]
+    return min(deadlines) if deadlines else None
 
 
 async def end_run(run):
-    "Put run in closed status"
-    run.ended = datetime.now()
+    "Put run in closed status. Notifiers fire and run jobs are spawned only when the run wasn't already closed."
+    ending = run.status != 'DONE'
+    run.ended = run.ended or datetime.now()
     run.status = 'DONE'
     run.save()
     run.tag('finished')
+    RUN_ACTIVITY.discard(run.id)
+    for file in run.all_files:
+        HASHING.forget(file.id)
+    if not ending:
+        return
     log.info(f"Run {run.alt_name} ended, no file modifications in the past hour")
     for notifier in NOTIFIERS:
         log.info(f"Firing notifier {notifier.name}")
@@ -129,22 +329,44 @@ async def end_file(file):
     # except (subprocess.CalledProcessError, ValueError) as e:
     #     log.error(e)
     if file.path.exists():
-        async with aiofile.AIOFile(file.path, 'rb') as afile:
-            ha = hashlib.md5()
-            rdr = aiofile.Reader(afile, chunk_size=1024 * 1024)
-            async for chunk in rdr:
-                ha.update(chunk)
-            file.hash = ha.hexdigest()
-            file.save()
+        file.checksum = await HASHING.finish(file.id, file.path, file.hashed_bytes, file.hash_state, file.checksum_algorithm)
+        file.checksum_algorithm = HASHING.algorithm
+        file.size = file.path.stat().st_size
+        file.present = True
+        file.save()
         for job in JOBS.FILES:
             log.info(f"Scheduling job {type(job).__name__} on {file.path}")
             file.spawn(job)
     else:
-        TagJunction.delete().where(file==file).execute()
-        TTagJunction.delete().where(file==file).execute()
+        PATHS.discard_file(file.path)
+        HASHING.forget(file.id)
+        FILE_ACTIVITY.discard(file.id)
+        TagJunction.delete().where(TagJunction.file==file).execute()
+        TTagJunction.delete().where(TTagJunction.file==file).execute()
         file.delete_instance()
 
 
+async def get_or_register_run(run_path, exp, sam, name):
+    "Resolve a run directory to a Run id, registering and tagging the run if it's new."
+    run_id = PATHS.run_id(run_path) # an index hit saves a round-trip
+    if run_id is None:
+        run, new = Run.get_or_create(path=r(run_path), name=name)
+        run_id = PATHS.add_run(run_path, run.id)
+        if new:
+            triples = [("ONT", "experiment", exp), ("ONT", "sample", sam)]
+            await register_new_run(run)
+            try:
+                st, dev_id, fc_id, prot_id = name.split('_')
+                run.flowcell = fc_id
+                # run.tag(st)
+                triples += [("ONT", "device", dev_id), ("ONT", "protocol", prot_id)]
+            except ValueError:
+                pass
+            Run.ttag_many([run], triples)
+            run.save()
+    return run_id
+
+
 # async def send_run(run, dest):
 #     "Use RSYNC to send a run to a destination"
 #     pass
@@ -190,47 +412,53 @@ class PoreRefinerFSEventHandler(AIOEventHandler):
             if len(rel.parts) >= 3:
                 exp, sam, rel_run_path, *_ = rel.parts
                 run_path = self.path / Path(exp) / Path(sam) / Path(rel_run_path)
-                run, new = Run.get_or_create(path=r(run_path), name=rel_run_path)
-                if new:
-                    run.ttag("ONT", "experiment", exp)
-                    run.ttag("ONT", "sample", sam)
-                    await register_new_run(run)
-                    try:
-                        st, dev_id, fc_id, prot_id = rel_run_path.split('_')
-                        run.flowcell = fc_id
-                        # run.tag(st)
-                        run.ttag("ONT", "device", dev_id)
-                        run.ttag("ONT", "protocol", prot_id)
-                    except ValueError:
-                        pass
-                    run.save()
+                run = await get_or_register_run(run_path, exp, sam, rel_run_path)
             if len(rel.parts) >=4 and not event.is_directory: #there's a file
-                log.info(f"Registering new file {path} in {run.name}")
+                log.info(f"Registering new file {path} in {rel_run_path}")
                 f = File.create(run=run, path=path)
-                f.tag(rel.parent.name)
-                f.save()
+                PATHS.add_file(path, f.id)
+                FILE_ACTIVITY.touch(f.id)
+                RUN_ACTIVITY.touch(run)
+                File.tag_many([f], [rel.parent.name])
 
 
 
 
+    @staticmethod
+    def lookup_file(path):
+        "Resolve a path to a File id, consulting the database only on an index miss."
+        file_id = PATHS.file_id(path)
+        if file_id is None:
+            fi = File.get_or_none(File.path == r(path))
+            if fi:
+                file_id = PATHS.add_file(path, fi.id)
+        return file_id
+
     async def on_modified(self, event):
+        "Buffer the modification time; repeated events for one file coalesce until the next flush."
         if not event.is_directory: #we don't care about directory modifications
-            fi = File.get_or_none(File.path == r(event.src_path))
-            if not fi:
+            file_id = self.lookup_file(event.src_path)
+            if file_id is None:
                 await self.on_created(event)
-            else:
-                fi.last_modified = datetime.now()
-                fi.save()
+            elif MODIFICATIONS.touch(event.src_path, file_id):
+                MODIFICATIONS.flush()
 
     async def on_deleted(self, event): #TODO
         "Update database if files are deleted."
         log.info(f"Filesystem event: {event.src_path} deleted")
         if not event.is_directory:
-            fi = File.get_or_none(File.path == r(event.src_path))
-            if fi:
-                TagJunction.delete().where(TagJunction.file==fi).execute()
-                TTagJunction.delete().where(TTagJunction.file==fi).execute()
-                fi.delete_instance()
+            MODIFICATIONS.discard(event.src_path)
+            file_id = self.lookup_file(event.src_path)
+            if file_id is not None:
+                PATHS.discard_file(event.src_path)
+                HASHING.forget(file_id)
+                FILE_ACTIVITY.discard(file_id)
+                RUN_CACHE.bump(*runs_of_files([file_id]))
+                TagJunction.delete().where(TagJunction.file==file_id).execute()
+                TTagJunction.delete().where(TTagJunction.file==file_id).execute()
+                File.delete().where(File.id==file_id).execute()
+        else:
+            PATHS.discard_run(event.src_path)
 
 
 async def start_fs_watchdog(path, api=None, *a, **k):
@@ -244,30 +472,166 @@ async def start_fs_watchdog(path, api=None, *a, **k):
     # watcher.wait_closed()
     # log.info(f"Filesystem event watcher shutting down.")
 
-async def in_progress_run_update(*args, **kwargs):
-    "On server start, update all in-progress run files with last modified date."
+async def in_progress_run_update(path_index_size=100000, *args, **kwargs):
+    "On server start, update all in-progress run files with last modified date and warm the path index."
+    PATHS.max_files = path_index_size
     for run in Run.select().where(Run.status == 'RUNNING'):
         log.info(f"Checking in-progress run {run.name} for modifications")
+        PATHS.add_run(run.path, run.id)
         for file in run.all_files:
-            if file.path.exists():
-                file.last_modified = datetime.fromtimestamp(getmtime(a(file.path)))
+            try:
+                stat = file.path.stat()
+            except FileNotFoundError:
+                stat = None
+            if stat:
+                file.last_modified = datetime.fromtimestamp(stat.st_mtime)
+                file.size = stat.st_size
+                file.present = True
+                file.save()
+                PATHS.add_file(file.path, file.id)
+                FILE_ACTIVITY.touch(file.id, file.last_modified)
+                RUN_ACTIVITY.touch(run.id, file.last_modified)
+            elif file.present: # deleted while we weren't watching; kept, like reconcile_run_directories does, so its history and jobs stay
+                file.present = False
                 file.save()
-            else:
-                TagJunction.delete().where(TagJunction.file==file).execute()
-                TTagJunction.delete().where(TTagJunction.file==file).execute()
-                file.delete_instance()
             await asyncio.sleep(0)
 
 
+def scan_run_files(run_path):
+    "Walk a run directory, yielding (path, mtime, size) for every file not produced by porerefiner itself."
+    dirs = [run_path]
+    while dirs:
+        with scandir(dirs.pop()) as entries:
+            for entry in entries:
+                if '_porerefiner' in entry.name:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    yield Path(entry.path), datetime.fromtimestamp(stat.st_mtime), stat.st_size
+
+def scan_run_directories(path):
+    "Yield (experiment, sample, run directory) for every run directory under the nanopore output path."
+    for exp in scandir(path):
+        if exp.is_dir() and '_porerefiner' not in exp.name:
+            for sam in scandir(exp.path):
+                if sam.is_dir() and '_porerefiner' not in sam.name:
+                    for run_dir in scandir(sam.path):
+                        if run_dir.is_dir() and '_porerefiner' not in run_dir.name:
+                            yield exp.name, sam.name, Path(run_dir.path)
+
+def register_files(run_id, found):
+    "Bulk-insert newly found (path, mtime, size) triples as Files of a run, tagged with their parent directory's name."
+    found = [(path, mtime, size) for path, mtime, size in found if PATHS.file_id(path) is None] # the watchdog may have beaten us to some
+    if not found:
+        return 0
+    with File._meta.database.atomic():
+        File.insert_many([dict(run=run_id, path=path, last_modified=mtime, size=size) for path, mtime, size in found]).execute()
+        paths = [r(path) for path, *_ in found]
+        new_files = File.select(File.id, File.path).where(File.run == run_id, File.path << paths)
+        by_directory = {}
+        mtimes = {r(path): mtime for path, mtime, _ in found}
+        for fi in new_files:
+            PATHS.add_file(fi.path, fi.id)
+            FILE_ACTIVITY.touch(fi.id, mtimes[r(fi.path)])
+            RUN_ACTIVITY.touch(run_id, mtimes[r(fi.path)])
+            by_directory.setdefault(fi.path.parent.name, []).append(fi)
+        for name, files in by_directory.items():
+            File.tag_many(files, [name])
+    RUN_CACHE.bump(run_id)
+    return len(found)
+
+async def reconcile_run_directories(path, api=None, reconcile_chunk_size=500, *a, **k):
+    "On server start, register runs and files that appeared while the watchdog wasn't watching. Runs that have already ended are left alone, so nothing new in them gets hashed or starts jobs."
+    path = Path(path)
+    if not path.exists():
+        return 0
+    registered = 0
+    for exp, sam, run_path in scan_run_directories(path):
+        run_id = await get_or_register_run(run_path, exp, sam, run_path.name)
+        if not Run.select().where(Run.id == run_id, Run.status == 'RUNNING').exists():
+            continue
+        known = {fi.path for fi in File.select(File.path).where(File.run == run_id)}
+        chunk = []
+        for found in scan_run_files(run_path):
+            if found[0] in known:
+                known.discard(found[0])
+            else:
+                chunk.append(found)
+            if len(chunk) >= reconcile_chunk_size:
+                registered += register_files(run_id, chunk)
+                chunk = []
+                await asyncio.sleep(0)
+        registered += register_files(run_id, chunk)
+        missing = [r(path) for path in known]
+        for i in range(0, len(missing), reconcile_chunk_size): # deleted while we weren't watching
+            File.update(present=False).where(File.run == run_id, File.path << missing[i:i + reconcile_chunk_size]).execute()
+        if missing:
+            RUN_CACHE.bump(run_id)
+        await asyncio.sleep(0)
+    log.info(f"Registered {registered} files found in {path} since the last shutdown.")
+    return registered
+
 async def start_run_end_polling(run_polling_interval, *a, **k):
     "Coro to bring up the run termination polling"
     log.info(f"Starting run polling...")
+    last_sweep = [datetime.min]
     async def run_end_polling():
-        run_num = await poll_active_run()
-        log.info(f"{run_num} runs polled.")
-        await asyncio.sleep(run_polling_interval) #poll every ten minutes
-        return asyncio.ensure_future(run_end_polling())
-    return asyncio.ensure_future(run_end_polling())
+        sweep = datetime.now() - last_sweep[0] >= timedelta(seconds=run_polling_interval) # not on every early wake
+        if sweep:
+            last_sweep[0] = datetime.now()
+        run_num = await poll_active_run(sweep)
+        log.info(f"{run_num} runs ended.")
+        deadline = next_quiet_deadline()
+        if deadline: # don't wait out the whole polling interval if something goes quiet sooner
+            SCHEDULER.wake('runs', max(0.0, (deadline - datetime.now()).total_seconds()))
+        return run_num
+    SCHEDULER.add('runs', run_end_polling, run_polling_interval)
+    return SCHEDULER.start()
+
+async def follow_growing_files(grown):
+    "Advance the running checksums of growing files in append-only formats, persisting their size and, where the algorithm allows, digest state. Other files just have their size recorded; they're hashed once they go quiet."
+    if not grown:
+        return 0
+    stored = list(File.select(File.id, File.run, File.hashed_bytes, File.hash_state, File.checksum_algorithm)
+                      .where(File.id << list(grown)))
+    appending = [fi for fi in stored if appends_only(grown[fi.id])]
+    results = await gather(*[HASHING.follow(fi.id, grown[fi.id], fi.hashed_bytes, fi.hash_state, fi.checksum_algorithm)
+                             for fi in appending],
+                           return_exceptions=True)
+    followed, sized = [], []
+    for file_id, running in zip([fi.id for fi in appending], results):
+        if isinstance(running, Exception):
+            log.warning(f"Couldn't follow {grown[file_id]}: {running}")
+            HASHING.forget(file_id)
+        else: # hashing read up to EOF, so the offset is the file's size
+            followed.append(File(id=file_id, size=running.offset, hashed_bytes=running.offset, hash_state=running.state, checksum_algorithm=running.algorithm))
+    for fi in stored:
+        if not appends_only(grown[fi.id]):
+            try:
+                sized.append(File(id=fi.id, size=Path(grown[fi.id]).stat().st_size))
+            except OSError as e:
+                log.warning(f"Couldn't stat {grown[fi.id]}: {e}")
+    if followed or sized:
+        with File._meta.database.atomic():
+            if followed:
+                File.bulk_update(followed, fields=[File.size, File.hashed_bytes, File.hash_state, File.checksum_algorithm], batch_size=ModificationBuffer.chunk_size)
+            if sized:
+                File.bulk_update(sized, fields=[File.size], batch_size=ModificationBuffer.chunk_size)
+        RUN_CACHE.bump(*{fi.run_id for fi in stored})
+    return len(stored)
+
+async def start_modification_flushing(modification_flush_interval=5, modification_buffer_size=1000, *a, **k):
+    "Coro to bring up periodic write-behind of buffered file modifications"
+    log.info(f"Starting modification flushing...")
+    MODIFICATIONS.max_pending = modification_buffer_size
+    async def run_modification_flushing():
+        flushed = MODIFICATIONS.flush()
+        await follow_growing_files(MODIFICATIONS.take_grown())
+        return flushed
+    SCHEDULER.add('modifications', run_modification_flushing, modification_flush_interval, delay=modification_flush_interval)
+    return SCHEDULER.start()
 
 async def start_job_polling(job_polling_interval, *a, **k):
     log.info(f'Starting job polling...')
@@ -277,6 +641,7 @@ async def start_job_polling(job_polling_interval, *a, **k):
             Duty.select().where(Duty.status == 'RUNNING')
         )
         log.info(f'{po} jobs polled, {su} submitted, {co} collected.')
-        await asyncio.sleep(job_polling_interval) #poll every 30 minutes
-        return asyncio.ensure_future(run_job_polling())
-    return asyncio.ensure_future(run_job_polling())
+        log.debug(f'Job dispatch queues: {DISPATCHER.stats()}')
+        return po
+    SCHEDULER.add('jobs', run_job_polling, job_polling_interval)
+    return SCHEDULER.start()
@@ -4,6 +4,7 @@ from collections import namedtuple
 from dataclasses import dataclass
 
 from .submitters import Submitter
+from porerefiner.dispatch import DISPATCHER
 from porerefiner.models import Duty, File, Run, SampleSheet
 from porerefiner.cli_utils import render_dataclass, Email, Url, PathStr
 from pathlib import Path
@@ -37,6 +38,26 @@ async def poll_active_job(job):
         raise
     return 1
 
+def group_by_submitter(jobs):
+    "Batches of jobs that share a submitter, as (submitter, jobs) pairs."
+    by_submitter = {}
+    for job in jobs:
+        assert isinstance(job, Duty)
+        submitter = CONFIGURED_JOB_REGISTRY[job.job_class].submitter
+        by_submitter.setdefault(id(submitter), (submitter, []))[1].append(job) # dataclass submitters aren't hashable
+    return by_submitter.values()
+
+async def poll_active_jobs(jobs):
+    "Poll jobs in one batch per submitter, so a scheduler is asked about all of its jobs at once."
+    logg = log.getChild(f"poll")
+    async def poll(submitter, batch):
+        try:
+            return await submitter._poll_many(batch)
+        except Exception as e:
+            logg.error(f"error in {type(submitter).__name__} polling {len(batch)} jobs")
+            raise
+    return sum(await gather(*[poll(submitter, batch) for submitter, batch in group_by_submitter(jobs)]))
+
 async def submit_job(job):
     logg = log.getChild(f"submit")
     configured_job = CONFIGURED_JOB_REGISTRY[job.job_class]
@@ -61,11 +82,11 @@ async def poll_jobs(ready_jobs, running_jobs):
     # for job in Job.select().where(Job.status == 'READY'):
     #     jobs_submitted += await submit_job(job)
     #     jobs_polled += 1
-    jobs_submitted = sum(await gather(*[submit_job(job) for job in ready_jobs]))
+    jobs_submitted = await DISPATCHER.dispatch(ready_jobs)
     # for job in Job.select().where(Job.status == 'RUNNING'):
     #     jobs_collected += await poll_active_job(job)
     #     jobs_polled += 1
-    jobs_collected = sum(await gather(*[poll_active_job(job) for job in running_jobs]))
+    jobs_collected = await poll_active_jobs(list(running_jobs))
     return jobs_submitted + jobs_collected, jobs_submitted, jobs_collected
 
 
@@ -1,5 +1,6 @@
 from abc import ABCMeta, abstractmethod
 from typing import Union
+from asyncio import gather
 
 from tempfile import mkdtemp
 from pathlib import Path
@@ -17,6 +18,15 @@ REGISTRY = {} # available submitter classes
 
 log = logging.getLogger('porerefiner.submitter.registry')
 
+GENERATORS = {} # duty id -> generator of a job with a step in flight; rebuilt from the duty after a restart
+
+def next_command(g, result):
+    "Send a result into a job's generator and return the next command it yields, skipping empty ones."
+    cmd = g.send(result)
+    while not cmd:
+        cmd = g.send(None)
+    return cmd
+
 class _MetaRegistry(type):
 
     def __new__(meta, name, bases, class_dict):
@@ -36,6 +46,9 @@ class RegisteringABCMeta(ABCMeta, _MetaRegistry):
 
 class Submitter(metaclass=RegisteringABCMeta):
 
+    concurrency = None # most submissions in flight at once; None for the dispatcher's job_concurrency
+    max_batch = 1 # most duties handed to _submit_many at once
+
     def __repr__(self):
         return type(self).__name__
 
@@ -49,64 +62,76 @@ class Submitter(metaclass=RegisteringABCMeta):
         "Submitters should translate paths to execution environment"
         pass
 
-    async def _submit(self, job):
-        "Create datadir, delegate job setup, then call subclass method to submit job"
+    def _remotedir(self, job):
+        "The job's run directory, or its file's directory, as the execution environment sees it."
+        return self.reroot_path(job.run.path if job.run else job.file.path.parent)
+
+    def _generator(self, job):
+        "Start the job's generator over its datadir, rerooting paths. Returns the generator, datadir and remotedir."
         from porerefiner.jobs import FileJob, RunJob, CONFIGURED_JOB_REGISTRY
         assert isinstance(job, Duty)
         run = job.run
         file = job.file
         assert run or file
-        logg = log.getChild(type(self).__name__)
-        datadir = job.datadir = Path(mkdtemp())
-        job.save()
+        datadir = job.datadir
         configured_job = CONFIGURED_JOB_REGISTRY[job.job_class]
-
-        # if isinstance(configured_job, RunJob):
-        #     remotedir = job.remotedir = self.reroot_path(run.path)
-        #     cmd = configured_job.setup(run=run, datadir=datadir, remotedir=remotedir)
-        # elif isinstance(configured_job, FileJob):
-        #     remotedir = job.remotedir = self.reroot_path(file.path.parent)
-        #     cmd = configured_job.setup(file=file, run=file.run, datadir=datadir, remotedir=remotedir)
-        # if isinstance(cmd, tuple): #some jobs return a string plus execution hints
-        #     cmd, hints = cmd
-        # if not isinstance(cmd, str): #has to be a string
-        #     raise RuntimeError("job setup method needs to return a string, or a string and dictionary")
-        # cmd = " ".join(cmd.split()) # turn tabs and returns into spaces
-        # logg.getChild('cmd').debug(cmd)
-        # try:
-        #     job.job_id = await self.begin_job(cmd, datadir, remotedir, environment_hints=hints)
-        #     job.status = 'QUEUED'
-        # except Exception as e:
-        #     logg.error(e)
-        #     job.attempts += 1
-        #     if job.attempts > 3:
-        #         job.status = 'FAILED'
-        #         raise
         if isinstance(configured_job, RunJob):
             remotedir = job.remotedir = self.reroot_path(run.path)
             g = configured_job.run(run=run, datadir=datadir, remotedir=remotedir)
         elif isinstance(configured_job, FileJob):
             remotedir = job.remotedir = self.reroot_path(file.path.parent)
             g = configured_job.run(run=file.run, file=file, datadir=datadir, remotedir=remotedir)
+        return g, datadir, remotedir
+
+    def _prepare(self, job):
+        "Create datadir, then start the job's generator from its first step. Returns the generator, datadir and remotedir."
+        job.datadir = Path(mkdtemp())
+        job.step = 0
+        job.results = []
+        job.save()
+        return self._generator(job)
+
+    def _resume(self, job):
+        "The job's generator, waiting on the step in flight. After a restart it's rebuilt and fast-forwarded by sending in each finished step's recorded result. Replay runs the job's own code between yields again, so anything it does there besides building commands (writing files, sending messages) happens again too."
+        if job.id in GENERATORS:
+            return GENERATORS[job.id]
+        g, datadir, remotedir = self._generator(job)
+        if job.step:
+            next_command(g, None)
+            for result in (job.results or [])[:job.step - 1]:
+                next_command(g, result)
+        return g
+
+    async def _advance(self, job, g, result=None):
+        "Send the finished step's result into the job and begin its next step, or finish the job if it has none."
         try:
-            cmd = next(g)
-            while True: # execute job until completion
-                if cmd:
-                    hints = {}
-                    if isinstance(cmd, tuple): #some jobs return a string plus execution hints
-                        cmd, hints = cmd
-                    cmd = " ".join(cmd.split())
-                    job_id = await self.begin_job(cmd, datadir, remotedir, environment_hints=hints)
-                    while status := await self.poll_job(job_id):
-                        pass
-                    result = await self.closeout_job(job_id)
-                cmd = g.send(result) 
+            cmd = next_command(g, result if job.step else None)
         except StopIteration:
-            pass
+            GENERATORS.pop(job.id, None)
+            job.status = 'DONE'
+            return
+        hints = {}
+        if isinstance(cmd, tuple): #some jobs return a string plus execution hints
+            cmd, hints = cmd
+        cmd = " ".join(cmd.split())
+        job.job_id = await self.begin_job(cmd, job.datadir, job.remotedir, environment_hints=hints)
+        job.step += 1
+        job.status = 'RUNNING'
+        GENERATORS[job.id] = g
+
+    async def _submit(self, job):
+        "Create datadir, delegate job setup, then call subclass method to submit the job's first step. Later steps begin as polling finds each one finished."
+        g, datadir, remotedir = self._prepare(job)
+        try:
+            await self._advance(job, g)
         finally:
             job.save()
+        return 1
 
-
+    async def _submit_many(self, jobs):
+        "Submit jobs together. Returns each job's outcome, in order: None if it was submitted, or the exception that stopped it, so one bad job doesn't take the others down with it. Submitters that can batch submissions should override this."
+        outcomes = await gather(*[self._submit(job) for job in jobs], return_exceptions=True)
+        return [outcome if isinstance(outcome, BaseException) else None for outcome in outcomes]
 
     @abstractmethod
     async def begin_job(self, execution_string, datadir, remotedir, environment_hints={}) -> str:
@@ -114,24 +139,48 @@ class Submitter(metaclass=RegisteringABCMeta):
         pass
 
     async def _poll(self, job):
+        await self._poll_many([job])
+        return job.status == 'RUNNING'
+
+    async def _collect(self, job, status):
+        "Move a polled job along: close out a finished step, then begin the next one."
         logg = log.getChild(type(self).__name__)
         try:
-            job.status = status = await self.poll_job(job)
+            if status not in ('DONE', 'FAILED'): # still running
+                job.status = status
+                return
+            result = await self.closeout_job(job, job.datadir, self._remotedir(job))
+            g = self._resume(job) if status == 'DONE' else None # replayed from the results before this one
+            job.results = (job.results or []) + [result]
+            if status == 'FAILED':
+                GENERATORS.pop(job.id, None)
+                job.status = 'FAILED'
+                return
+            await self._advance(job, g, result)
         except Exception as e:
+            logg.error(f"{job.job_class} job {job.id} failed at step {job.step}: {e}")
+            GENERATORS.pop(job.id, None)
             job.status = 'FAILED'
-            raise
         finally:
             job.save()
-        return job.status == 'RUNNING'
 
+    async def _poll_many(self, jobs):
+        "Poll jobs together, moving each one whose step has finished on to its next. Returns how many were polled. If the status call itself fails the jobs are left as they were, to be polled again next cycle; FAILED is only for jobs the scheduler says have failed."
+        statuses = await self.poll_jobs(jobs)
+        await gather(*[self._collect(job, status) for job, status in zip(jobs, statuses)])
+        return len(jobs)
 
     @abstractmethod
     async def poll_job(self, job) -> str:
         pass
 
+    async def poll_jobs(self, jobs) -> list:
+        "Statuses of many jobs, in order. Submitters whose scheduler can report on every job at once should override this."
+        return await gather(*[self.poll_job(job) for job in jobs])
+
     def _close(self, job):
         logg = log.getChild(type(self).__name__)
-        return self.closeout_job(job, job.datadir, job.remotedir)
+        return self.closeout_job(job, job.datadir, self._remotedir(job))
 
     @abstractmethod
     async def closeout_job(self, job, datadir, remotedir) -> None:
@@ -1,13 +1,209 @@
 from dataclasses import dataclass
-from asyncssh import connect
 from pathlib import Path
 from typing import Union
 
 
-from porerefiner.jobs.submitters import Submitter, Url, Email, Path
+from porerefiner.jobs.submitters import Submitter, Url, Email, Path, GENERATORS, next_command
+from porerefiner.sshpool import SSH_POOL
 
 import asyncio
+import re
 import subprocess
+import time
+import xml.etree.ElementTree as ET
+
+def job_number(job_id):
+    "The scheduler's job number from what begin_job stored, e.g. 'Your job 12345 (\"STDIN\") has been submitted'."
+    match = re.search(r'\d+', job_id or '')
+    return match and match.group()
+
+def job_key(job_id):
+    "'12345' for a job, or '12345.6' for task 6 of an array job, as scheduler states and exit codes are keyed."
+    match = re.fullmatch(r'\d+\.\d+', job_id or '')
+    return match.group() if match else job_number(job_id)
+
+def expand_tasks(tasks):
+    "Task numbers in a task list like '1-7:2,9'."
+    numbers = []
+    for part in tasks.split(','):
+        match = re.fullmatch(r'(\d+)(?:-(\d+)(?::(\d+))?)?', part.strip())
+        if match:
+            first, last, step = match.groups()
+            numbers.extend(range(int(first), int(last or first) + 1, int(step or 1)))
+    return numbers
+
+def command_line(cmd):
+    "One shell line for a command a job yielded, with its execution hints set in its environment."
+    hints = {}
+    if isinstance(cmd, tuple): #some jobs return a string plus execution hints
+        cmd, hints = cmd
+    hints = " ".join([f"{name}={value}" for name, value in hints.items()])
+    return f"{hints} {' '.join((cmd or '').split())}".strip() or ':'
+
+
+class Scheduler:
+    "How to submit to, and read job states and exit codes from, one kind of batch scheduler"
+
+    status_command = 'qstat'
+    task_variable = None # environment variable holding an array task's number
+
+    def submit(self, queue, line) -> str:
+        "Command that submits one line to run as a job."
+        return f'''echo "{line}" | qsub -q {queue}'''
+
+    def submit_array(self, queue, tasks) -> str:
+        "Command that submits the job script on its stdin as an array of this many tasks."
+        raise NotImplementedError
+
+    def parse_states(self, output) -> dict:
+        "Map of job number, and of 'number.task' for array tasks, to scheduler state."
+        raise NotImplementedError
+
+    def failed(self, state) -> bool:
+        return False
+
+    def exit_codes_command(self, number, array=False) -> str:
+        raise NotImplementedError
+
+    def parse_exit_codes(self, output) -> dict:
+        "Map of job number, or 'number.task' for array tasks, to exit code."
+        raise NotImplementedError
+
+    def script(self, lines):
+        "Array job script running the line for each task."
+        cases = "".join(f"{task}) {line} ;;\n" for task, line in enumerate(lines, 1))
+        return f"#!/bin/sh\ncase ${self.task_variable} in\n{cases}esac\n"
+
+
+class Uge(Scheduler):
+    "Univa/Sun Grid Engine"
+
+    status_command = 'qstat -xml'
+    task_variable = 'SGE_TASK_ID'
+
+    def submit_array(self, queue, tasks):
+        return f"qsub -q {queue} -t 1-{tasks}"
+
+    def parse_states(self, output):
+        states = {}
+        def add(number, task, state):
+            if task is not None:
+                states[f"{number}.{task}"] = state
+            if number not in states or self.failed(state): # any of an array job's tasks in error counts
+                states[number] = state
+        if not output.lstrip().startswith('<'): # plain qstat: job-ID prior name user state ...
+            for line in output.splitlines():
+                columns = line.split()
+                if columns and columns[0].isdigit():
+                    add(columns[0], None, columns[4] if len(columns) > 4 else columns[-1])
+            return states
+        for job in ET.fromstring(output).iter('job_list'):
+            number, state, tasks = job.findtext('JB_job_number'), job.findtext('state') or '', job.findtext('tasks')
+            for task in expand_tasks(tasks) if tasks else [None]:
+                add(number, task, state)
+        return states
+
+    def failed(self, state):
+        return 'E' in state # UGE error states all have an E
+
+    def exit_codes_command(self, number, array=False):
+        return f"qacct -j {number}"
+
+    def parse_exit_codes(self, output):
+        codes = {}
+        for record in re.split(r'^=+$', output, flags=re.M):
+            fields = dict(line.split(None, 1) for line in record.splitlines() if len(line.split(None, 1)) == 2)
+            if fields.get('exit_status', '').strip().isdigit():
+                number, task = fields['jobnumber'].strip(), fields.get('taskid', '').strip()
+                codes[f"{number}.{task}" if task.isdigit() else number] = int(fields['exit_status'])
+        return codes
+
+
+class Slurm(Scheduler):
+
+    status_command = 'squeue -h -r -o "%i %t"'
+    task_variable = 'SLURM_ARRAY_TASK_ID'
+    failed_states = {'F', 'NF', 'OOM', 'TO', 'BF', 'DL'}
+
+    def submit(self, queue, line):
+        return f'''sbatch --parsable -p {queue} --wrap "{line}"'''
+
+    def submit_array(self, queue, tasks):
+        return f"sbatch --parsable -p {queue} --array=1-{tasks}"
+
+    def parse_states(self, output):
+        states = {}
+        for line in output.splitlines():
+            columns = line.split()
+            if len(columns) == 2 and columns[0].split('_')[0].isdigit():
+                number, _, task = columns[0].partition('_') # array tasks are 123_4
+                if task.isdigit():
+                    states[f"{number}.{task}"] = columns[1]
+                if number not in states or self.failed(columns[1]):
+                    states[number] = columns[1]
+        return states
+
+    def failed(self, state):
+        return state in self.failed_states
+
+    def exit_codes_command(self, number, array=False):
+        return f"sacct -n -P -X -j {number} -o JobID,ExitCode"
+
+    def parse_exit_codes(self, output):
+        codes = {}
+        for line in output.splitlines():
+            job, _, code = line.partition('|')
+            number, _, task = job.partition('_')
+            if number.isdigit() and code.split(':')[0].isdigit():
+                codes[f"{number}.{task}" if task.isdigit() else number] = int(code.split(':')[0])
+        return codes
+
+
+class Pbs(Scheduler):
+    "PBS Pro and OpenPBS"
+
+    status_command = 'qstat -t'
+    task_variable = 'PBS_ARRAY_INDEX'
+
+    def submit_array(self, queue, tasks):
+        return f"qsub -q {queue} -J 1-{tasks}"
+
+    def parse_states(self, output):
+        states = {}
+        for line in output.splitlines():
+            columns = line.split()
+            match = len(columns) > 4 and re.match(r'(\d+)(?:\[(\d*)\])?\.', columns[0]) # 123.server, 123[].server or 123[4].server
+            if match:
+                number, task = match.groups()
+                states.setdefault(number, columns[4])
+                if task:
+                    states[f"{number}.{task}"] = columns[4]
+        return states
+
+    def exit_codes_command(self, number, array=False):
+        return f"qstat -fx -t {number}[]" if array else f"qstat -fx {number}"
+
+    def parse_exit_codes(self, output):
+        codes = {}
+        key = None
+        for line in output.splitlines():
+            match = re.match(r'Job Id: (\d+)(?:\[(\d*)\])?\.', line)
+            if match:
+                number, task = match.groups()
+                key = f"{number}.{task}" if task else number
+            elif key and line.strip().startswith('Exit_status'):
+                codes[key] = int(line.split('=')[1])
+        return codes
+
+
+SCHEDULERS = {'uge': Uge(),
+              'sge': Uge(),
+              'slurm': Slurm(),
+              'pbs': Pbs()}
+
+def parse_job_states(output, scheduler='uge'):
+    "Map of job number to scheduler state, from the scheduler's status command."
+    return SCHEDULERS[scheduler].parse_states(output)
 
 @dataclass
 class HpcSubmitter(Submitter):
@@ -20,15 +216,35 @@ class HpcSubmitter(Submitter):
     scheduler: str = "uge"
     queue: str = "long.q"
     remote_root: str = "~"
+    port: int = 22
+    status_ttl: float = 5.0
+    max_array_tasks: int = 1000
+    concurrency: int = None
+
+    @property
+    def max_batch(self):
+        return self.max_array_tasks
+
+    def __post_init__(self):
+        if self.scheduler.lower() not in SCHEDULERS:
+            raise ValueError(f"Unknown scheduler {self.scheduler}, expected one of {', '.join(SCHEDULERS)}")
+        self.driver = SCHEDULERS[self.scheduler.lower()]
+        self._states = (float('-inf'), {}) # (monotonic time the fetch began, job key -> state)
+        self._fetching = None # (monotonic time begun, future) of a status call in flight
+        self._submitted = float('-inf') # monotonic time of this submitter's last submission
+        self._exit_codes = {} # job key -> exit code, until the job is closed out
 
-    async def send(self, cmd):
-        "Run a command over SSH and return its stdout as a stripped string."
-        async with connect(self.login_host,
-                        username=self.username,
-                        client_keys=[self.private_key_path],
-                        known_hosts=self.known_hosts_path) as conn:
-            result = await conn.run(cmd, check=True)
-            return str(result.stdout).strip()
+    async def send(self, cmd, input=None, check=True):
+        "Run a command over a pooled SSH connection and return its stdout as a stripped string."
+        result = await SSH_POOL.run(cmd,
+                                    self.login_host,
+                                    port=self.port,
+                                    username=self.username,
+                                    client_keys=[self.private_key_path],
+                                    known_hosts=self.known_hosts_path,
+                                    check=check,
+                                    input=input)
+        return str(result.stdout or '').strip()
 
     async def test_noop(self):
         subprocess.run(['rsync', '--version']).check_returncode()
@@ -38,16 +254,105 @@ class HpcSubmitter(Submitter):
     def reroot_path(self, path):
         return Path(self.remote_root, path)
 
+    async def submit(self, cmd, input=None):
+        "Send a submission command, noting when so that no status snapshot taken before it is trusted afterward."
+        try:
+            return await self.send(cmd, input=input)
+        finally:
+            self._submitted = time.monotonic()
+
     async def begin_job(self, command, datadir, remotedir, environment_hints={}):
-        hints = " ".join([f"{name}={value}" for name, value in environment_hints.items()])
-        return await self.send(f'''echo "{hints} {command}" | qsub -q {self.queue}''')
+        return await self.submit(self.driver.submit(self.queue, command_line((command, environment_hints))))
+
+    async def begin_array_job(self, commands):
+        "Submit commands as the tasks of one array job, returning its job number."
+        lines = [command_line(cmd) for cmd in commands]
+        if len(lines) == 1:
+            return job_number(await self.submit(self.driver.submit(self.queue, lines[0])))
+        return job_number(await self.submit(self.driver.submit_array(self.queue, len(lines)), input=self.driver.script(lines)))
+
+    async def _submit_many(self, jobs):
+        "Submit each job class's duties as one array job, whose tasks run the first step of each. Later steps are submitted on their own as each task finishes. Returns each job's outcome, as Submitter._submit_many does."
+        by_class = {}
+        for job in jobs:
+            by_class.setdefault(job.job_class, []).append(job)
+        outcomes = {} # duty id -> None, or the exception that stopped it
+        for batch in by_class.values():
+            if len(batch) == 1:
+                outcomes[batch[0].id], = await super()._submit_many(batch)
+                continue
+            tasks = []
+            for job in batch:
+                outcomes[job.id] = None
+                try:
+                    g, datadir, remotedir = self._prepare(job)
+                    tasks.append((job, g, next_command(g, None)))
+                except StopIteration: # nothing to run
+                    job.status = 'DONE'
+                    job.save()
+                except Exception as e: # a job that can't start fails alone; the rest of the array goes ahead
+                    outcomes[job.id] = e
+            if not tasks:
+                continue
+            try:
+                number = await self.begin_array_job([cmd for job, g, cmd in tasks])
+            except Exception as e:
+                outcomes.update({job.id: e for job, g, cmd in tasks})
+                continue
+            for task, (job, g, cmd) in enumerate(tasks, 1):
+                job.job_id = f"{number}.{task}" if len(tasks) > 1 else number
+                job.step = 1
+                job.status = 'RUNNING'
+                job.save()
+                GENERATORS[job.id] = g
+        return [outcomes[job.id] for job in jobs]
+
+    async def job_states(self):
+        "Every job the scheduler knows about, from one status call shared by everyone polling within the TTL. A snapshot begun before this submitter's latest submission isn't used, since it wouldn't list the new jobs."
+        fetched, states = self._states
+        if fetched > self._submitted and time.monotonic() - fetched < self.status_ttl:
+            return states
+        if self._fetching is None or self._fetching[0] <= self._submitted:
+            begun = time.monotonic()
+            async def fetch():
+                try:
+                    states = self.driver.parse_states(await self.send(self.driver.status_command))
+                    if begun > self._states[0]:
+                        self._states = (begun, states)
+                    return states
+                finally:
+                    if self._fetching and self._fetching[0] == begun:
+                        self._fetching = None
+            self._fetching = (begun, asyncio.ensure_future(fetch()))
+        return await asyncio.shield(self._fetching[1])
+
+    async def exit_codes(self, job_ids):
+        "Exit codes of finished jobs and array tasks, from one accounting call per job number."
+        numbers = {job_number(job_id): '.' in job_key(job_id) for job_id in job_ids if job_number(job_id)}
+        outputs = await asyncio.gather(*[self.send(self.driver.exit_codes_command(number, array), check=False) # accounting may lag or be switched off
+                                         for number, array in numbers.items()])
+        codes = {}
+        for output in outputs:
+            codes.update(self.driver.parse_exit_codes(output))
+        return codes
 
     async def poll_job(self, job):
-        "Return the job's scheduler status. qstat lists active jobs; absence => completed."
-        active = await self.send("qstat")
-        if job.job_id and job.job_id in active:
-            return 'RUNNING'
-        return 'DONE'
+        "Return the job's scheduler status. The scheduler lists active jobs; absence => completed."
+        return (await self.poll_jobs([job]))[0]
+
+    async def poll_jobs(self, jobs):
+        states = await self.job_states()
+        finished = [job for job in jobs if job_key(job.job_id) not in states]
+        self._exit_codes.update(await self.exit_codes([job.job_id for job in finished]) if finished else {})
+        statuses = []
+        for job in jobs:
+            state = states.get(job_key(job.job_id))
+            if state is not None:
+                statuses.append('FAILED' if self.driver.failed(state) else 'RUNNING')
+                continue
+            statuses.append('FAILED' if self._exit_codes.get(job_key(job.job_id)) else 'DONE')
+        return statuses
 
     async def closeout_job(self, job, datadir, remotedir):
-        pass
+        "The job's exit code, if the scheduler's accounting reported one."
+        return self._exit_codes.pop(job_key(job.job_id), None)
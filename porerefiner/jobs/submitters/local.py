@@ -1,4 +1,3 @@
-
 from dataclasses import dataclass
 from porerefiner.jobs.submitters import Submitter
 from asyncio import subprocess
@@ -9,6 +8,8 @@ processes = {}
 @dataclass
 class LocalSubmitter(Submitter):
 
+    concurrency: int = None
+
     async def test_noop(self):
         pass
 
@@ -17,14 +18,18 @@ class LocalSubmitter(Submitter):
 
     async def begin_job(self, command, datadir, remotedir, environment_hints={}):
         processes[datadir] = await subprocess.create_subprocess_shell(command)
+        return str(processes[datadir].pid)
 
     async def poll_job(self, job):
-        await processes[job.datadir].wait()
-        if processes[job.datadir].returncode:
+        process = processes.get(job.datadir)
+        if process is None: # started before a restart, so its exit status is lost
+            return 'FAILED'
+        if process.returncode is None:
+            return 'RUNNING'
+        if process.returncode:
             return 'FAILED'
         return 'DONE'
 
-    def closeout_job(self, job, datadir, remotedir):
-        del processes[datadir]
-
-
+    async def closeout_job(self, job, datadir, remotedir):
+        process = processes.pop(datadir, None)
+        return process and process.returncode
@@ -0,0 +1,124 @@
+"Follow MinKNOW's acquisition streams so runs start and end when the sequencer says so"
+
+import asyncio
+import logging
+
+from pathlib import Path
+
+from grpclib.client import Channel
+from grpclib.exceptions import GRPCError, StreamTerminatedError
+
+from porerefiner.models import Run
+from porerefiner.fsevents import get_or_register_run, close_run
+from porerefiner.rpc import local_time
+from porerefiner.protocols.minknow.rpc.manager_pb2 import ListDevicesRequest
+from porerefiner.protocols.minknow.rpc.manager_grpc import ManagerServiceStub
+from porerefiner.protocols.minknow.rpc.acquisition_pb2 import WatchCurrentAcquisitionRunRequest, AcquisitionState
+from porerefiner.protocols.minknow.rpc.acquisition_grpc import AcquisitionServiceStub
+
+log = logging.getLogger('porerefiner.minknow')
+
+DISCONNECTED = (GRPCError, StreamTerminatedError, ConnectionError, OSError)
+
+
+async def update_run_from_acquisition(info, path):
+    "Register the run an acquisition is writing to, and end it as soon as the acquisition completes."
+    run = Run.get_or_none(Run.run_id == info.run_id) if info.run_id else None
+    if not run and info.config_summary.reads_directory:
+        try:
+            rel = Path(info.config_summary.reads_directory).relative_to(path)
+        except ValueError:
+            log.warning(f"Acquisition {info.run_id} is writing to {info.config_summary.reads_directory}, outside of {path}")
+            return None
+        if len(rel.parts) < 3:
+            return None
+        exp, sam, name, *_ = rel.parts
+        run = Run.get_by_id(await get_or_register_run(Path(path) / exp / sam / name, exp, sam, name))
+    if not run:
+        return None
+    if run.run_id != info.run_id:
+        log.info(f"Run {run.alt_name} is MinKNOW acquisition {info.run_id}")
+        run.run_id = info.run_id
+        if info.HasField('start_time'):
+            run.started = local_time(info.start_time)
+        run.save()
+    if info.state == AcquisitionState.ACQUISITION_COMPLETED and run.status == 'RUNNING':
+        log.info(f"MinKNOW reports acquisition {info.run_id} complete, ending run {run.alt_name}")
+        if info.HasField('end_time'):
+            run.ended = local_time(info.end_time)
+        await close_run(run)
+    return run
+
+
+class MinknowListener:
+    "Watches the current acquisition of every active flowcell position on a MinKNOW manager"
+
+    def __init__(self, path, host, port, retry_interval=60):
+        self.path = Path(path)
+        self.host = host
+        self.port = port
+        self.retry_interval = retry_interval
+        self.positions = {} # device name -> task watching its acquisitions
+        self._task = None
+
+    async def list_positions(self):
+        channel = Channel(self.host, self.port)
+        try:
+            response = await ManagerServiceStub(channel).list_devices(ListDevicesRequest())
+            return {device.name: device.ports.insecure_grpc for device in response.active}
+        finally:
+            channel.close()
+
+    async def watch_position(self, name, port):
+        "Follow one position's acquisitions until MinKNOW drops the stream."
+        channel = Channel(self.host, port)
+        try:
+            async with AcquisitionServiceStub(channel).watch_current_acquisition_run.open() as stream:
+                await stream.send_message(WatchCurrentAcquisitionRunRequest(), end=True)
+                log.info(f"Following acquisitions on MinKNOW position {name}")
+                async for info in stream:
+                    try:
+                        await update_run_from_acquisition(info, self.path)
+                    except Exception:
+                        log.exception(f"Couldn't update run from acquisition {info.run_id}")
+        except DISCONNECTED as e:
+            log.warning(f"Lost MinKNOW position {name}: {e}")
+        finally:
+            channel.close()
+
+    async def run(self):
+        "Keep a watcher on every active position, picking up new positions as they appear."
+        while True:
+            try:
+                active = await self.list_positions()
+            except DISCONNECTED as e:
+                log.debug(f"MinKNOW manager at {self.host}:{self.port} not reachable: {e}")
+                active = {}
+            for name, port in active.items():
+                if name not in self.positions or self.positions[name].done():
+                    self.positions[name] = asyncio.ensure_future(self.watch_position(name, port))
+            await asyncio.sleep(self.retry_interval)
+
+    def start(self):
+        if not self._task or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self):
+        tasks = [task for task in [self._task, *self.positions.values()] if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.positions.clear()
+        self._task = None
+
+
+async def start_minknow_listener(path, api=None, *a, **k):
+    "Coro to bring up MinKNOW acquisition following, if a MinKNOW API address is configured"
+    if not api:
+        return None
+    host, _, port = str(api).rpartition(':')
+    log.info(f"Following MinKNOW acquisitions from {api}...")
+    listener = MinknowListener(path, host or 'localhost', int(port))
+    listener.start()
+    return listener
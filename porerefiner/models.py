@@ -1,12 +1,13 @@
 import peewee
 from peewee import Model, SqliteDatabase
 from peewee import CharField, BareField, Field, FloatField, TextField, AutoField
-from peewee import  IntegerField, ForeignKeyField, ManyToManyField, DateField
-from peewee import DeferredForeignKey, DateTimeField, Check, JOIN
+from peewee import  IntegerField, ForeignKeyField, ManyToManyField, DateField, BooleanField
+from peewee import DeferredForeignKey, DateTimeField, Check, JOIN, BlobField
 #from porerefiner.config import config
 
 import asyncio
 import datetime
+import json
 import logging
 import pathlib
 import pickle
@@ -15,6 +16,7 @@ import sys
 import tempfile
 
 from copy import copy, deepcopy
+from porerefiner.cache import RUN_CACHE
 from itertools import chain
 from types import SimpleNamespace
 
@@ -41,13 +43,22 @@ class PorerefinerModel(BaseModel):
                 ('DONE', 'Ended'),
                 ('FAILED', 'Ended with Failure')]
 
+    def save(self, *args, **kwargs):
+        result = super().save(*args, **kwargs)
+        RUN_CACHE.bump(*affected_run_ids(self))
+        return result
+
+    def delete_instance(self, *args, **kwargs):
+        RUN_CACHE.bump(*affected_run_ids(self))
+        return super().delete_instance(*args, **kwargs)
+
 
 
 
 class Tag(BaseModel):
     "A tag is an informal annotation"
 
-    name = CharField(null=False, constraints=[Check("name != '' ")])
+    name = CharField(null=False, unique=True, constraints=[Check("name != '' ")])
 
     def __str__(self):
         return self.name
@@ -61,7 +72,12 @@ class TripleTag(BaseModel):
 
     name = CharField(null=False, constraints=[Check("name != '' "),])
 
-    value = BareField(null=False)
+    value = BareField(null=False, index=True) # plain tag queries match triple tag values too
+
+    class Meta:
+        indexes = (
+            (('namespace', 'name', 'value'), True),
+        )
 
     def __str__(self):
         return f"{self.namespace}:{self.name}={self.value}"
@@ -86,6 +102,20 @@ class PathField(Field):
         return None
 
 
+class ResultField(TextField):
+    "What job steps' closeouts returned, stored as JSON; anything JSON can't hold is kept as its string."
+
+    def db_value(self, value):
+        if value is None:
+            return None
+        return json.dumps(value, default=str)
+
+    def python_value(self, value):
+        if value is None:
+            return None
+        return json.loads(value)
+
+
 def StatusField(*args, default=PorerefinerModel.statuses[0][0], **kwargs):
     return CharField(*args, choices=PorerefinerModel.statuses, default=default, **kwargs)
 
@@ -140,6 +170,34 @@ class TagCollection:
     def __getattr__(self, name: str):
         return SimpleNamespace(**self.__getitem__(name))
 
+JUNCTION_BATCH_SIZE = 400 # rows per INSERT, well under SQLite's limit on bound variables
+
+def store_tags(names):
+    "Tags by name, in order, inserting any that don't exist yet."
+    names = list(dict.fromkeys(str(name) for name in names))
+    if '' in names:
+        raise ValueError("Tags can't be empty.")
+    for batch in peewee.chunked(names, JUNCTION_BATCH_SIZE):
+        Tag.insert_many([dict(name=name) for name in batch]).on_conflict_ignore().execute()
+    tags = {ta.name: ta for ta in Tag.select().where(Tag.name << names)} if names else {}
+    return {name: tags[name] for name in names}
+
+def store_triple_tags(triples):
+    "Triple tags by (namespace, name, value), in order, inserting any that don't exist yet."
+    triples = list(dict.fromkeys(tuple(triple) for triple in triples))
+    for batch in peewee.chunked(triples, JUNCTION_BATCH_SIZE):
+        TripleTag.insert_many([dict(namespace=namespace, name=name, value=value) for namespace, name, value in batch]).on_conflict_ignore().execute()
+    key = peewee.Tuple(TripleTag.namespace, TripleTag.name, TripleTag.value)
+    tags = {(ta.namespace, ta.name, ta.value): ta for ta in TripleTag.select().where(key << triples)} if triples else {}
+    if len(tags) < len(triples):
+        raise ValueError(f"Triple tags need a namespace, name and value: {[triple for triple in triples if triple not in tags]}")
+    return {triple: tags[triple] for triple in triples}
+
+def insert_junctions(junction_cls, rows):
+    "Insert tag junction rows in batches, skipping any that already exist."
+    for batch in peewee.chunked(rows, JUNCTION_BATCH_SIZE):
+        junction_cls.insert_many(batch).on_conflict_ignore().execute()
+
 def taggable(cls):
     "Class decorator to insert the tag creation and deletion methods"
     def make_closures(clsname):
@@ -151,32 +209,56 @@ def taggable(cls):
             return TagCollection(self)
 
         def tag(self, tag):
-            ta, _ = Tag.get_or_create(name=tag)
-            _, _ = TagJunction.get_or_create(tag=ta, **{clsname:self})
-            return ta
+            return type(self).tag_many([self], [tag])[0]
 
         def untag(self, tag):
             ta = Tag.get_or_none(name=tag)
             if ta:
                 TagJunction.delete().where(getattr(TagJunction, clsname)==self, TagJunction.tag==ta).execute()
+                RUN_CACHE.bump(*affected_run_ids(self))
 
         def ttag(self, namespace, name, value):
-            ta, _ = TripleTag.get_or_create(namespace=namespace, name=name, value=value)
-            _, _ = TTagJunction.get_or_create(tag=ta, **{clsname:self})
-            return ta
+            return type(self).ttag_many([self], [(namespace, name, value)])[0]
 
         def unttag(self, namespace, name):
             ta = TripleTag.get_or_none(namespace=namespace, name=name)
             if ta:
                 TTagJunction.delete().where(getattr(TTagJunction, clsname)==self, TTagJunction.tag==ta).execute()
+                RUN_CACHE.bump(*affected_run_ids(self))
         
         @classmethod
-        def get_by_tags(self, *tags):
-            return self.select().join(TagJunction).join(Tag).where(Tag.name << tags) | self.select().join(TTagJunction).join(TripleTag).where(TripleTag.value << tags)
+        def get_by_tags(self, *tags, fields=()):
+            "Instances matching any of the tag queries; see porerefiner.tagquery."
+            from porerefiner.tagquery import matches
+            return self.select(*fields).where(matches(self, *tags))
 
-        return tags, tag, untag, ttag, unttag, get_by_tags
+        @classmethod
+        def tag_many(self, objects, names):
+            "Tag every one of the objects with every one of the names in one transaction, skipping tags they already have."
+            ids = [obj.id for obj in objects]
+            with self._meta.database.atomic():
+                tags = store_tags(names)
+                junctions = [{'tag': ta.id, clsname: obj_id} for ta in tags.values() for obj_id in ids]
+                insert_junctions(TagJunction, junctions)
+            if junctions:
+                RUN_CACHE.bump(*affected_runs(self, ids))
+            return list(tags.values())
 
-    cls.tags, cls.tag, cls.untag, cls.ttag, cls.unttag, cls.get_by_tags = make_closures(cls.__name__.lower())
+        @classmethod
+        def ttag_many(self, objects, triples):
+            "Triple-tag every one of the objects with every one of the (namespace, name, value) triples in one transaction."
+            ids = [obj.id for obj in objects]
+            with self._meta.database.atomic():
+                tags = store_triple_tags(triples)
+                junctions = [{'tag': ta.id, clsname: obj_id} for ta in tags.values() for obj_id in ids]
+                insert_junctions(TTagJunction, junctions)
+            if junctions:
+                RUN_CACHE.bump(*affected_runs(self, ids))
+            return list(tags.values())
+
+        return tags, tag, untag, ttag, unttag, get_by_tags, tag_many, ttag_many
+
+    cls.tags, cls.tag, cls.untag, cls.ttag, cls.unttag, cls.get_by_tags, cls.tag_many, cls.ttag_many = make_closures(cls.__name__.lower())
     return cls
 
 @taggable
@@ -233,8 +315,29 @@ class Run(PorerefinerModel):
     def get_unannotated_runs(cls):
         return cls.select().where(cls._sample_sheet.is_null(), cls.status=='RUNNING')
 
+    @classmethod
+    def get_quiet_runs(cls, since):
+        "(run id, latest modification) of RUNNING runs whose files, direct or through samples, are all older than `since`."
+        direct = (File.select(cls.id.alias('run_id'), peewee.fn.MAX(File.last_modified).alias('latest'))
+                      .join(cls, on=(File.run == cls.id))
+                      .where(cls.status == 'RUNNING')
+                      .group_by(cls.id))
+        by_sample = (File.select(cls.id.alias('run_id'), peewee.fn.MAX(File.last_modified).alias('latest'))
+                         .join(Sample, on=(File.sample == Sample.id))
+                         .join(cls, on=(cls._sample_sheet == Sample.samplesheet))
+                         .where(cls.status == 'RUNNING')
+                         .group_by(cls.id))
+        latest = (direct + by_sample).alias('latest_modifications') # UNION ALL
+        newest = peewee.fn.MAX(latest.c.latest)
+        return (File.select(latest.c.run_id, newest.python_value(File.last_modified.python_value))
+                      .from_(latest)
+                      .group_by(latest.c.run_id)
+                      .having(newest < since)
+                      .tuples())
+
 
     def spawn(self, job_config):
+        RUN_CACHE.bump(self.id)
         return Duty.create(status='READY', job_class=job_config.__class__.__name__, datadir=pathlib.Path(tempfile.mkdtemp()), run=self)
 
 
@@ -262,7 +365,12 @@ class Duty(PorerefinerModel):
     file = DeferredForeignKey('File', backref='_duties_with_this_file_as_primary', null=True)
     samplesheet = DeferredForeignKey('SampleSheet', null=True, backref='duties')
     attempts = IntegerField(default=0)
+    step = IntegerField(default=0) # commands of the job's generator begun so far
+    results = ResultField(null=True) # what each finished step's closeout returned, in order, to replay into the generator after a restart
 
+    @property
+    def last_result(self):
+        return self.results[-1] if self.results else None
 
     def __str__(self):
         return f"{self.id} ({self.job_class} for {self.purpose}) ({dict(self.statuses)[self.status]})"
@@ -335,43 +443,60 @@ class SampleSheet(PorerefinerModel):
                    .switch()
                    .where(Run.id.is_null()))
 
+    @classmethod
+    def delete_unused_sheets(cls):
+        "Delete the sheets no run uses, with their samples and tags, in a handful of statements."
+        sheet_ids = [ss.id for ss in cls.get_unused_sheets()]
+        if not sheet_ids:
+            return 0
+        sample_ids = Sample.select(Sample.id).where(Sample.samplesheet << sheet_ids)
+        with cls._meta.database.atomic():
+            for junction_cls in (TagJunction, TTagJunction):
+                junction_cls.delete().where((junction_cls.samplesheet << sheet_ids) | (junction_cls.sample << sample_ids)).execute()
+            File.update(sample=None).where(File.sample << sample_ids).execute()
+            Duty.update(samplesheet=None).where(Duty.samplesheet << sheet_ids).execute()
+            Sample.delete().where(Sample.samplesheet << sheet_ids).execute()
+            return cls.delete().where(cls.id << sheet_ids).execute()
+
     @classmethod
     def new_sheet_from_message(cls, sheet, run=None, log=logging.getLogger('porerefiner.models'), sample_accession_prefix=None):
-        for ss in cls.get_unused_sheets():
+        with cls._meta.database.atomic():
             # clear out any previously unassigned sample sheets
             # there should only ever be one unassigned sheet
-            for sam in ss.samples:
-                sam.delete_instance()
-            ss.delete_instance()
-        ss = cls.create(date=sheet.date.ToDatetime(),
-                        sequencing_kit=sheet.sequencing_kit,
-                        barcoding_kit=(list(sheet.barcode_kit) or [None])[0],
-                        library_id=sheet.library_id)
-        for tag in sheet.tags:
-            ss.tag(tag)
-        for ttag in sheet.trip_tags:
-            ss.ttag(ttag.namespace, ttag.name, ttag.value)
-        if not sample_accession_prefix:
-            sample_accession_prefix = "SAM"
+            cls.delete_unused_sheets()
+            ss = cls.create(date=sheet.date.ToDatetime(),
+                            sequencing_kit=sheet.sequencing_kit,
+                            barcoding_kit=(list(sheet.barcode_kit) or [None])[0],
+                            library_id=sheet.library_id)
+            cls.tag_many([ss], sheet.tags)
+            cls.ttag_many([ss], [(ttag.namespace, ttag.name, ttag.value) for ttag in sheet.trip_tags])
+            if not sample_accession_prefix:
+                sample_accession_prefix = "SAM"
+                if run:
+                    sample_accession_prefix = run.alt_name
+            rows = [dict(sample_id=sample.sample_id,
+                         accession=sample.accession or f"{sample_accession_prefix}_{num:06}",
+                         barcode_id=sample.barcode_id,
+                         organism=sample.organism,
+                         extraction_kit=sample.extraction_kit,
+                         comment=sample.comment,
+                         user=sample.user,
+                         samplesheet=ss.id) for num, sample in enumerate(sheet.samples)]
+            for batch in peewee.chunked(rows, JUNCTION_BATCH_SIZE // len(Sample._meta.fields)): # same bound on variables per INSERT
+                Sample.insert_many(batch).execute()
+            sample_ids = [sid for sid, in Sample.select(Sample.id).where(Sample.samplesheet == ss).order_by(Sample.id).tuples()]
+            sample_triples = [[(ttag.namespace, ttag.name, ttag.value) for ttag in sample.trip_tags] for sample in sheet.samples]
+            tags = store_triple_tags(triple for triples in sample_triples for triple in triples)
+            insert_junctions(TTagJunction, [{'tag': tags[triple].id, 'sample': sample_id}
+                                            for sample_id, triples in zip(sample_ids, sample_triples)
+                                            for triple in triples])
             if run:
-                sample_accession_prefix = run.alt_name
-        for num, sample in enumerate(sheet.samples):
-            s = Sample.create(sample_id=sample.sample_id,
-                          accession=sample.accession or f"{sample_accession_prefix}_{num:06}",
-                          barcode_id=sample.barcode_id,
-                          organism=sample.organism,
-                          extraction_kit=sample.extraction_kit,
-                          comment=sample.comment,
-                          user=sample.user,
-                          samplesheet=ss)
-            for ttag in sample.trip_tags:
-                s.ttag(ttag.namespace, ttag.name, ttag.value)
-        if run:
-            run.sample_sheet = ss
-            run.save()
+                run.sample_sheet = ss
+                run.save()
         return ss
     
     def spawn(self, job_config):
+        RUN_CACHE.bump(*affected_run_ids(self))
         return Duty.create(status='READY', job_class=job_config.__class__.__name__, datadir=pathlib.Path(tempfile.mkdtemp()), samplesheet=self)
 
 @taggable
@@ -409,10 +534,21 @@ class File(PorerefinerModel):
     sample = ForeignKeyField(Sample, backref='files', null=True)
     path = PathField(index=True, unique=False)
     checksum = CharField(index=True, null=True)
+    checksum_algorithm = CharField(null=True) # see porerefiner.checksums.ALGORITHMS; null means md5
+    hashed_bytes = IntegerField(default=0) # how far the running checksum of a growing file has read
+    hash_state = BlobField(null=True) # running checksum state, for algorithms that can export it
     last_modified = DateTimeField(default=datetime.datetime.now)
+    size = IntegerField(default=0) # as of the last event, closeout or verification; saves stat()ing on every request
+    present = BooleanField(default=True) # false once the file is known to be gone from disk
     exported = IntegerField(default=0)
     _duties = ManyToManyField(Duty, backref='files')
 
+    class Meta:
+        indexes = (
+            (('run', 'last_modified'), False), # cover the quiet-run sweep, see Run.get_quiet_runs
+            (('sample', 'last_modified'), False),
+        )
+
     @property
     def name(self):
         return self.path.name
@@ -420,6 +556,7 @@ class File(PorerefinerModel):
     def spawn(self, job_config):
         job = Duty.create(status='READY', job_class=job_config.__class__.__name__, datadir=pathlib.Path(tempfile.mkdtemp()), file=self)
         self._duties.add(job)
+        RUN_CACHE.bump(*affected_run_ids(self))
         return job
 
 
@@ -429,6 +566,38 @@ class File(PorerefinerModel):
         yield from self._duties
 
 
+def runs_of_files(file_ids):
+    "Ids of the runs that show these files, directly or through one of their samples."
+    direct = File.select(File.run.alias('run_id')).where(File.id << file_ids, File.run.is_null(False))
+    by_sample = (File.select(Run.id.alias('run_id'))
+                     .join(Sample, on=(File.sample == Sample.id))
+                     .join(Run, on=(Run._sample_sheet == Sample.samplesheet))
+                     .where(File.id << file_ids))
+    return {run_id for run_id, in (direct | by_sample).tuples()}
+
+def affected_runs(model, ids):
+    "Ids of the runs whose messages show any of these runs, sample sheets, samples or files."
+    if model is Run:
+        return list(ids)
+    if model is File:
+        return runs_of_files(ids)
+    if model is Sample:
+        sheet_ids = Sample.select(Sample.samplesheet).where(Sample.id << ids)
+    elif model is SampleSheet:
+        sheet_ids = ids
+    else:
+        return []
+    return [run_id for run_id, in Run.select(Run.id).where(Run._sample_sheet << sheet_ids).tuples()]
+
+def affected_run_ids(instance):
+    "Ids of the runs whose messages show this run, sample sheet, sample or file."
+    if isinstance(instance, File) and instance.sample_id is None:
+        return [instance.run_id] # saves a query for the files the watchdog registers
+    return affected_runs(type(instance), [instance.id])
+
+
+JUNCTION_OWNERS = ('run', 'qa', 'duty', 'samplesheet', 'sample', 'file')
+
 class TagJunction(BaseModel):
     tag = ForeignKeyField(Tag, backref='junctions')
     run = ForeignKeyField(Run, null=True, backref='tag_junctions')
@@ -438,6 +607,9 @@ class TagJunction(BaseModel):
     sample = ForeignKeyField(Sample, null=True, backref='tag_junctions')
     file = ForeignKeyField(File, null=True, backref='tag_junctions')
 
+    class Meta:
+        indexes = tuple((('tag', owner), True) for owner in JUNCTION_OWNERS) # cover tag queries; unique, so tagging can INSERT OR IGNORE
+
 
 class TTagJunction(BaseModel):
     tag = ForeignKeyField(TripleTag, backref='junctions')
@@ -448,7 +620,66 @@ class TTagJunction(BaseModel):
     sample = ForeignKeyField(Sample, null=True, backref='ttag_junctions')
     file = ForeignKeyField(File, null=True, backref='ttag_junctions')
 
+    class Meta:
+        indexes = tuple((('tag', owner), True) for owner in JUNCTION_OWNERS)
+
 JobFileJunction = File._duties.get_through_model()
 
 
 REGISTRY = [Tag, Run, Qa, Duty, SampleSheet, Sample, File, TagJunction, JobFileJunction, TripleTag, TTagJunction]
+
+
+def upgrade_tables(registry=REGISTRY):
+    "Create any missing tables, then add any columns and indexes that models have gained since their tables were created. Indexes come last, once duplicate tags are merged, since older databases hold rows the unique ones would reject."
+    from playhouse.migrate import SqliteMigrator, migrate
+    db = registry[0]._meta.database
+    for model in registry:
+        model._schema.create_table(safe=True)
+    migrator = SqliteMigrator(db)
+    operations = []
+    for model in registry:
+        table = model._meta.table_name
+        existing = {column.name for column in db.get_columns(table)}
+        operations += [migrator.add_column(table, field.column_name, field)
+                       for field in model._meta.sorted_fields if field.column_name not in existing]
+    # Adding a NOT NULL column rebuilds the table, and dropping the old one would trip the foreign keys of rows
+    # pointing at it. SQLite ignores this pragma inside a transaction, so it's switched off around it.
+    foreign_keys = db.pragma('foreign_keys')
+    db.pragma('foreign_keys', 0)
+    try:
+        with db.atomic():
+            migrate(*operations)
+            merge_duplicate_tags()
+            for model in registry:
+                unique = {index.name: index.unique for index in db.get_indexes(model._meta.table_name)}
+                for index in model._meta.fields_to_index(): # rebuild any index that has since become unique
+                    if index._name in unique and unique[index._name] != index._unique:
+                        db.execute_sql(f'DROP INDEX "{index._name}"')
+                model._schema.create_indexes(safe=True)
+    finally:
+        db.pragma('foreign_keys', foreign_keys)
+    return len(operations)
+
+def merge_duplicate_tags():
+    "Point junctions at one row per distinct tag and delete the others, so the unique tag indexes can be built on older databases."
+    merged = 0
+    for tag_cls, junction_cls, key in ((Tag, TagJunction, (Tag.name,)),
+                                       (TripleTag, TTagJunction, (TripleTag.namespace, TripleTag.name, TripleTag.value))):
+        duplicated = (tag_cls.select(peewee.fn.MIN(tag_cls.id), *key)
+                             .group_by(*key)
+                             .having(peewee.fn.COUNT(tag_cls.id) > 1)
+                             .tuples())
+        for keep, *values in list(duplicated):
+            dupes = [tag_id for tag_id, in tag_cls.select(tag_cls.id)
+                                                  .where(*[field == value for field, value in zip(key, values)], tag_cls.id != keep)
+                                                  .tuples()]
+            junction_cls.update(tag=keep).where(junction_cls.tag << dupes).execute()
+            tag_cls.delete().where(tag_cls.id << dupes).execute()
+            merged += len(dupes)
+    for junction_cls in (TagJunction, TTagJunction): # the same tag twice on one thing, from merging or from before junctions were unique
+        for owner in JUNCTION_OWNERS:
+            column = getattr(junction_cls, owner)
+            first = junction_cls.select(peewee.fn.MIN(junction_cls.id)).where(column.is_null(False)).group_by(junction_cls.tag, column)
+            merged += junction_cls.delete().where(column.is_null(False), junction_cls.id.not_in(first)).execute()
+    return merged
+
@@ -5,14 +5,13 @@
 import click
 
 import datetime
-import hashlib
 import json
 import logging
 import setproctitle
 import sys, os
 import yaml
 
-from asyncio import run, gather, wait
+from asyncio import run, gather, wait, sleep, ensure_future
 
 from porerefiner import models, samplesheets, jobs
 from porerefiner.models import Duty, Run, SampleSheet
@@ -21,7 +20,13 @@ import porerefiner.jobs.submitters as submitters
 from pathlib import Path
 
 from porerefiner.rpc import start_server
-from porerefiner.fsevents import start_fs_watchdog, start_run_end_polling, start_job_polling, in_progress_run_update
+from porerefiner.checksums import HASHING, checksum_file
+from porerefiner.scheduler import SCHEDULER
+from porerefiner.cache import RUN_CACHE
+from porerefiner.sshpool import SSH_POOL
+from porerefiner.dispatch import DISPATCHER
+from porerefiner.minknow import start_minknow_listener
+from porerefiner.fsevents import start_fs_watchdog, start_run_end_polling, start_job_polling, start_modification_flushing, in_progress_run_update, reconcile_run_directories, MODIFICATIONS
 
 from porerefiner.daemon import daemon
 
@@ -41,17 +46,34 @@ async def serve(config_file, db_path=None, db_pragmas=None, wdog_settings=None,
         server_settings=config['server']
         system_settings=config['porerefiner']
     models._db.init(db_path, db_pragmas)
-    [cls.create_table(safe=True) for cls in models.REGISTRY]
+    models.upgrade_tables() # creates the tables too, holding their indexes back until older rows are fixed up
+    HASHING.configure(**system_settings)
+    SCHEDULER.configure(**system_settings)
+    RUN_CACHE.configure(**system_settings)
+    SSH_POOL.configure(**system_settings)
+    DISPATCHER.configure(**system_settings)
+    minknow = ensure_future(start_minknow_listener(**wdog_settings)) # kept so its watchers can be stopped below
     try:
         results = await gather(
                             start_server(**server_settings),
                             start_fs_watchdog(**wdog_settings),
+                            minknow,
                             start_run_end_polling(**system_settings),
                             start_job_polling(**system_settings),
-                            in_progress_run_update()
+                            start_modification_flushing(**system_settings),
+                            in_progress_run_update(**system_settings),
+                            reconcile_run_directories(**wdog_settings)
                         )
     finally:
         log.warning("Shutting down...")
+        await SCHEDULER.stop()
+        if minknow.done() and not minknow.cancelled() and not minknow.exception() and minknow.result():
+            await minknow.result().stop()
+        else:
+            minknow.cancel()
+        MODIFICATIONS.flush()
+        HASHING.shutdown()
+        await SSH_POOL.close()
 
 # bit of complexity here to handle different defaults for privileged vs normal users
 
@@ -308,27 +330,27 @@ def _jobs(sample_sheet, data_file):
             run=ru
         )
 
-    with open(data_file, 'rb') as data:
-        hash = hashlib.md5()
-        hash.update(data.read())
-    md5 = hash.hexdigest()
+    algorithm = Config['porerefiner'].get('checksum_algorithm', HASHING.algorithm)
 
     # create a file and add it to the run
     fi = models.File.create(path=data_file,
                             run=ru,
-                            checksum=md5,
+                            checksum=checksum_file(data_file, algorithm),
+                            checksum_algorithm=algorithm,
                             )
 
     async def fileJob(job):
         j = fi.spawn(job)
         await jobs.submit_job(j)
         while j.status not in ('DONE', 'FAILED'):
+            await sleep(1)
             await jobs.poll_active_job(j)
 
     async def runJob(job):
         j = ru.spawn(job)
         await jobs.submit_job(j)
         while j.status not in ('DONE', 'FAILED'):
+            await sleep(1)
             await jobs.poll_active_job(j)
 
     async def task():
@@ -53,50 +53,50 @@ class DeviceServiceBase(abc.ABC):
             '/ont.rpc.device.DeviceService/get_device_info': grpclib.const.Handler(
                 self.get_device_info,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.device_pb2.GetDeviceInfoRequest,
-                minknow.rpc.device_pb2.GetDeviceInfoResponse,
+                device_pb2.GetDeviceInfoRequest,
+                device_pb2.GetDeviceInfoResponse,
             ),
             '/ont.rpc.device.DeviceService/get_device_state': grpclib.const.Handler(
                 self.get_device_state,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.device_pb2.GetDeviceStateRequest,
-                minknow.rpc.device_pb2.GetDeviceStateResponse,
+                device_pb2.GetDeviceStateRequest,
+                device_pb2.GetDeviceStateResponse,
             ),
             '/ont.rpc.device.DeviceService/stream_device_state': grpclib.const.Handler(
                 self.stream_device_state,
                 grpclib.const.Cardinality.UNARY_STREAM,
-                minknow.rpc.device_pb2.StreamDeviceStateRequest,
-                minknow.rpc.device_pb2.GetDeviceStateResponse,
+                device_pb2.StreamDeviceStateRequest,
+                device_pb2.GetDeviceStateResponse,
             ),
             '/ont.rpc.device.DeviceService/get_flow_cell_info': grpclib.const.Handler(
                 self.get_flow_cell_info,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.device_pb2.GetFlowCellInfoRequest,
-                minknow.rpc.device_pb2.GetFlowCellInfoResponse,
+                device_pb2.GetFlowCellInfoRequest,
+                device_pb2.GetFlowCellInfoResponse,
             ),
             '/ont.rpc.device.DeviceService/stream_flow_cell_info': grpclib.const.Handler(
                 self.stream_flow_cell_info,
                 grpclib.const.Cardinality.UNARY_STREAM,
-                minknow.rpc.device_pb2.StreamFlowCellInfoRequest,
-                minknow.rpc.device_pb2.GetFlowCellInfoResponse,
+                device_pb2.StreamFlowCellInfoRequest,
+                device_pb2.GetFlowCellInfoResponse,
             ),
             '/ont.rpc.device.DeviceService/set_user_specified_flow_cell_id': grpclib.const.Handler(
                 self.set_user_specified_flow_cell_id,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.device_pb2.SetUserSpecifiedFlowCellIdRequest,
-                minknow.rpc.device_pb2.SetUserSpecifiedFlowCellIdResponse,
+                device_pb2.SetUserSpecifiedFlowCellIdRequest,
+                device_pb2.SetUserSpecifiedFlowCellIdResponse,
             ),
             '/ont.rpc.device.DeviceService/set_user_specified_product_code': grpclib.const.Handler(
                 self.set_user_specified_product_code,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.device_pb2.SetUserSpecifiedProductCodeRequest,
-                minknow.rpc.device_pb2.SetUserSpecifiedProductCodeResponse,
+                device_pb2.SetUserSpecifiedProductCodeRequest,
+                device_pb2.SetUserSpecifiedProductCodeResponse,
             ),
             '/ont.rpc.device.DeviceService/get_channels_layout': grpclib.const.Handler(
                 self.get_channels_layout,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.device_pb2.GetChannelsLayoutRequest,
-                minknow.rpc.device_pb2.GetChannelsLayoutResponse,
+                device_pb2.GetChannelsLayoutRequest,
+                device_pb2.GetChannelsLayoutResponse,
             ),
         }
 
@@ -107,48 +107,48 @@ class DeviceServiceStub:
         self.get_device_info = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.device.DeviceService/get_device_info',
-            minknow.rpc.device_pb2.GetDeviceInfoRequest,
-            minknow.rpc.device_pb2.GetDeviceInfoResponse,
+            device_pb2.GetDeviceInfoRequest,
+            device_pb2.GetDeviceInfoResponse,
         )
         self.get_device_state = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.device.DeviceService/get_device_state',
-            minknow.rpc.device_pb2.GetDeviceStateRequest,
-            minknow.rpc.device_pb2.GetDeviceStateResponse,
+            device_pb2.GetDeviceStateRequest,
+            device_pb2.GetDeviceStateResponse,
         )
         self.stream_device_state = grpclib.client.UnaryStreamMethod(
             channel,
             '/ont.rpc.device.DeviceService/stream_device_state',
-            minknow.rpc.device_pb2.StreamDeviceStateRequest,
-            minknow.rpc.device_pb2.GetDeviceStateResponse,
+            device_pb2.StreamDeviceStateRequest,
+            device_pb2.GetDeviceStateResponse,
         )
         self.get_flow_cell_info = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.device.DeviceService/get_flow_cell_info',
-            minknow.rpc.device_pb2.GetFlowCellInfoRequest,
-            minknow.rpc.device_pb2.GetFlowCellInfoResponse,
+            device_pb2.GetFlowCellInfoRequest,
+            device_pb2.GetFlowCellInfoResponse,
         )
         self.stream_flow_cell_info = grpclib.client.UnaryStreamMethod(
             channel,
             '/ont.rpc.device.DeviceService/stream_flow_cell_info',
-            minknow.rpc.device_pb2.StreamFlowCellInfoRequest,
-            minknow.rpc.device_pb2.GetFlowCellInfoResponse,
+            device_pb2.StreamFlowCellInfoRequest,
+            device_pb2.GetFlowCellInfoResponse,
         )
         self.set_user_specified_flow_cell_id = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.device.DeviceService/set_user_specified_flow_cell_id',
-            minknow.rpc.device_pb2.SetUserSpecifiedFlowCellIdRequest,
-            minknow.rpc.device_pb2.SetUserSpecifiedFlowCellIdResponse,
+            device_pb2.SetUserSpecifiedFlowCellIdRequest,
+            device_pb2.SetUserSpecifiedFlowCellIdResponse,
         )
         self.set_user_specified_product_code = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.device.DeviceService/set_user_specified_product_code',
-            minknow.rpc.device_pb2.SetUserSpecifiedProductCodeRequest,
-            minknow.rpc.device_pb2.SetUserSpecifiedProductCodeResponse,
+            device_pb2.SetUserSpecifiedProductCodeRequest,
+            device_pb2.SetUserSpecifiedProductCodeResponse,
         )
         self.get_channels_layout = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.device.DeviceService/get_channels_layout',
-            minknow.rpc.device_pb2.GetChannelsLayoutRequest,
-            minknow.rpc.device_pb2.GetChannelsLayoutResponse,
+            device_pb2.GetChannelsLayoutRequest,
+            device_pb2.GetChannelsLayoutResponse,
         )
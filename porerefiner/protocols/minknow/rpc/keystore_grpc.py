@@ -41,32 +41,32 @@ class KeyStoreServiceBase(abc.ABC):
             '/ont.rpc.keystore.KeyStoreService/store': grpclib.const.Handler(
                 self.store,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.keystore_pb2.StoreRequest,
-                minknow.rpc.keystore_pb2.StoreResponse,
+                keystore_pb2.StoreRequest,
+                keystore_pb2.StoreResponse,
             ),
             '/ont.rpc.keystore.KeyStoreService/remove': grpclib.const.Handler(
                 self.remove,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.keystore_pb2.RemoveRequest,
-                minknow.rpc.keystore_pb2.RemoveResponse,
+                keystore_pb2.RemoveRequest,
+                keystore_pb2.RemoveResponse,
             ),
             '/ont.rpc.keystore.KeyStoreService/get_one': grpclib.const.Handler(
                 self.get_one,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.keystore_pb2.GetOneRequest,
-                minknow.rpc.keystore_pb2.GetOneResponse,
+                keystore_pb2.GetOneRequest,
+                keystore_pb2.GetOneResponse,
             ),
             '/ont.rpc.keystore.KeyStoreService/get': grpclib.const.Handler(
                 self.get,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.keystore_pb2.GetRequest,
-                minknow.rpc.keystore_pb2.GetResponse,
+                keystore_pb2.GetRequest,
+                keystore_pb2.GetResponse,
             ),
             '/ont.rpc.keystore.KeyStoreService/watch': grpclib.const.Handler(
                 self.watch,
                 grpclib.const.Cardinality.UNARY_STREAM,
-                minknow.rpc.keystore_pb2.WatchRequest,
-                minknow.rpc.keystore_pb2.WatchResponse,
+                keystore_pb2.WatchRequest,
+                keystore_pb2.WatchResponse,
             ),
         }
 
@@ -77,30 +77,30 @@ class KeyStoreServiceStub:
         self.store = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.keystore.KeyStoreService/store',
-            minknow.rpc.keystore_pb2.StoreRequest,
-            minknow.rpc.keystore_pb2.StoreResponse,
+            keystore_pb2.StoreRequest,
+            keystore_pb2.StoreResponse,
         )
         self.remove = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.keystore.KeyStoreService/remove',
-            minknow.rpc.keystore_pb2.RemoveRequest,
-            minknow.rpc.keystore_pb2.RemoveResponse,
+            keystore_pb2.RemoveRequest,
+            keystore_pb2.RemoveResponse,
         )
         self.get_one = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.keystore.KeyStoreService/get_one',
-            minknow.rpc.keystore_pb2.GetOneRequest,
-            minknow.rpc.keystore_pb2.GetOneResponse,
+            keystore_pb2.GetOneRequest,
+            keystore_pb2.GetOneResponse,
         )
         self.get = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.keystore.KeyStoreService/get',
-            minknow.rpc.keystore_pb2.GetRequest,
-            minknow.rpc.keystore_pb2.GetResponse,
+            keystore_pb2.GetRequest,
+            keystore_pb2.GetResponse,
         )
         self.watch = grpclib.client.UnaryStreamMethod(
             channel,
             '/ont.rpc.keystore.KeyStoreService/watch',
-            minknow.rpc.keystore_pb2.WatchRequest,
-            minknow.rpc.keystore_pb2.WatchResponse,
+            keystore_pb2.WatchRequest,
+            keystore_pb2.WatchResponse,
         )
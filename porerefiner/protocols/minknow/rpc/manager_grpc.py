@@ -28,14 +28,14 @@ class ManagerServiceBase(abc.ABC):
             '/ont.rpc.manager.ManagerService/list_devices': grpclib.const.Handler(
                 self.list_devices,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.manager_pb2.ListDevicesRequest,
-                minknow.rpc.manager_pb2.ListDevicesResponse,
+                manager_pb2.ListDevicesRequest,
+                manager_pb2.ListDevicesResponse,
             ),
             '/ont.rpc.manager.ManagerService/get_version_info': grpclib.const.Handler(
                 self.get_version_info,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.manager_pb2.GetVersionInfoRequest,
-                minknow.rpc.manager_pb2.GetVersionInfoResponse,
+                manager_pb2.GetVersionInfoRequest,
+                manager_pb2.GetVersionInfoResponse,
             ),
         }
 
@@ -46,12 +46,12 @@ class ManagerServiceStub:
         self.list_devices = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.manager.ManagerService/list_devices',
-            minknow.rpc.manager_pb2.ListDevicesRequest,
-            minknow.rpc.manager_pb2.ListDevicesResponse,
+            manager_pb2.ListDevicesRequest,
+            manager_pb2.ListDevicesResponse,
         )
         self.get_version_info = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.manager.ManagerService/get_version_info',
-            minknow.rpc.manager_pb2.GetVersionInfoRequest,
-            minknow.rpc.manager_pb2.GetVersionInfoResponse,
+            manager_pb2.GetVersionInfoRequest,
+            manager_pb2.GetVersionInfoResponse,
         )
@@ -88,98 +88,98 @@ class ProtocolServiceBase(abc.ABC):
             '/ont.rpc.protocol.ProtocolService/start_protocol': grpclib.const.Handler(
                 self.start_protocol,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.StartProtocolRequest,
-                minknow.rpc.protocol_pb2.StartProtocolResponse,
+                protocol_pb2.StartProtocolRequest,
+                protocol_pb2.StartProtocolResponse,
             ),
             '/ont.rpc.protocol.ProtocolService/stop_protocol': grpclib.const.Handler(
                 self.stop_protocol,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.StopProtocolRequest,
-                minknow.rpc.protocol_pb2.StopProtocolResponse,
+                protocol_pb2.StopProtocolRequest,
+                protocol_pb2.StopProtocolResponse,
             ),
             '/ont.rpc.protocol.ProtocolService/wait_for_finished': grpclib.const.Handler(
                 self.wait_for_finished,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.WaitForFinishedRequest,
-                minknow.rpc.protocol_pb2.ProtocolRunInfo,
+                protocol_pb2.WaitForFinishedRequest,
+                protocol_pb2.ProtocolRunInfo,
             ),
             '/ont.rpc.protocol.ProtocolService/get_run_info': grpclib.const.Handler(
                 self.get_run_info,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.GetRunInfoRequest,
-                minknow.rpc.protocol_pb2.ProtocolRunInfo,
+                protocol_pb2.GetRunInfoRequest,
+                protocol_pb2.ProtocolRunInfo,
             ),
             '/ont.rpc.protocol.ProtocolService/list_protocol_runs': grpclib.const.Handler(
                 self.list_protocol_runs,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.ListProtocolRunsRequest,
-                minknow.rpc.protocol_pb2.ListProtocolRunsResponse,
+                protocol_pb2.ListProtocolRunsRequest,
+                protocol_pb2.ListProtocolRunsResponse,
             ),
             '/ont.rpc.protocol.ProtocolService/get_current_protocol_run': grpclib.const.Handler(
                 self.get_current_protocol_run,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.GetCurrentProtocolRunRequest,
-                minknow.rpc.protocol_pb2.ProtocolRunInfo,
+                protocol_pb2.GetCurrentProtocolRunRequest,
+                protocol_pb2.ProtocolRunInfo,
             ),
             '/ont.rpc.protocol.ProtocolService/watch_current_protocol_run': grpclib.const.Handler(
                 self.watch_current_protocol_run,
                 grpclib.const.Cardinality.UNARY_STREAM,
-                minknow.rpc.protocol_pb2.WatchCurrentProtocolRunRequest,
-                minknow.rpc.protocol_pb2.ProtocolRunInfo,
+                protocol_pb2.WatchCurrentProtocolRunRequest,
+                protocol_pb2.ProtocolRunInfo,
             ),
             '/ont.rpc.protocol.ProtocolService/list_protocols': grpclib.const.Handler(
                 self.list_protocols,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.ListProtocolsRequest,
-                minknow.rpc.protocol_pb2.ListProtocolsResponse,
+                protocol_pb2.ListProtocolsRequest,
+                protocol_pb2.ListProtocolsResponse,
             ),
             '/ont.rpc.protocol.ProtocolService/get_context_info': grpclib.const.Handler(
                 self.get_context_info,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.GetContextInfoRequest,
-                minknow.rpc.protocol_pb2.GetContextInfoResponse,
+                protocol_pb2.GetContextInfoRequest,
+                protocol_pb2.GetContextInfoResponse,
             ),
             '/ont.rpc.protocol.ProtocolService/set_context_info': grpclib.const.Handler(
                 self.set_context_info,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.SetContextInfoRequest,
-                minknow.rpc.protocol_pb2.SetContextInfoResponse,
+                protocol_pb2.SetContextInfoRequest,
+                protocol_pb2.SetContextInfoResponse,
             ),
             '/ont.rpc.protocol.ProtocolService/get_sample_id': grpclib.const.Handler(
                 self.get_sample_id,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.GetSampleIdRequest,
-                minknow.rpc.protocol_pb2.GetSampleIdResponse,
+                protocol_pb2.GetSampleIdRequest,
+                protocol_pb2.GetSampleIdResponse,
             ),
             '/ont.rpc.protocol.ProtocolService/set_sample_id': grpclib.const.Handler(
                 self.set_sample_id,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.SetSampleIdRequest,
-                minknow.rpc.protocol_pb2.SetSampleIdResponse,
+                protocol_pb2.SetSampleIdRequest,
+                protocol_pb2.SetSampleIdResponse,
             ),
             '/ont.rpc.protocol.ProtocolService/get_protocol_purpose': grpclib.const.Handler(
                 self.get_protocol_purpose,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.GetProtocolPurposeRequest,
-                minknow.rpc.protocol_pb2.GetProtocolPurposeResponse,
+                protocol_pb2.GetProtocolPurposeRequest,
+                protocol_pb2.GetProtocolPurposeResponse,
             ),
             '/ont.rpc.protocol.ProtocolService/set_protocol_purpose': grpclib.const.Handler(
                 self.set_protocol_purpose,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.SetProtocolPurposeRequest,
-                minknow.rpc.protocol_pb2.SetProtocolPurposeResponse,
+                protocol_pb2.SetProtocolPurposeRequest,
+                protocol_pb2.SetProtocolPurposeResponse,
             ),
             '/ont.rpc.protocol.ProtocolService/add_epi2me_workflow': grpclib.const.Handler(
                 self.add_epi2me_workflow,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.AddEpi2meWorkflowRequest,
-                minknow.rpc.protocol_pb2.AddEpi2meWorkflowResponse,
+                protocol_pb2.AddEpi2meWorkflowRequest,
+                protocol_pb2.AddEpi2meWorkflowResponse,
             ),
             '/ont.rpc.protocol.ProtocolService/list_protocol_group_ids': grpclib.const.Handler(
                 self.list_protocol_group_ids,
                 grpclib.const.Cardinality.UNARY_UNARY,
-                minknow.rpc.protocol_pb2.ListProtocolGroupIdsRequest,
-                minknow.rpc.protocol_pb2.ListProtocolGroupIdsResponse,
+                protocol_pb2.ListProtocolGroupIdsRequest,
+                protocol_pb2.ListProtocolGroupIdsResponse,
             ),
         }
 
@@ -190,96 +190,96 @@ class ProtocolServiceStub:
         self.start_protocol = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/start_protocol',
-            minknow.rpc.protocol_pb2.StartProtocolRequest,
-            minknow.rpc.protocol_pb2.StartProtocolResponse,
+            protocol_pb2.StartProtocolRequest,
+            protocol_pb2.StartProtocolResponse,
         )
         self.stop_protocol = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/stop_protocol',
-            minknow.rpc.protocol_pb2.StopProtocolRequest,
-            minknow.rpc.protocol_pb2.StopProtocolResponse,
+            protocol_pb2.StopProtocolRequest,
+            protocol_pb2.StopProtocolResponse,
         )
         self.wait_for_finished = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/wait_for_finished',
-            minknow.rpc.protocol_pb2.WaitForFinishedRequest,
-            minknow.rpc.protocol_pb2.ProtocolRunInfo,
+            protocol_pb2.WaitForFinishedRequest,
+            protocol_pb2.ProtocolRunInfo,
         )
         self.get_run_info = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/get_run_info',
-            minknow.rpc.protocol_pb2.GetRunInfoRequest,
-            minknow.rpc.protocol_pb2.ProtocolRunInfo,
+            protocol_pb2.GetRunInfoRequest,
+            protocol_pb2.ProtocolRunInfo,
         )
         self.list_protocol_runs = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/list_protocol_runs',
-            minknow.rpc.protocol_pb2.ListProtocolRunsRequest,
-            minknow.rpc.protocol_pb2.ListProtocolRunsResponse,
+            protocol_pb2.ListProtocolRunsRequest,
+            protocol_pb2.ListProtocolRunsResponse,
         )
         self.get_current_protocol_run = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/get_current_protocol_run',
-            minknow.rpc.protocol_pb2.GetCurrentProtocolRunRequest,
-            minknow.rpc.protocol_pb2.ProtocolRunInfo,
+            protocol_pb2.GetCurrentProtocolRunRequest,
+            protocol_pb2.ProtocolRunInfo,
         )
         self.watch_current_protocol_run = grpclib.client.UnaryStreamMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/watch_current_protocol_run',
-            minknow.rpc.protocol_pb2.WatchCurrentProtocolRunRequest,
-            minknow.rpc.protocol_pb2.ProtocolRunInfo,
+            protocol_pb2.WatchCurrentProtocolRunRequest,
+            protocol_pb2.ProtocolRunInfo,
         )
         self.list_protocols = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/list_protocols',
-            minknow.rpc.protocol_pb2.ListProtocolsRequest,
-            minknow.rpc.protocol_pb2.ListProtocolsResponse,
+            protocol_pb2.ListProtocolsRequest,
+            protocol_pb2.ListProtocolsResponse,
         )
         self.get_context_info = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/get_context_info',
-            minknow.rpc.protocol_pb2.GetContextInfoRequest,
-            minknow.rpc.protocol_pb2.GetContextInfoResponse,
+            protocol_pb2.GetContextInfoRequest,
+            protocol_pb2.GetContextInfoResponse,
         )
         self.set_context_info = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/set_context_info',
-            minknow.rpc.protocol_pb2.SetContextInfoRequest,
-            minknow.rpc.protocol_pb2.SetContextInfoResponse,
+            protocol_pb2.SetContextInfoRequest,
+            protocol_pb2.SetContextInfoResponse,
         )
         self.get_sample_id = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/get_sample_id',
-            minknow.rpc.protocol_pb2.GetSampleIdRequest,
-            minknow.rpc.protocol_pb2.GetSampleIdResponse,
+            protocol_pb2.GetSampleIdRequest,
+            protocol_pb2.GetSampleIdResponse,
         )
         self.set_sample_id = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/set_sample_id',
-            minknow.rpc.protocol_pb2.SetSampleIdRequest,
-            minknow.rpc.protocol_pb2.SetSampleIdResponse,
+            protocol_pb2.SetSampleIdRequest,
+            protocol_pb2.SetSampleIdResponse,
         )
         self.get_protocol_purpose = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/get_protocol_purpose',
-            minknow.rpc.protocol_pb2.GetProtocolPurposeRequest,
-            minknow.rpc.protocol_pb2.GetProtocolPurposeResponse,
+            protocol_pb2.GetProtocolPurposeRequest,
+            protocol_pb2.GetProtocolPurposeResponse,
         )
         self.set_protocol_purpose = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/set_protocol_purpose',
-            minknow.rpc.protocol_pb2.SetProtocolPurposeRequest,
-            minknow.rpc.protocol_pb2.SetProtocolPurposeResponse,
+            protocol_pb2.SetProtocolPurposeRequest,
+            protocol_pb2.SetProtocolPurposeResponse,
         )
         self.add_epi2me_workflow = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/add_epi2me_workflow',
-            minknow.rpc.protocol_pb2.AddEpi2meWorkflowRequest,
-            minknow.rpc.protocol_pb2.AddEpi2meWorkflowResponse,
+            protocol_pb2.AddEpi2meWorkflowRequest,
+            protocol_pb2.AddEpi2meWorkflowResponse,
         )
         self.list_protocol_group_ids = grpclib.client.UnaryUnaryMethod(
             channel,
             '/ont.rpc.protocol.ProtocolService/list_protocol_group_ids',
-            minknow.rpc.protocol_pb2.ListProtocolGroupIdsRequest,
-            minknow.rpc.protocol_pb2.ListProtocolGroupIdsResponse,
+            protocol_pb2.ListProtocolGroupIdsRequest,
+            protocol_pb2.ListProtocolGroupIdsResponse,
         )
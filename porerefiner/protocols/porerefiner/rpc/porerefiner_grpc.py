@@ -20,6 +20,10 @@ class PoreRefinerBase(abc.ABC):
     async def GetRuns(self, stream: 'grpclib.server.Stream[porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.RunListRequest, porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.RunListResponse]') -> None:
         pass
 
+    @abc.abstractmethod
+    async def StreamRuns(self, stream: 'grpclib.server.Stream[porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.RunStreamRequest, porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.Run]') -> None:
+        pass
+
     @abc.abstractmethod
     async def GetRunInfo(self, stream: 'grpclib.server.Stream[porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.RunRequest, porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.RunResponse]') -> None:
         pass
@@ -36,6 +40,10 @@ class PoreRefinerBase(abc.ABC):
     async def Tag(self, stream: 'grpclib.server.Stream[porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.TagRequest, porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.GenericResponse]') -> None:
         pass
 
+    @abc.abstractmethod
+    async def Trigger(self, stream: 'grpclib.server.Stream[porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.TriggerRequest, porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.TriggerResponse]') -> None:
+        pass
+
     def __mapping__(self) -> typing.Dict[str, grpclib.const.Handler]:
         return {
             '/porerefiner.rpc.PoreRefiner/GetRuns': grpclib.const.Handler(
@@ -44,6 +52,12 @@ class PoreRefinerBase(abc.ABC):
                 porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.RunListRequest,
                 porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.RunListResponse,
             ),
+            '/porerefiner.rpc.PoreRefiner/StreamRuns': grpclib.const.Handler(
+                self.StreamRuns,
+                grpclib.const.Cardinality.UNARY_STREAM,
+                porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.RunStreamRequest,
+                porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.Run,
+            ),
             '/porerefiner.rpc.PoreRefiner/GetRunInfo': grpclib.const.Handler(
                 self.GetRunInfo,
                 grpclib.const.Cardinality.UNARY_UNARY,
@@ -68,6 +82,12 @@ class PoreRefinerBase(abc.ABC):
                 porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.TagRequest,
                 porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.GenericResponse,
             ),
+            '/porerefiner.rpc.PoreRefiner/Trigger': grpclib.const.Handler(
+                self.Trigger,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.TriggerRequest,
+                porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.TriggerResponse,
+            ),
         }
 
 
@@ -80,6 +100,12 @@ class PoreRefinerStub:
             porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.RunListRequest,
             porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.RunListResponse,
         )
+        self.StreamRuns = grpclib.client.UnaryStreamMethod(
+            channel,
+            '/porerefiner.rpc.PoreRefiner/StreamRuns',
+            porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.RunStreamRequest,
+            porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.Run,
+        )
         self.GetRunInfo = grpclib.client.UnaryUnaryMethod(
             channel,
             '/porerefiner.rpc.PoreRefiner/GetRunInfo',
@@ -104,3 +130,9 @@ class PoreRefinerStub:
             porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.TagRequest,
             porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.GenericResponse,
         )
+        self.Trigger = grpclib.client.UnaryUnaryMethod(
+            channel,
+            '/porerefiner.rpc.PoreRefiner/Trigger',
+            porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.TriggerRequest,
+            porerefiner.protocols.porerefiner.rpc.porerefiner_pb2.TriggerResponse,
+        )
@@ -18,51 +18,59 @@ from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb
 from google.protobuf.timestamp_pb2 import *
 from google.protobuf.duration_pb2 import *
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7porerefiner/protocols/porerefiner/rpc/porerefiner.proto\x12\x0fporerefiner.rpc\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/duration.proto\";\n\tTripleTag\x12\x11\n\tnamespace\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\"\xd2\x07\n\x03Run\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rmnemonic_name\x18\x03 \x01(\t\x12\x12\n\nlibrary_id\x18\x04 \x01(\t\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x0c\n\x04path\x18\x06 \x01(\t\x12\x15\n\rflowcell_type\x18\x07 \x01(\t\x12\x13\n\x0b\x66lowcell_id\x18\x08 \x01(\t\x12\x19\n\x11\x62\x61secalling_model\x18\t \x01(\t\x12\x16\n\x0esequencing_kit\x18\n \x01(\t\x12+\n\x07started\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12*\n\x07\x65lapsed\x18\x0c \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x13\n\x0b\x62\x61rcode_kit\x18\r \x03(\t\x12(\n\x05\x66iles\x18\x0f \x03(\x0b\x32\x19.porerefiner.rpc.Run.File\x12,\n\x07samples\x18\x14 \x03(\x0b\x32\x1b.porerefiner.rpc.Run.Sample\x12\x0c\n\x04tags\x18\x1e \x03(\t\x12-\n\ttrip_tags\x18# \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\x12&\n\x04jobs\x18( \x03(\x0b\x32\x18.porerefiner.rpc.Run.Job\x1a\x9b\x01\n\x04\x46ile\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x0f\n\x07spot_id\x18\x05 \x01(\t\x12\x0c\n\x04size\x18\x08 \x01(\x04\x12\r\n\x05ready\x18\n \x01(\x08\x12\x0c\n\x04hash\x18\x0c \x01(\t\x12\x0c\n\x04tags\x18\x1e \x03(\t\x12-\n\ttrip_tags\x18# \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\x1a\x8e\x02\n\x06Sample\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\taccession\x18\x03 \x01(\t\x12\x12\n\nbarcode_id\x18\x04 \x01(\t\x12\x13\n\x0b\x62\x61rcode_seq\x18\x05 \x01(\t\x12\x10\n\x08organism\x18\x06 \x01(\t\x12\x16\n\x0e\x65xtraction_kit\x18\x07 \x01(\t\x12\x0f\n\x07\x63omment\x18\x08 \x01(\t\x12\x0c\n\x04user\x18\t \x01(\t\x12(\n\x05\x66iles\x18\x14 \x03(\x0b\x32\x19.porerefiner.rpc.Run.File\x12\x0c\n\x04tags\x18\x1e \x03(\t\x12-\n\ttrip_tags\x18( \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\x1a/\n\x03Job\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\"E\n\x05\x45rror\x12\x0e\n\x04\x63ode\x18\x01 \x01(\x05H\x00\x12\x0e\n\x04type\x18\x02 \x01(\tH\x00\x12\x13\n\x0b\x65rr_message\x18\x03 \x01(\tB\x07\n\x05\x65rror\"d\n\x0bRunResponse\x12#\n\x03run\x18\x01 \x01(\x0b\x32\x14.porerefiner.rpc.RunH\x00\x12\'\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x16.porerefiner.rpc.ErrorH\x00\x42\x07\n\x05reply\"+\n\x0eRunListRequest\x12\x0b\n\x03\x61ll\x18\x01 \x01(\x08\x12\x0c\n\x04tags\x18\x14 \x03(\t\"-\n\x07RunList\x12\"\n\x04runs\x18\x01 \x03(\x0b\x32\x14.porerefiner.rpc.Run\"m\n\x0fRunListResponse\x12(\n\x04runs\x18\x01 \x01(\x0b\x32\x18.porerefiner.rpc.RunListH\x00\x12\'\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x16.porerefiner.rpc.ErrorH\x00\x42\x07\n\x05reply\"2\n\nRunRequest\x12\x0c\n\x02id\x18\x01 \x01(\rH\x00\x12\x0e\n\x04name\x18\x02 \x01(\tH\x00\x42\x06\n\x04term\"E\n\x0fRunRsyncRequest\x12\x0c\n\x02id\x18\x01 \x01(\rH\x00\x12\x0e\n\x04name\x18\x02 \x01(\tH\x00\x12\x0c\n\x04\x64\x65st\x18\x03 \x01(\tB\x06\n\x04term\"9\n\x10RunRsyncResponse\x12%\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x16.porerefiner.rpc.Error\"8\n\x0fGenericResponse\x12%\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x16.porerefiner.rpc.Error\"H\n\nTagRequest\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04tags\x18\x02 \x03(\t\x12\r\n\x05untag\x18\x03 \x01(\x08\x12\x11\n\tnamespace\x18\x04 \x01(\t\"M\n\x10TripleTagRequest\x12\n\n\x02id\x18\x01 \x01(\r\x12-\n\ttrip_tags\x18\x02 \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\"\xc1\x03\n\x0bSampleSheet\x12\x17\n\x0fporerefiner_ver\x18\x01 \x01(\t\x12\x12\n\nlibrary_id\x18\x02 \x01(\t\x12\x16\n\x0esequencing_kit\x18\x03 \x01(\t\x12(\n\x04\x64\x61te\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x13\n\x0b\x62\x61rcode_kit\x18\x05 \x03(\t\x12\x34\n\x07samples\x18\n \x03(\x0b\x32#.porerefiner.rpc.SampleSheet.Sample\x12\x0c\n\x04tags\x18\x1e \x03(\t\x12-\n\ttrip_tags\x18# \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\x1a\xba\x01\n\x06Sample\x12\x11\n\tsample_id\x18\x01 \x01(\t\x12\x11\n\taccession\x18\x02 \x01(\t\x12\x12\n\nbarcode_id\x18\x03 \x01(\t\x12\x10\n\x08organism\x18\x04 \x01(\t\x12\x16\n\x0e\x65xtraction_kit\x18\x05 \x01(\t\x12\x0f\n\x07\x63omment\x18\x06 \x01(\t\x12\x0c\n\x04user\x18\x07 \x01(\t\x12-\n\ttrip_tags\x18\x14 \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\"e\n\x10RunAttachRequest\x12\x0c\n\x02id\x18\x01 \x01(\rH\x00\x12\x0e\n\x04name\x18\x02 \x01(\tH\x00\x12+\n\x05sheet\x18\x05 \x01(\x0b\x32\x1c.porerefiner.rpc.SampleSheetB\x06\n\x04term2\x96\x03\n\x0bPoreRefiner\x12L\n\x07GetRuns\x12\x1f.porerefiner.rpc.RunListRequest\x1a .porerefiner.rpc.RunListResponse\x12G\n\nGetRunInfo\x12\x1b.porerefiner.rpc.RunRequest\x1a\x1c.porerefiner.rpc.RunResponse\x12W\n\x10\x41ttachSheetToRun\x12!.porerefiner.rpc.RunAttachRequest\x1a .porerefiner.rpc.GenericResponse\x12Q\n\nRsyncRunTo\x12 .porerefiner.rpc.RunRsyncRequest\x1a!.porerefiner.rpc.RunRsyncResponse\x12\x44\n\x03Tag\x12\x1b.porerefiner.rpc.TagRequest\x1a .porerefiner.rpc.GenericResponseP\x00P\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7porerefiner/protocols/porerefiner/rpc/porerefiner.proto\x12\x0fporerefiner.rpc\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/duration.proto\";\n\tTripleTag\x12\x11\n\tnamespace\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\"\x94\x08\n\x03Run\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rmnemonic_name\x18\x03 \x01(\t\x12\x12\n\nlibrary_id\x18\x04 \x01(\t\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x0c\n\x04path\x18\x06 \x01(\t\x12\x15\n\rflowcell_type\x18\x07 \x01(\t\x12\x13\n\x0b\x66lowcell_id\x18\x08 \x01(\t\x12\x19\n\x11\x62\x61secalling_model\x18\t \x01(\t\x12\x16\n\x0esequencing_kit\x18\n \x01(\t\x12+\n\x07started\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12*\n\x07\x65lapsed\x18\x0c \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x13\n\x0b\x62\x61rcode_kit\x18\r \x03(\t\x12(\n\x05\x66iles\x18\x0f \x03(\x0b\x32\x19.porerefiner.rpc.Run.File\x12\x14\n\x0csample_count\x18\x10 \x01(\r\x12\x12\n\nfile_count\x18\x11 \x01(\r\x12,\n\x07samples\x18\x14 \x03(\x0b\x32\x1b.porerefiner.rpc.Run.Sample\x12\x0c\n\x04tags\x18\x1e \x03(\t\x12-\n\ttrip_tags\x18# \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\x12&\n\x04jobs\x18( \x03(\x0b\x32\x18.porerefiner.rpc.Run.Job\x1a\xb3\x01\n\x04\x46ile\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x0f\n\x07spot_id\x18\x05 \x01(\t\x12\x0c\n\x04size\x18\x08 \x01(\x04\x12\r\n\x05ready\x18\n \x01(\x08\x12\x0c\n\x04hash\x18\x0c \x01(\t\x12\x16\n\x0ehash_algorithm\x18\r \x01(\t\x12\x0c\n\x04tags\x18\x1e \x03(\t\x12-\n\ttrip_tags\x18# \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\x1a\x8e\x02\n\x06Sample\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\taccession\x18\x03 \x01(\t\x12\x12\n\nbarcode_id\x18\x04 \x01(\t\x12\x13\n\x0b\x62\x61rcode_seq\x18\x05 \x01(\t\x12\x10\n\x08organism\x18\x06 \x01(\t\x12\x16\n\x0e\x65xtraction_kit\x18\x07 \x01(\t\x12\x0f\n\x07\x63omment\x18\x08 \x01(\t\x12\x0c\n\x04user\x18\t \x01(\t\x12(\n\x05\x66iles\x18\x14 \x03(\x0b\x32\x19.porerefiner.rpc.Run.File\x12\x0c\n\x04tags\x18\x1e \x03(\t\x12-\n\ttrip_tags\x18( \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\x1a/\n\x03Job\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\"E\n\x05\x45rror\x12\x0e\n\x04\x63ode\x18\x01 \x01(\x05H\x00\x12\x0e\n\x04type\x18\x02 \x01(\tH\x00\x12\x13\n\x0b\x65rr_message\x18\x03 \x01(\tB\x07\n\x05\x65rror\"d\n\x0bRunResponse\x12#\n\x03run\x18\x01 \x01(\x0b\x32\x14.porerefiner.rpc.RunH\x00\x12\'\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x16.porerefiner.rpc.ErrorH\x00\x42\x07\n\x05reply\"\x9f\x02\n\x0eRunListRequest\x12\x0b\n\x03\x61ll\x18\x01 \x01(\x08\x12\x0e\n\x06verify\x18\x02 \x01(\x08\x12&\n\x04view\x18\x03 \x01(\x0e\x32\x18.porerefiner.rpc.RunView\x12\x0e\n\x06status\x18\x04 \x03(\t\x12\x31\n\rstarted_after\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x32\n\x0estarted_before\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08order_by\x18\x07 \x01(\t\x12\x12\n\ndescending\x18\x08 \x01(\x08\x12\r\n\x05limit\x18\t \x01(\r\x12\x0e\n\x06offset\x18\n \x01(\r\x12\x0c\n\x04tags\x18\x14 \x03(\t\"\x8a\x01\n\x10RunStreamRequest\x12\x0b\n\x03\x61ll\x18\x01 \x01(\x08\x12\x0e\n\x06verify\x18\x02 \x01(\x08\x12\x11\n\tpage_size\x18\x03 \x01(\r\x12\x10\n\x08\x61\x66ter_id\x18\x04 \x01(\r\x12&\n\x04view\x18\x05 \x01(\x0e\x32\x18.porerefiner.rpc.RunView\x12\x0c\n\x04tags\x18\x14 \x03(\t\"<\n\x07RunList\x12\"\n\x04runs\x18\x01 \x03(\x0b\x32\x14.porerefiner.rpc.Run\x12\r\n\x05total\x18\x02 \x01(\r\"m\n\x0fRunListResponse\x12(\n\x04runs\x18\x01 \x01(\x0b\x32\x18.porerefiner.rpc.RunListH\x00\x12\'\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x16.porerefiner.rpc.ErrorH\x00\x42\x07\n\x05reply\"B\n\nRunRequest\x12\x0c\n\x02id\x18\x01 \x01(\rH\x00\x12\x0e\n\x04name\x18\x02 \x01(\tH\x00\x12\x0e\n\x06verify\x18\x03 \x01(\x08\x42\x06\n\x04term\"E\n\x0fRunRsyncRequest\x12\x0c\n\x02id\x18\x01 \x01(\rH\x00\x12\x0e\n\x04name\x18\x02 \x01(\tH\x00\x12\x0c\n\x04\x64\x65st\x18\x03 \x01(\tB\x06\n\x04term\"9\n\x10RunRsyncResponse\x12%\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x16.porerefiner.rpc.Error\"8\n\x0fGenericResponse\x12%\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x16.porerefiner.rpc.Error\"H\n\nTagRequest\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04tags\x18\x02 \x03(\t\x12\r\n\x05untag\x18\x03 \x01(\x08\x12\x11\n\tnamespace\x18\x04 \x01(\t\"M\n\x10TripleTagRequest\x12\n\n\x02id\x18\x01 \x01(\r\x12-\n\ttrip_tags\x18\x02 \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\"\xc1\x03\n\x0bSampleSheet\x12\x17\n\x0fporerefiner_ver\x18\x01 \x01(\t\x12\x12\n\nlibrary_id\x18\x02 \x01(\t\x12\x16\n\x0esequencing_kit\x18\x03 \x01(\t\x12(\n\x04\x64\x61te\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x13\n\x0b\x62\x61rcode_kit\x18\x05 \x03(\t\x12\x34\n\x07samples\x18\n \x03(\x0b\x32#.porerefiner.rpc.SampleSheet.Sample\x12\x0c\n\x04tags\x18\x1e \x03(\t\x12-\n\ttrip_tags\x18# \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\x1a\xba\x01\n\x06Sample\x12\x11\n\tsample_id\x18\x01 \x01(\t\x12\x11\n\taccession\x18\x02 \x01(\t\x12\x12\n\nbarcode_id\x18\x03 \x01(\t\x12\x10\n\x08organism\x18\x04 \x01(\t\x12\x16\n\x0e\x65xtraction_kit\x18\x05 \x01(\t\x12\x0f\n\x07\x63omment\x18\x06 \x01(\t\x12\x0c\n\x04user\x18\x07 \x01(\t\x12-\n\ttrip_tags\x18\x14 \x03(\x0b\x32\x1a.porerefiner.rpc.TripleTag\"e\n\x10RunAttachRequest\x12\x0c\n\x02id\x18\x01 \x01(\rH\x00\x12\x0e\n\x04name\x18\x02 \x01(\tH\x00\x12+\n\x05sheet\x18\x05 \x01(\x0b\x32\x1c.porerefiner.rpc.SampleSheetB\x06\n\x04term\"\x1e\n\x0eTriggerRequest\x12\x0c\n\x04task\x18\x01 \x01(\t\"e\n\x0fTriggerResponse\x12%\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x16.porerefiner.rpc.Error\x12+\n\x08\x64uration\x18\x02 \x01(\x0b\x32\x19.google.protobuf.Duration* \n\x07RunView\x12\x08\n\x04\x46ULL\x10\x00\x12\x0b\n\x07SUMMARY\x10\x01\x32\xad\x04\n\x0bPoreRefiner\x12L\n\x07GetRuns\x12\x1f.porerefiner.rpc.RunListRequest\x1a .porerefiner.rpc.RunListResponse\x12G\n\nStreamRuns\x12!.porerefiner.rpc.RunStreamRequest\x1a\x14.porerefiner.rpc.Run0\x01\x12G\n\nGetRunInfo\x12\x1b.porerefiner.rpc.RunRequest\x1a\x1c.porerefiner.rpc.RunResponse\x12W\n\x10\x41ttachSheetToRun\x12!.porerefiner.rpc.RunAttachRequest\x1a .porerefiner.rpc.GenericResponse\x12Q\n\nRsyncRunTo\x12 .porerefiner.rpc.RunRsyncRequest\x1a!.porerefiner.rpc.RunRsyncResponse\x12\x44\n\x03Tag\x12\x1b.porerefiner.rpc.TagRequest\x1a .porerefiner.rpc.GenericResponse\x12L\n\x07Trigger\x12\x1f.porerefiner.rpc.TriggerRequest\x1a .porerefiner.rpc.TriggerResponseP\x00P\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'porerefiner.protocols.porerefiner.rpc.porerefiner_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_RUNVIEW']._serialized_start=3125
+  _globals['_RUNVIEW']._serialized_end=3157
   _globals['_TRIPLETAG']._serialized_start=141
   _globals['_TRIPLETAG']._serialized_end=200
   _globals['_RUN']._serialized_start=203
-  _globals['_RUN']._serialized_end=1181
-  _globals['_RUN_FILE']._serialized_start=704
-  _globals['_RUN_FILE']._serialized_end=859
-  _globals['_RUN_SAMPLE']._serialized_start=862
-  _globals['_RUN_SAMPLE']._serialized_end=1132
-  _globals['_RUN_JOB']._serialized_start=1134
-  _globals['_RUN_JOB']._serialized_end=1181
-  _globals['_ERROR']._serialized_start=1183
-  _globals['_ERROR']._serialized_end=1252
-  _globals['_RUNRESPONSE']._serialized_start=1254
-  _globals['_RUNRESPONSE']._serialized_end=1354
-  _globals['_RUNLISTREQUEST']._serialized_start=1356
-  _globals['_RUNLISTREQUEST']._serialized_end=1399
-  _globals['_RUNLIST']._serialized_start=1401
-  _globals['_RUNLIST']._serialized_end=1446
-  _globals['_RUNLISTRESPONSE']._serialized_start=1448
-  _globals['_RUNLISTRESPONSE']._serialized_end=1557
-  _globals['_RUNREQUEST']._serialized_start=1559
-  _globals['_RUNREQUEST']._serialized_end=1609
-  _globals['_RUNRSYNCREQUEST']._serialized_start=1611
-  _globals['_RUNRSYNCREQUEST']._serialized_end=1680
-  _globals['_RUNRSYNCRESPONSE']._serialized_start=1682
-  _globals['_RUNRSYNCRESPONSE']._serialized_end=1739
-  _globals['_GENERICRESPONSE']._serialized_start=1741
-  _globals['_GENERICRESPONSE']._serialized_end=1797
-  _globals['_TAGREQUEST']._serialized_start=1799
-  _globals['_TAGREQUEST']._serialized_end=1871
-  _globals['_TRIPLETAGREQUEST']._serialized_start=1873
-  _globals['_TRIPLETAGREQUEST']._serialized_end=1950
-  _globals['_SAMPLESHEET']._serialized_start=1953
-  _globals['_SAMPLESHEET']._serialized_end=2402
-  _globals['_SAMPLESHEET_SAMPLE']._serialized_start=2216
-  _globals['_SAMPLESHEET_SAMPLE']._serialized_end=2402
-  _globals['_RUNATTACHREQUEST']._serialized_start=2404
-  _globals['_RUNATTACHREQUEST']._serialized_end=2505
-  _globals['_POREREFINER']._serialized_start=2508
-  _globals['_POREREFINER']._serialized_end=2914
+  _globals['_RUN']._serialized_end=1247
+  _globals['_RUN_FILE']._serialized_start=746
+  _globals['_RUN_FILE']._serialized_end=925
+  _globals['_RUN_SAMPLE']._serialized_start=928
+  _globals['_RUN_SAMPLE']._serialized_end=1198
+  _globals['_RUN_JOB']._serialized_start=1200
+  _globals['_RUN_JOB']._serialized_end=1247
+  _globals['_ERROR']._serialized_start=1249
+  _globals['_ERROR']._serialized_end=1318
+  _globals['_RUNRESPONSE']._serialized_start=1320
+  _globals['_RUNRESPONSE']._serialized_end=1420
+  _globals['_RUNLISTREQUEST']._serialized_start=1423
+  _globals['_RUNLISTREQUEST']._serialized_end=1710
+  _globals['_RUNSTREAMREQUEST']._serialized_start=1713
+  _globals['_RUNSTREAMREQUEST']._serialized_end=1851
+  _globals['_RUNLIST']._serialized_start=1853
+  _globals['_RUNLIST']._serialized_end=1913
+  _globals['_RUNLISTRESPONSE']._serialized_start=1915
+  _globals['_RUNLISTRESPONSE']._serialized_end=2024
+  _globals['_RUNREQUEST']._serialized_start=2026
+  _globals['_RUNREQUEST']._serialized_end=2092
+  _globals['_RUNRSYNCREQUEST']._serialized_start=2094
+  _globals['_RUNRSYNCREQUEST']._serialized_end=2163
+  _globals['_RUNRSYNCRESPONSE']._serialized_start=2165
+  _globals['_RUNRSYNCRESPONSE']._serialized_end=2222
+  _globals['_GENERICRESPONSE']._serialized_start=2224
+  _globals['_GENERICRESPONSE']._serialized_end=2280
+  _globals['_TAGREQUEST']._serialized_start=2282
+  _globals['_TAGREQUEST']._serialized_end=2354
+  _globals['_TRIPLETAGREQUEST']._serialized_start=2356
+  _globals['_TRIPLETAGREQUEST']._serialized_end=2433
+  _globals['_SAMPLESHEET']._serialized_start=2436
+  _globals['_SAMPLESHEET']._serialized_end=2885
+  _globals['_SAMPLESHEET_SAMPLE']._serialized_start=2699
+  _globals['_SAMPLESHEET_SAMPLE']._serialized_end=2885
+  _globals['_RUNATTACHREQUEST']._serialized_start=2887
+  _globals['_RUNATTACHREQUEST']._serialized_end=2988
+  _globals['_TRIGGERREQUEST']._serialized_start=2990
+  _globals['_TRIGGERREQUEST']._serialized_end=3020
+  _globals['_TRIGGERRESPONSE']._serialized_start=3022
+  _globals['_TRIGGERRESPONSE']._serialized_end=3123
+  _globals['_POREREFINER']._serialized_start=3160
+  _globals['_POREREFINER']._serialized_end=3717
 # @@protoc_insertion_point(module_scope)
@@ -44,6 +44,11 @@ class PoreRefinerStub(object):
                 request_serializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.RunListRequest.SerializeToString,
                 response_deserializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.RunListResponse.FromString,
                 _registered_method=True)
+        self.StreamRuns = channel.unary_stream(
+                '/porerefiner.rpc.PoreRefiner/StreamRuns',
+                request_serializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.RunStreamRequest.SerializeToString,
+                response_deserializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.Run.FromString,
+                _registered_method=True)
         self.GetRunInfo = channel.unary_unary(
                 '/porerefiner.rpc.PoreRefiner/GetRunInfo',
                 request_serializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.RunRequest.SerializeToString,
@@ -64,6 +69,11 @@ class PoreRefinerStub(object):
                 request_serializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.TagRequest.SerializeToString,
                 response_deserializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.GenericResponse.FromString,
                 _registered_method=True)
+        self.Trigger = channel.unary_unary(
+                '/porerefiner.rpc.PoreRefiner/Trigger',
+                request_serializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.TriggerRequest.SerializeToString,
+                response_deserializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.TriggerResponse.FromString,
+                _registered_method=True)
 
 
 class PoreRefinerServicer(object):
@@ -75,6 +85,12 @@ class PoreRefinerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamRuns(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetRunInfo(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -99,6 +115,12 @@ class PoreRefinerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def Trigger(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_PoreRefinerServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -107,6 +129,11 @@ def add_PoreRefinerServicer_to_server(servicer, server):
                     request_deserializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.RunListRequest.FromString,
                     response_serializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.RunListResponse.SerializeToString,
             ),
+            'StreamRuns': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamRuns,
+                    request_deserializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.RunStreamRequest.FromString,
+                    response_serializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.Run.SerializeToString,
+            ),
             'GetRunInfo': grpc.unary_unary_rpc_method_handler(
                     servicer.GetRunInfo,
                     request_deserializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.RunRequest.FromString,
@@ -127,6 +154,11 @@ def add_PoreRefinerServicer_to_server(servicer, server):
                     request_deserializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.TagRequest.FromString,
                     response_serializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.GenericResponse.SerializeToString,
             ),
+            'Trigger': grpc.unary_unary_rpc_method_handler(
+                    servicer.Trigger,
+                    request_deserializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.TriggerRequest.FromString,
+                    response_serializer=porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.TriggerResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'porerefiner.rpc.PoreRefiner', rpc_method_handlers)
@@ -165,6 +197,33 @@ class PoreRefiner(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamRuns(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/porerefiner.rpc.PoreRefiner/StreamRuns',
+            porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.RunStreamRequest.SerializeToString,
+            porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.Run.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetRunInfo(request,
             target,
@@ -272,3 +331,30 @@ class PoreRefiner(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def Trigger(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/porerefiner.rpc.PoreRefiner/Trigger',
+            porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.TriggerRequest.SerializeToString,
+            porerefiner_dot_protocols_dot_porerefiner_dot_rpc_dot_porerefiner__pb2.TriggerResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -8,14 +8,17 @@ import sys
 import watchdog
 
 from asyncio import run, gather, wait
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from grpclib.server import Server
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
 from grpclib.utils import graceful_exit
 from hachiko.hachiko import AIOEventHandler, AIOWatchdog
+from collections import defaultdict
 from itertools import chain
-from peewee import JOIN
+from peewee import JOIN, ModelSelect, fn
 from porerefiner import models
-from porerefiner.models import Run, Qa, File, Duty, SampleSheet, Sample, Tag, TagJunction, TripleTag, TTagJunction
+from porerefiner.models import Run, Qa, File, Duty, SampleSheet, Sample, Tag, TagJunction, TTagJunction
 from porerefiner.cli_utils import relativize_path as r, absolutize_path as a, json_formatter
 from porerefiner.jobs import poll_jobs, CLASS_REGISTRY, JOBS
 from os.path import split, getmtime
@@ -23,9 +26,12 @@ from os import remove
 from pathlib import Path
 
 # from porerefiner.protocols.minknow.rpc.manager_grpc import ManagerServiceStub
-from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import Run as RunMessage, RunList, RunResponse, Error, GenericResponse, RunRsyncResponse, RunListResponse, TripleTag
+from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import Run as RunMessage, RunList, RunResponse, Error, GenericResponse, RunRsyncResponse, RunListResponse, TripleTag, TriggerResponse, RunView
 from porerefiner.protocols.porerefiner.rpc.porerefiner_grpc import PoreRefinerBase
 from porerefiner.notifiers import NOTIFIERS
+from porerefiner.scheduler import SCHEDULER
+from porerefiner.cache import RUN_CACHE
+from porerefiner.tagquery import matches
 
 
 
@@ -38,81 +44,251 @@ def get_run(run_id):
         raise ValueError(f"Run id or name '{run_id}' not found.")
     return run
 
-def make_run_msg(run):
-    return RunMessage(id=run.id,
-        name=run.name,
-        mnemonic_name=run.alt_name,
-        library_id=run.library_id,
-        status=run.status,
-        path=a(run.path),
-        # flowcell_type=run.flowcell.consumable_type,
-        # flowcell_id=run.flowcell.consumable_id,
-        basecalling_model=run.basecalling_model,
-        sequencing_kit=run.sample_sheet.barcoding_kit,
-        samples=[
-            RunMessage.Sample(id=sample.id,
-                    name=sample.sample_id,
-                    accession=sample.accession,
-                    barcode_id=sample.barcode_id,
-                    barcode_seq=sample.barcode_seq,
-                    organism=sample.organism,
-                    extraction_kit=sample.extraction_kit,
-                    comment=sample.comment,
-                    user=sample.user,
-                    files=[
-                    RunMessage.File(name=file.name,
-                            path=a(file.path),
-                            size=file.path.stat().st_size,
-                            ready=datetime.now() - file.last_modified > timedelta(hours=1),
-                            hash=file.checksum,
-                            tags=[tagjunction.tag.name for tagjunction in file.tag_junctions],
-                            trip_tags=[TripleTag(
-                                namespace=ttagj.tag.namespace,
-                                name=ttagj.tag.name,
-                                value=str(ttagj.tag.value)
-                            ) for ttagj in file.ttag_junctions])
-                    for file in sample.files],
-                    tags=[tagjunction.tag.name for tagjunction in sample.tag_junctions],
-                    trip_tags=[TripleTag(
-                            namespace=ttagj.tag.namespace,
-                            name=ttagj.tag.name,
-                            value=str(ttagj.tag.value)
-                        ) for ttagj in sample.ttag_junctions]
-                    ) for sample in run.samples
-        ],
-        files=[
-            RunMessage.File(name=file.name,
-                path=a(file.path),
-                size=file.path.stat().st_size,
-                ready=datetime.now() - file.last_modified > timedelta(hours=1),
-                hash=file.checksum,
-                tags=[tagjunction.tag.name for tagjunction in file.tag_junctions],
-                trip_tags=[TripleTag(
-                                namespace=ttagj.tag.namespace,
-                                name=ttagj.tag.name,
-                                value=str(ttagj.tag.value)
-                            ) for ttagj in file.ttag_junctions])
-        for file in run.files if file.path.exists()],
-        tags=[tagjunction.tag.name for tagjunction in run.tag_junctions],
-        trip_tags=[TripleTag(
-                namespace=ttagj.tag.namespace,
-                name=ttagj.tag.name,
-                value=str(ttagj.tag.value)
-            ) for ttagj in run.ttag_junctions]
-        )
-
-async def get_run_info(run_id):
-    return make_run_msg(get_run(run_id))
-
-async def list_runs(all=False, tags=[]):
+def tag_names(junctions):
+    return [tagjunction.tag.name for tagjunction in junctions]
+
+def trip_tags(junctions):
+    return [TripleTag(namespace=ttagj.tag.namespace,
+                      name=ttagj.tag.name,
+                      value=str(ttagj.tag.value)) for ttagj in junctions]
+
+def make_file_msg(file, tags, ttags):
+    return RunMessage.File(name=file.name,
+                           path=a(file.path),
+                           size=file.size,
+                           ready=datetime.now() - file.last_modified > timedelta(hours=1),
+                           hash=file.checksum,
+                           hash_algorithm=(file.checksum_algorithm or 'md5') if file.checksum else None,
+                           tags=tag_names(tags[('file', file.id)]),
+                           trip_tags=trip_tags(ttags[('file', file.id)]))
+
+def junctions_by_owner(junction_cls, tag_cls, run_ids, sample_ids, file_ids):
+    "Every tag junction of the given runs, samples and files in one query, keyed by (owner type, owner id)."
+    owners = defaultdict(list)
+    query = (junction_cls.select(junction_cls, tag_cls)
+                         .join(tag_cls)
+                         .where(junction_cls.run.in_(run_ids) | junction_cls.sample.in_(sample_ids) | junction_cls.file.in_(file_ids))
+                         .order_by(junction_cls.id))
+    for junction in query:
+        for owner in ('run', 'sample', 'file'):
+            owner_id = getattr(junction, f"{owner}_id")
+            if owner_id is not None:
+                owners[(owner, owner_id)].append(junction)
+    return owners
+
+def verify_files(files):
+    "Refresh the stored size and presence of files from the disk, saving whatever changed."
+    changed = []
+    for file in files:
+        try:
+            size, present = file.path.stat().st_size, True
+        except FileNotFoundError:
+            size, present = file.size, False
+        if (size, present) != (file.size, file.present):
+            file.size, file.present = size, present
+            changed.append(file)
+    if changed:
+        with File._meta.database.atomic():
+            File.bulk_update(changed, fields=[File.size, File.present], batch_size=500)
+        RUN_CACHE.bump(*models.runs_of_files([file.id for file in changed]))
+    return changed
+
+def make_run_msgs(runs, verify=False):
+    "Run messages for every run in a query, in a fixed number of queries however many runs, files and tags there are."
+    if isinstance(runs, ModelSelect):
+        run_ids = runs.select(Run.id) # a subquery rather than a literal list, however many runs it matches
+    else:
+        run_ids = Run.select(Run.id).where(Run.id << [run.id for run in runs])
+    runs = list(runs)
+    if not runs:
+        return []
+    sheet_ids = Run.select(Run._sample_sheet).where(Run.id.in_(run_ids))
+    sheets = {sheet.id: sheet for sheet in SampleSheet.select().where(SampleSheet.id.in_(sheet_ids))}
+    samples = defaultdict(list)
+    for sample in Sample.select().where(Sample.samplesheet.in_(sheet_ids)).order_by(Sample.id):
+        sample.samplesheet = sheets[sample.samplesheet_id] # so barcode_seq needn't look it up
+        samples[sample.samplesheet_id].append(sample)
+    sample_ids = Sample.select(Sample.id).where(Sample.samplesheet.in_(sheet_ids))
+    run_files, sample_files = defaultdict(list), defaultdict(list)
+    file_query = File.select().where(File.run.in_(run_ids) | File.sample.in_(sample_ids)).order_by(File.id)
+    files = list(file_query)
+    if verify:
+        verify_files(files)
+    for file in files:
+        if file.run_id is not None:
+            run_files[file.run_id].append(file)
+        if file.sample_id is not None:
+            sample_files[file.sample_id].append(file)
+    file_ids = File.select(File.id).where(File.run.in_(run_ids) | File.sample.in_(sample_ids))
+    tags = junctions_by_owner(TagJunction, Tag, run_ids, sample_ids, file_ids)
+    ttags = junctions_by_owner(TTagJunction, models.TripleTag, run_ids, sample_ids, file_ids)
+    return [RunMessage(id=run.id,
+                name=run.name,
+                mnemonic_name=run.alt_name,
+                library_id=run.library_id,
+                status=run.status,
+                path=a(run.path),
+                # flowcell_type=run.flowcell.consumable_type,
+                # flowcell_id=run.flowcell.consumable_id,
+                basecalling_model=run.basecalling_model,
+                sequencing_kit=sheets[run._sample_sheet_id].barcoding_kit if run._sample_sheet_id in sheets else None,
+                samples=[
+                    RunMessage.Sample(id=sample.id,
+                            name=sample.sample_id,
+                            accession=sample.accession,
+                            barcode_id=sample.barcode_id,
+                            barcode_seq=sample.barcode_seq,
+                            organism=sample.organism,
+                            extraction_kit=sample.extraction_kit,
+                            comment=sample.comment,
+                            user=sample.user,
+                            files=[make_file_msg(file, tags, ttags) for file in sample_files[sample.id]],
+                            tags=tag_names(tags[('sample', sample.id)]),
+                            trip_tags=trip_tags(ttags[('sample', sample.id)])
+                            ) for sample in samples[run._sample_sheet_id]
+                ],
+                files=[make_file_msg(file, tags, ttags) for file in run_files[run.id] if file.present],
+                sample_count=len(samples[run._sample_sheet_id]),
+                file_count=len([file for file in run_files[run.id] if file.present]) + sum(len(sample_files[sample.id]) for sample in samples[run._sample_sheet_id]),
+                tags=tag_names(tags[('run', run.id)]),
+                trip_tags=trip_tags(ttags[('run', run.id)])
+                ) for run in runs]
+
+def make_run_summaries(runs, verify=False):
+    "Run messages without samples or files, just how many there are, counted by the database."
+    if isinstance(runs, ModelSelect):
+        run_ids = runs.select(Run.id)
+    else:
+        run_ids = Run.select(Run.id).where(Run.id << [run.id for run in runs])
+    runs = list(runs)
+    if not runs:
+        return []
+    sheet_ids = Run.select(Run._sample_sheet).where(Run.id.in_(run_ids))
+    if verify:
+        sample_ids = Sample.select(Sample.id).where(Sample.samplesheet.in_(sheet_ids))
+        verify_files(File.select().where(File.run.in_(run_ids) | File.sample.in_(sample_ids)))
+    kits = dict(SampleSheet.select(SampleSheet.id, SampleSheet.barcoding_kit).where(SampleSheet.id.in_(sheet_ids)).tuples())
+    sample_counts = dict(Sample.select(Sample.samplesheet, fn.COUNT(Sample.id))
+                               .where(Sample.samplesheet.in_(sheet_ids))
+                               .group_by(Sample.samplesheet).tuples())
+    sheet_file_counts = dict(File.select(Sample.samplesheet, fn.COUNT(File.id))
+                                 .join(Sample, on=(File.sample == Sample.id))
+                                 .where(Sample.samplesheet.in_(sheet_ids))
+                                 .group_by(Sample.samplesheet).tuples())
+    run_file_counts = dict(File.select(File.run, fn.COUNT(File.id))
+                               .where(File.run.in_(run_ids) & File.present)
+                               .group_by(File.run).tuples())
+    tags = junctions_by_owner(TagJunction, Tag, run_ids, [], [])
+    ttags = junctions_by_owner(TTagJunction, models.TripleTag, run_ids, [], [])
+    return [RunMessage(id=run.id,
+                name=run.name,
+                mnemonic_name=run.alt_name,
+                library_id=run.library_id,
+                status=run.status,
+                path=a(run.path),
+                basecalling_model=run.basecalling_model,
+                sequencing_kit=kits.get(run._sample_sheet_id),
+                sample_count=sample_counts.get(run._sample_sheet_id, 0),
+                file_count=run_file_counts.get(run.id, 0) + sheet_file_counts.get(run._sample_sheet_id, 0),
+                tags=tag_names(tags[('run', run.id)]),
+                trip_tags=trip_tags(ttags[('run', run.id)])
+                ) for run in runs]
+
+def run_msg_builder(view=RunView.FULL):
+    return make_run_summaries if view == RunView.SUMMARY else make_run_msgs
+
+def cacheable(run, run_msg):
+    "Finished runs only change when something writes to them, unless they have files that will turn ready with time."
+    return run.status == 'DONE' and all(file.ready for file in chain(run_msg.files, *(sample.files for sample in run_msg.samples)))
+
+def run_msgs(runs, verify=False, view=RunView.FULL):
+    "Run messages for a query or list of runs, with finished runs served from RUN_CACHE when nothing has written to them since."
+    build = run_msg_builder(view)
+    if verify: # reads the disk, so always build
+        return build(runs, verify)
+    fetched = list(runs) # a ModelSelect keeps its rows, so the builder won't query for them again
+    cached = {}
+    for run in fetched:
+        if run.status == 'DONE':
+            data = RUN_CACHE.get(run.id, view)
+            if data is not None:
+                cached[run.id] = RunMessage.FromString(data)
+    if not cached:
+        built = build(runs)
+    else:
+        built = build([run for run in fetched if run.id not in cached])
+    for run, run_msg in zip([run for run in fetched if run.id not in cached], built):
+        if cacheable(run, run_msg):
+            RUN_CACHE.put(run.id, view, run_msg.SerializeToString())
+        cached[run.id] = run_msg
+    return [cached[run.id] for run in fetched]
+
+def make_run_msg(run, verify=False):
+    return run_msgs([run], verify)[0]
+
+async def get_run_info(run_id, verify=False):
+    return make_run_msg(get_run(run_id), verify)
+
+STREAM_BATCH_SIZE = 100 # runs assembled per round of queries when streaming
+
+RUN_ORDERINGS = {'': Run.id, 'id': Run.id, 'name': Run.name, 'started': Run.started, 'ended': Run.ended, 'status': Run.status}
+
+def local_time(timestamp):
+    "Protobuf UTC timestamp to the naive local datetimes the database holds."
+    return timestamp.ToDatetime(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+
+def select_runs(all=False, tags=[], status=(), started_after=None, started_before=None):
+    query = Run.select()
     if tags:
-        #implies all
-        tags = [str(tag) for tag in tags] # sanitize
-        return [make_run_msg(run) for run in Run.get_by_tags(*tags)]
-    if all:
-        return [make_run_msg(run) for run in Run.select()]
-    #only in-progress runs
-    return [make_run_msg(run) for run in Run.select().where(Run.ended.is_null())]
+        query = query.where(matches(Run, *[str(tag) for tag in tags])) # any of the tag queries
+    if status:
+        query = query.where(Run.status << [str(st) for st in status])
+    if not (all or tags or status): # tags and statuses imply all
+        #only in-progress runs
+        query = query.where(Run.ended.is_null())
+    if started_after:
+        query = query.where(Run.started >= started_after)
+    if started_before:
+        query = query.where(Run.started < started_before)
+    return query
+
+def order_runs(query, order_by='', descending=False):
+    try:
+        field = RUN_ORDERINGS[order_by]
+    except KeyError:
+        raise ValueError(f"Can't order runs by '{order_by}'; choose from {', '.join(key for key in RUN_ORDERINGS if key)}.") from None
+    if descending:
+        return query.order_by(field.desc(), Run.id.desc())
+    return query.order_by(field, Run.id)
+
+async def list_runs(all=False, tags=[], verify=False, view=RunView.FULL, status=(), started_after=None, started_before=None, order_by='', descending=False, limit=0, offset=0):
+    query = order_runs(select_runs(all, tags, status, started_after, started_before), order_by, descending)
+    if limit or offset:
+        query = query.limit(limit or -1).offset(offset)
+    return run_msgs(query, verify, view)
+
+def run_filters(request):
+    "Filter arguments of select_runs and list_runs from a RunListRequest."
+    return dict(all=request.all,
+                tags=request.tags,
+                status=request.status,
+                started_after=local_time(request.started_after) if request.HasField('started_after') else None,
+                started_before=local_time(request.started_before) if request.HasField('started_before') else None)
+
+async def stream_runs(all=False, tags=[], verify=False, page_size=0, after_id=0, batch_size=STREAM_BATCH_SIZE, view=RunView.FULL):
+    "Yield run messages in id order a batch at a time, so memory doesn't grow with the length of the listing."
+    remaining = page_size or None
+    while remaining is None or remaining > 0:
+        limit = batch_size if remaining is None else min(batch_size, remaining)
+        batch = run_msgs(select_runs(all, tags).where(Run.id > after_id).order_by(Run.id).limit(limit), verify, view)
+        for run_msg in batch:
+            yield run_msg
+        if len(batch) < limit:
+            return
+        after_id = batch[-1].id
+        if remaining is not None:
+            remaining -= len(batch)
+        await asyncio.sleep(0) # let other requests in between batches
 
 
 
@@ -123,15 +299,37 @@ class PoreRefinerDispatchServer(PoreRefinerBase):
     async def GetRuns(self, stream: 'grpclib.server.Stream[porerefiner_pb2.RunListRequest, porerefiner_pb2.RunList]') -> None:
         log.debug("API call: Get Runs")
         request = await stream.recv_message()
-        log.debug(f"all:{request.all}, tags:{request.tags}")
-        await stream.send_message(RunListResponse(runs=RunList(runs = await list_runs(request.all, request.tags))))
+        log.debug(f"all:{request.all}, tags:{request.tags}, status:{request.status}, limit:{request.limit}, offset:{request.offset}")
+        filters = run_filters(request)
+        try:
+            runs = await list_runs(verify=request.verify,
+                                   view=request.view,
+                                   order_by=request.order_by,
+                                   descending=request.descending,
+                                   limit=request.limit,
+                                   offset=request.offset,
+                                   **filters)
+            reply_msg = RunListResponse(runs=RunList(runs=runs, total=select_runs(**filters).count()))
+        except ValueError as e:
+            reply_msg = RunListResponse(error=Error(type='ValueError', err_message=str(e)))
+        await stream.send_message(reply_msg)
         log.debug("Response sent")
 
+    async def StreamRuns(self, stream: 'grpclib.server.Stream[porerefiner_pb2.RunStreamRequest, porerefiner_pb2.Run]') -> None:
+        request = await stream.recv_message()
+        log.debug(f"API call: stream runs, all:{request.all}, tags:{request.tags}, after:{request.after_id}")
+        try:
+            async for run_msg in stream_runs(request.all, request.tags, request.verify, request.page_size, request.after_id, view=request.view):
+                await stream.send_message(run_msg)
+        except ValueError as e: # a bad tag query; there's no error message in a stream of runs
+            raise GRPCError(Status.INVALID_ARGUMENT, str(e))
+        log.debug("Stream ended")
+
     async def GetRunInfo(self, stream: 'grpclib.server.Stream[porerefiner_pb2.RunRequest, porerefiner_pb2.RunResponse]') -> None:
         request = await stream.recv_message()
         log.debug(f"API call: get run info for run {request.id or request.name}")
         try:
-            run_msg = await get_run_info(request.id or request.name)
+            run_msg = await get_run_info(request.id or request.name, request.verify)
             reply_msg = RunResponse(run=run_msg)
         except ValueError as e:
             err_msg = Error(type='ValueError', err_message=str(e))
@@ -178,16 +376,31 @@ class PoreRefinerDispatchServer(PoreRefinerBase):
         run = Run.get_or_none(Run.id == request.id)
         if run:
             resp = GenericResponse()
-            for tag in request.tags:
-                if request.untag:
+            if request.untag:
+                for tag in request.tags:
                     run.untag(tag)
-                else:
-                    run.tag(tag)
+            else:
+                Run.tag_many([run], request.tags)
         else:
             resp = GenericResponse(error=Error(type="NoSuchRun", err_message=f"run id {request.id} not found."))
         await stream.send_message(resp)
         log.info("Response sent")
 
+    async def Trigger(self, stream):
+        request = await stream.recv_message()
+        log.debug(f"API call: trigger scheduled task '{request.task}'")
+        try:
+            await SCHEDULER.trigger(request.task)
+            task = SCHEDULER.tasks[request.task]
+            resp = TriggerResponse()
+            resp.duration.FromTimedelta(timedelta(seconds=task.last_duration))
+            if task.last_error:
+                resp.error.CopyFrom(Error(type="TaskFailed", err_message=task.last_error))
+        except ValueError as e:
+            resp = TriggerResponse(error=Error(type="NoSuchTask", err_message=str(e)))
+        await stream.send_message(resp)
+        log.debug("Response sent")
+
 async def start_server(socket, *a, **k):
     "Coroutine to bring up the rpc server"
     server = Server([PoreRefinerDispatchServer()])
@@ -0,0 +1,182 @@
+"Single owner for the server's periodic background tasks"
+
+import asyncio
+import heapq
+import logging
+import random
+
+from itertools import count
+
+log = logging.getLogger('porerefiner.scheduler')
+
+
+class PeriodicTask:
+    "A coroutine function run every `interval` seconds, never overlapping itself"
+
+    def __init__(self, name, func, interval, jitter=0.0):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.due = None # loop time of the next scheduled tick; None while a tick is in flight
+        self.wake_delay = None # requested by wake() while a tick was in flight
+        self.current = None # asyncio.Task of the tick in flight
+        self.runs = 0
+        self.failures = 0
+        self.overruns = 0 # ticks that took longer than the interval
+        self.last_duration = None
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+        self.last_result = None
+        self.last_error = None
+
+    @property
+    def running(self):
+        return bool(self.current and not self.current.done())
+
+    def next_delay(self):
+        return self.interval + random.uniform(0, self.interval * self.jitter)
+
+    def stats(self):
+        return dict(runs=self.runs,
+                    failures=self.failures,
+                    overruns=self.overruns,
+                    running=self.running,
+                    last_duration=self.last_duration,
+                    max_duration=self.max_duration,
+                    mean_duration=self.total_duration / self.runs if self.runs else None,
+                    last_error=self.last_error)
+
+
+class Scheduler:
+    "Heap of periodic tasks driven by one event loop task. The next tick of a task is scheduled when its last one finishes."
+
+    def __init__(self, jitter=0.1):
+        self.jitter = jitter
+        self.tasks = {}
+        self._heap = [] # (due, sequence, name); entries whose due no longer matches the task's are stale
+        self._sequence = count()
+        self._wake = None
+        self._runner = None
+
+    def configure(self, scheduler_jitter=None, *a, **k):
+        "Apply settings from the porerefiner section of the config."
+        if scheduler_jitter is not None:
+            self.jitter = scheduler_jitter
+            for task in self.tasks.values():
+                task.jitter = scheduler_jitter
+
+    def add(self, name, func, interval, delay=0.0):
+        "Register a coroutine function to be run every `interval` seconds, the first time after `delay`."
+        if name in self.tasks:
+            raise ValueError(f"Task '{name}' is already scheduled.")
+        task = self.tasks[name] = PeriodicTask(name, func, interval, self.jitter)
+        self._push(task, delay)
+        return task
+
+    def remove(self, name):
+        task = self.tasks.pop(name)
+        if task.running:
+            task.current.cancel()
+        return task
+
+    def _push(self, task, delay):
+        task.due = asyncio.get_running_loop().time() + delay
+        heapq.heappush(self._heap, (task.due, next(self._sequence), task.name))
+        if self._wake:
+            self._wake.set()
+
+    async def _tick(self, task):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            task.last_result = await task.func()
+            task.last_error = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            task.failures += 1
+            task.last_error = f"{type(e).__name__}: {e}"
+            log.exception(f"Scheduled task {task.name} failed")
+        finally:
+            duration = loop.time() - started
+            task.runs += 1
+            task.last_duration = duration
+            task.max_duration = max(task.max_duration, duration)
+            task.total_duration += duration
+            if duration > task.interval:
+                task.overruns += 1
+                log.warning(f"Scheduled task {task.name} took {duration:.1f}s, longer than its {task.interval}s interval")
+            log.debug(f"Scheduled task {task.name} finished in {duration:.3f}s")
+            if self.tasks.get(task.name) is task:
+                delay = task.next_delay()
+                if task.wake_delay is not None:
+                    delay, task.wake_delay = min(delay, task.wake_delay), None
+                self._push(task, delay)
+        return task.last_result
+
+    def _start(self, task):
+        task.due = None
+        task.current = asyncio.ensure_future(self._tick(task))
+        return task.current
+
+    def trigger(self, name):
+        "Run a task now instead of waiting for its next tick. If it's already running, returns the tick in flight."
+        try:
+            task = self.tasks[name]
+        except KeyError:
+            raise ValueError(f"No scheduled task '{name}'; choose from {', '.join(self.tasks)}.") from None
+        if task.running:
+            return task.current
+        return self._start(task)
+
+    def wake(self, name, delay=0.0):
+        "Bring a task's next tick forward to no later than `delay` seconds from now."
+        task = self.tasks[name]
+        if task.running:
+            task.wake_delay = delay if task.wake_delay is None else min(task.wake_delay, delay)
+        elif task.due is None or task.due > asyncio.get_running_loop().time() + delay:
+            self._push(task, delay)
+
+    async def run(self):
+        "Start ticks as they come due, forever."
+        self._wake = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            while self._heap and self._heap[0][0] <= now:
+                due, _, name = heapq.heappop(self._heap)
+                task = self.tasks.get(name)
+                if task and task.due == due:
+                    self._start(task)
+            timeout = self._heap[0][0] - now if self._heap else None
+            self._wake.clear()
+            waiter = asyncio.ensure_future(self._wake.wait())
+            try: # not wait_for, which can swallow a stop() that lands as the wake fires
+                await asyncio.wait([waiter], timeout=timeout)
+            finally:
+                waiter.cancel()
+
+    def start(self):
+        "Start the scheduler loop if it isn't running already."
+        if not self._runner or self._runner.done():
+            self._runner = asyncio.ensure_future(self.run())
+        return self._runner
+
+    async def stop(self):
+        "Cancel the scheduler loop and any ticks in flight, and forget every task."
+        pending = [task.current for task in self.tasks.values() if task.running]
+        if self._runner:
+            pending.append(self._runner)
+        for future in pending:
+            future.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._runner = None
+        self._wake = None
+        self._heap.clear()
+        self.tasks.clear()
+
+    def stats(self):
+        return {name: task.stats() for name, task in self.tasks.items()}
+
+SCHEDULER = Scheduler()
@@ -0,0 +1,127 @@
+"Persistent SSH connections to cluster login nodes, shared by every command a submitter sends"
+
+import asyncio
+import logging
+import time
+
+import asyncssh
+
+log = logging.getLogger('porerefiner.ssh')
+
+
+class PooledConnection:
+    "An open SSH connection and how many of its channels are spoken for"
+
+    def __init__(self, conn, max_channels):
+        self.conn = conn
+        self.channels = asyncio.Semaphore(max_channels)
+        self.in_use = 0 # commands running or waiting for a channel
+        self.last_used = time.monotonic()
+
+    @property
+    def closed(self):
+        return self.conn.is_closed()
+
+
+class SshPool:
+    "Keeps a few SSH connections open per host and user, multiplexing commands over their channels. Connections that drop are reopened on next use, and idle ones are closed."
+
+    def __init__(self, max_channels=8, max_connections=2, idle_timeout=300, keepalive_interval=30):
+        self.max_channels = max_channels
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.keepalive_interval = keepalive_interval
+        self.pools = {} # (host, port, username, client keys, known hosts) -> [PooledConnection]
+        self.locks = {}
+        self.opened = 0
+
+    def configure(self, ssh_max_channels=None, ssh_max_connections=None, ssh_idle_timeout=None, ssh_keepalive_interval=None, *a, **k):
+        "Apply settings from the porerefiner section of the config."
+        if ssh_max_channels:
+            self.max_channels = ssh_max_channels
+        if ssh_max_connections:
+            self.max_connections = ssh_max_connections
+        if ssh_idle_timeout is not None:
+            self.idle_timeout = ssh_idle_timeout
+        if ssh_keepalive_interval is not None:
+            self.keepalive_interval = ssh_keepalive_interval
+
+    async def _connect(self, host, port, username, client_keys, known_hosts):
+        conn = await asyncssh.connect(host,
+                                      port=port,
+                                      username=username,
+                                      client_keys=list(client_keys) if client_keys is not None else None, # a tuple would be read as (key, certificate)
+                                      known_hosts=known_hosts,
+                                      keepalive_interval=self.keepalive_interval,
+                                      keepalive_count_max=3)
+        self.opened += 1
+        log.debug(f"Opened SSH connection to {username}@{host}:{port}")
+        return PooledConnection(conn, self.max_channels)
+
+    async def _acquire(self, key):
+        "The connection with the most free channels, opening one if they're all busy and there's room."
+        self.evict_idle()
+        async with self.locks.setdefault(key, asyncio.Lock()): # so a burst of commands doesn't open a connection each
+            pool = self.pools.setdefault(key, [])
+            pool[:] = [pooled for pooled in pool if not pooled.closed]
+            pooled = min(pool, key=lambda pooled: pooled.in_use, default=None)
+            if pooled is None or (pooled.in_use >= self.max_channels and len(pool) < self.max_connections):
+                pooled = await self._connect(*key)
+                pool.append(pooled)
+            pooled.in_use += 1
+            return pooled
+
+    def _release(self, pooled):
+        pooled.in_use -= 1
+        pooled.last_used = time.monotonic()
+        if not pooled.in_use and self.idle_timeout:
+            asyncio.get_running_loop().call_later(self.idle_timeout, self.evict_idle)
+
+    def _discard(self, key, pooled):
+        if pooled in self.pools.get(key, ()):
+            self.pools[key].remove(pooled)
+        pooled.conn.close()
+
+    async def run(self, command, host, port=22, username=None, client_keys=None, known_hosts=(), check=True, input=None):
+        "Run a command on a pooled connection, feeding it input if given, and return its SSHCompletedProcess."
+        key = (host, port, username, tuple(client_keys) if client_keys is not None else None, known_hosts)
+        for attempt in range(2):
+            pooled = await self._acquire(key)
+            try:
+                async with pooled.channels:
+                    return await pooled.conn.run(command, check=check, input=input)
+            except asyncssh.ChannelOpenError as e: # the connection went away before the command started, so it's safe to send again
+                self._discard(key, pooled)
+                if attempt:
+                    raise
+                log.warning(f"Reconnecting to {host}: {e}")
+            except asyncssh.DisconnectError: # the command may have run, so don't send it twice
+                self._discard(key, pooled)
+                raise
+            finally:
+                self._release(pooled)
+
+    def evict_idle(self):
+        "Close connections that have had nothing to do for the idle timeout."
+        cutoff = time.monotonic() - self.idle_timeout
+        for key, pool in self.pools.items():
+            for pooled in list(pool):
+                if pooled.closed or (self.idle_timeout and not pooled.in_use and pooled.last_used <= cutoff):
+                    log.debug(f"Closing idle SSH connection to {key[0]}")
+                    self._discard(key, pooled)
+
+    def stats(self):
+        return dict(connections=sum(len(pool) for pool in self.pools.values()),
+                    opened=self.opened,
+                    channels=sum(pooled.in_use for pool in self.pools.values() for pooled in pool))
+
+    async def close(self):
+        "Close every connection, waiting for them to finish."
+        pools, self.pools, self.locks = self.pools, {}, {}
+        for pool in pools.values():
+            for pooled in pool:
+                pooled.conn.close()
+                await pooled.conn.wait_closed()
+
+
+SSH_POOL = SshPool()
@@ -0,0 +1,125 @@
+"Boolean tag queries, like `fastq_pass AND NOT ONT:device=X1`, compiled to a single SQL query"
+
+import operator
+import re
+
+from functools import reduce
+
+from porerefiner.models import Tag, TripleTag, TagJunction, TTagJunction
+
+OPERATORS = ('AND', 'OR', 'NOT', '(', ')')
+
+TOKEN = re.compile(r'\s*(?:(\(|\))|"([^"]*)"|([^\s()"]+))')
+TRIPLE = re.compile(r'^(?:(?P<namespace>[^:=]+):)?(?P<name>[^:=]+)=(?P<value>.*)$')
+
+
+class TagQueryError(ValueError):
+    "A tag query that doesn't parse"
+
+
+def tokenize(expression):
+    "(is operator, text) pairs; quoted text is never an operator."
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN.match(expression, position)
+        if not match:
+            raise TagQueryError(f"Unbalanced quote in tag query '{expression}'.")
+        paren, quoted, word = match.groups()
+        if quoted is not None:
+            yield False, quoted
+        else:
+            text = paren or word
+            yield text in OPERATORS, text
+        position = match.end()
+
+def parse(expression):
+    """Parse a tag query to a tree of ('or', a, b), ('and', a, b), ('not', a) and ('tag', text) nodes.
+
+    A query without operators, parentheses or quotes is a single tag, spaces and all, as tags always were."""
+    tokens = list(tokenize(expression))
+    if not tokens:
+        raise TagQueryError("Empty tag query.")
+    if not any(is_op for is_op, _ in tokens) and '"' not in expression:
+        return ('tag', expression.strip())
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else (True, None)
+
+    def take(text):
+        nonlocal position
+        if peek() == (True, text):
+            position += 1
+            return True
+        return False
+
+    def disjunction():
+        node = conjunction()
+        while take('OR'):
+            node = ('or', node, conjunction())
+        return node
+
+    def conjunction():
+        node = negation()
+        while take('AND'):
+            node = ('and', node, negation())
+        return node
+
+    def negation():
+        if take('NOT'):
+            return ('not', negation())
+        return term()
+
+    def term():
+        nonlocal position
+        if take('('):
+            node = disjunction()
+            if not take(')'):
+                raise TagQueryError(f"Missing ')' in tag query '{expression}'.")
+            return node
+        is_op, text = peek()
+        if is_op:
+            raise TagQueryError(f"Expected a tag but found {text or 'the end'} in tag query '{expression}'.")
+        position += 1
+        return ('tag', text)
+
+    tree = disjunction()
+    if position < len(tokens):
+        raise TagQueryError(f"Unexpected '{tokens[position][1]}' in tag query '{expression}'; join tags with AND or OR.")
+    return tree
+
+def owners(junction, owner):
+    "Ids of the `owner` instances on a junction table. Junction rows for other owners are left out, since their NULLs would make NOT IN match nothing."
+    column = getattr(junction, owner)
+    return junction.select(column).where(column.is_null(False))
+
+def tag_predicate(model, text):
+    "Instances with a tag named `text` or a triple tag valued `text`, or for `namespace:name=value` (namespace optional, value may be *), that triple tag."
+    owner = model.__name__.lower()
+    triple = TRIPLE.match(text)
+    if triple:
+        namespace, name, value = triple.group('namespace', 'name', 'value')
+        condition = TripleTag.name == name
+        if namespace:
+            condition &= TripleTag.namespace == namespace
+        if value != '*':
+            condition &= TripleTag.value == value
+        return model.id.in_(owners(TTagJunction, owner).join(TripleTag).where(condition))
+    return (model.id.in_(owners(TagJunction, owner).join(Tag).where(Tag.name == text))
+          | model.id.in_(owners(TTagJunction, owner).join(TripleTag).where(TripleTag.value == text)))
+
+def compile_tree(model, tree):
+    kind, *operands = tree
+    if kind == 'tag':
+        return tag_predicate(model, operands[0])
+    if kind == 'not':
+        return ~compile_tree(model, operands[0])
+    combine = operator.and_ if kind == 'and' else operator.or_
+    return combine(compile_tree(model, operands[0]), compile_tree(model, operands[1]))
+
+def matches(model, *expressions):
+    "Where-clause for instances of a taggable model matching any of the tag queries."
+    if not expressions:
+        raise TagQueryError("No tag query given.")
+    return reduce(operator.or_, (compile_tree(model, parse(str(expression))) for expression in expressions))
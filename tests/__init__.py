@@ -23,6 +23,8 @@ import os
 import namesgenerator
 
 from porerefiner import models, jobs
+from porerefiner.fsevents import MODIFICATIONS, PATHS, RUN_ACTIVITY, FILE_ACTIVITY
+from porerefiner.cache import RUN_CACHE
 
 from peewee import SqliteDatabase
 
@@ -404,10 +406,102 @@ def db():
     db.bind(models.REGISTRY, bind_refs=True, bind_backrefs=True)
     db.connect()
     db.create_tables(models.REGISTRY)
+    MODIFICATIONS.clear()
+    PATHS.clear()
+    RUN_ACTIVITY.clear()
+    FILE_ACTIVITY.clear()
+    RUN_CACHE.clear()
     yield db
+    MODIFICATIONS.clear()
+    PATHS.clear()
+    RUN_ACTIVITY.clear()
+    FILE_ACTIVITY.clear()
+    RUN_CACHE.clear()
     db.drop_tables(models.REGISTRY)
     db.close()
 
+class FakeLoginNode:
+    "Stand-in for a cluster login node: an SSH server on localhost that answers qsub and qstat."
+
+    def __init__(self):
+        self.connections = [] # every connection ever made, so its length counts handshakes
+        self.commands = []
+        self.jobs = 0
+        self.states = {} # job number -> qstat state, if not 'r'
+        self.finished = set()
+        self.exit_codes = {} # (job number, task) -> exit status reported by qacct, for finished jobs
+        self.scripts = [] # job scripts sent on stdin
+        self.arrays = {} # job number -> how many tasks, for array jobs
+        self.running = self.most_running = 0
+        self.delay = 0
+
+    def answer(self, command):
+        if 'qsub' in command and ' -t ' in command:
+            self.jobs += 1
+            self.arrays[self.jobs] = int(command.split(" -t 1-")[1])
+            return f'Your job-array {self.jobs}.1-{self.arrays[self.jobs]}:1 ("STDIN") has been submitted\n'
+        if 'qsub' in command:
+            self.jobs += 1
+            return f'Your job {self.jobs} ("STDIN") has been submitted\n'
+        if command == 'qstat':
+            return "".join(f"{job} 0.5 STDIN tester r\n" for job in range(1, self.jobs + 1))
+        if command == 'qstat -xml':
+            jobs = "".join(f"<job_list state='running'><JB_job_number>{job}</JB_job_number><JB_name>STDIN</JB_name><state>{self.states.get(job, 'r')}</state>{tasks}</job_list>"
+                           for job in range(1, self.jobs + 1) if job not in self.finished
+                           for tasks in ([f"<tasks>{task}</tasks>" for task in range(1, self.arrays[job] + 1)] if job in self.arrays else [""]))
+            return f"<?xml version='1.0'?><job_info><queue_info>{jobs}</queue_info><job_info></job_info></job_info>"
+        if command.startswith('qacct -j '):
+            number = int(command.split()[-1])
+            return "".join(f"==============================================================\njobnumber    {number}\ntaskid       {task or 'undefined'}\nexit_status  {code}\n"
+                           for (job, task), code in self.exit_codes.items() if job == number)
+        return None
+
+    async def handle(self, process):
+        self.commands.append(process.command)
+        self.running += 1
+        self.most_running = max(self.running, self.most_running)
+        try:
+            if ' -t ' in process.command: # array job scripts come on stdin
+                self.scripts.append(await process.stdin.read())
+            await asyncio.sleep(self.delay)
+            answer = self.answer(process.command)
+            if answer is None:
+                process.stderr.write(f"{process.command.split()[0]}: command not found\n")
+                process.exit(127)
+            else:
+                process.stdout.write(answer)
+                process.exit(0)
+        finally:
+            self.running -= 1
+
+    def drop(self):
+        "Hang up on every client, as a rebooted login node would."
+        for conn in self.connections:
+            conn.close()
+
+@fixture
+async def login_node(tmp_path):
+    import asyncssh
+    node = FakeLoginNode()
+    host_key = asyncssh.generate_private_key('ssh-ed25519')
+    client_key = asyncssh.generate_private_key('ssh-ed25519')
+    client_key.write_private_key(tmp_path / 'id_ed25519')
+    class Server(asyncssh.SSHServer):
+        def connection_made(self, conn):
+            node.connections.append(conn)
+    server = await asyncssh.create_server(Server, '127.0.0.1', 0,
+                                          server_host_keys=[host_key],
+                                          authorized_client_keys=asyncssh.import_authorized_keys(client_key.export_public_key().decode()),
+                                          process_factory=node.handle)
+    node.port = server.sockets[0].getsockname()[1]
+    (tmp_path / 'known_hosts').write_text(f"[127.0.0.1]:{node.port} {host_key.export_public_key().decode()}")
+    node.private_key_path = str(tmp_path / 'id_ed25519')
+    node.known_hosts_path = str(tmp_path / 'known_hosts')
+    yield node
+    node.drop() # wait_closed waits on any client a failed test left connected
+    server.close()
+    await server.wait_closed()
+
 if __name__ == '__main__':
     symbol = None
     for symbol in locals().values():
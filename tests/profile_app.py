@@ -0,0 +1,68 @@
+"Load test the web app's run listing: a fresh event loop and channel per request, against the shared client."
+
+import asyncio
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+
+import click
+
+from grpclib.server import Server
+
+from porerefiner.app import app
+from porerefiner.app.client import ServiceClient
+from porerefiner.cli_utils import server
+from porerefiner.protocols.porerefiner.rpc.porerefiner_grpc import PoreRefinerBase
+from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import RunListRequest, RunListResponse, RunList, Run
+
+
+def start_service(socket, runs):
+    "Serve a canned run list on its own thread, so only the client side is measured."
+    response = RunListResponse(runs=RunList(runs=[Run(id=i, name=f"run_{i}") for i in range(runs)]))
+    async def GetRuns(_, stream):
+        await stream.recv_message()
+        await stream.send_message(response)
+    async def unimplemented(_, stream):
+        raise NotImplementedError
+    handler = type('Canned', (PoreRefinerBase,), {**{name: unimplemented for name in PoreRefinerBase.__abstractmethods__}, 'GetRuns': GetRuns})()
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    async def starter():
+        await Server([handler]).start(path=socket)
+    asyncio.run_coroutine_threadsafe(starter(), loop).result(5)
+
+def per_request(socket):
+    "How the views called the service before: a new event loop and connection every time."
+    async def list_run_runner():
+        with server(socket) as serv:
+            return await serv.GetRuns(RunListRequest(all=True))
+    return asyncio.run(list_run_runner())
+
+def measure(call, requests, threads):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        for _ in pool.map(lambda _: call(), range(requests)):
+            pass
+    return requests / (time.perf_counter() - start)
+
+@click.command()
+@click.option('--requests', default=2000, show_default=True)
+@click.option('--threads', default=8, show_default=True, help="Concurrent request threads, as a threaded WSGI server would use.")
+@click.option('--runs', default=20, show_default=True, help="Runs in each listing.")
+def main(requests, threads, runs):
+    with TemporaryDirectory() as t:
+        socket = f"{t}/porerefiner.sock"
+        start_service(socket, runs)
+        client = ServiceClient(socket)
+        click.echo(f"{'client':<12}\t{'req/s':>8}")
+        click.echo(f"{'per request':<12}\t{measure(lambda: per_request(socket), requests, threads):>8.0f}")
+        click.echo(f"{'shared':<12}\t{measure(lambda: client.call('GetRuns', RunListRequest(all=True)), requests, threads):>8.0f}")
+        app.config['socket'] = socket
+        web = app.test_client()
+        click.echo(f"{'/api/runs':<12}\t{measure(lambda: web.get('/api/runs'), requests, threads):>8.0f}")
+        client.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"Benchmark checksum throughput per algorithm on a large file."
+
+import os
+import time
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import click
+
+from porerefiner.checksums import ALGORITHMS, checksum_file
+
+
+@click.command()
+@click.argument('gib', default=2.0)
+@click.option('--chunk-size', default=8 * 1024 * 1024, show_default=True)
+def main(gib, chunk_size):
+    size = int(gib * 1024 ** 3)
+    with TemporaryDirectory() as t:
+        path = Path(t) / "reads.pod5"
+        click.echo(f"Writing {gib} GiB test file...")
+        block = os.urandom(chunk_size)
+        with open(path, 'wb') as fh:
+            for _ in range(size // chunk_size):
+                fh.write(block)
+        checksum_file(path, 'crc32', chunk_size) # warm the page cache so the first algorithm isn't penalized
+        click.echo(f"{'algorithm':<10}\t{'seconds':>8}\t{'MiB/s':>8}")
+        for algorithm in ALGORITHMS:
+            start = time.perf_counter()
+            checksum_file(path, algorithm, chunk_size)
+            elapsed = time.perf_counter() - start
+            click.echo(f"{algorithm:<10}\t{elapsed:>8.2f}\t{size / 2**20 / elapsed:>8.0f}")
+
+if __name__ == '__main__':
+    quit(main())
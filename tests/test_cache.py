@@ -0,0 +1,85 @@
+"Tests for the serialized run message cache."
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from pytest import mark
+
+from tests import db
+
+from porerefiner import models, rpc
+from porerefiner.cache import RunCache, RUN_CACHE
+
+
+def test_versions_invalidate_entries():
+    cache = RunCache()
+    cache.put(1, 0, b"one")
+    assert cache.get(1) == b"one"
+    cache.bump(1)
+    assert cache.get(1) is None
+    assert cache.size == 0
+    cache.bump(None) # files without a run
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+def test_views_are_cached_separately():
+    cache = RunCache()
+    cache.put(1, 0, b"full")
+    cache.put(1, 1, b"summary")
+    assert (cache.get(1, 0), cache.get(1, 1)) == (b"full", b"summary")
+    cache.bump(1)
+    assert cache.get(1, 0) is None and cache.get(1, 1) is None
+
+def test_evicts_least_recently_used_by_size():
+    cache = RunCache(max_bytes=10)
+    cache.put(1, 0, b"aaaa")
+    cache.put(2, 0, b"bbbb")
+    cache.get(1, 0)
+    cache.put(3, 0, b"cccc")
+    assert cache.get(2, 0) is None
+    assert cache.get(1, 0) == b"aaaa" and cache.get(3, 0) == b"cccc"
+    assert cache.size == 8
+    cache.put(4, 0, b"x" * 11) # never fits
+    assert cache.get(4, 0) is None and cache.size == 8
+    cache.configure(run_cache_bytes=4)
+    assert list(cache.entries) == [(3, 0)]
+
+@mark.asyncio
+async def test_finished_runs_served_from_cache(db):
+    old = datetime.now() - timedelta(hours=2)
+    run = models.Run.create(name="done", path="/TEST/done", status='DONE', ended=old)
+    models.File.create(run=run, path="/TEST/done/reads.fastq", last_modified=old, size=4)
+    running = models.Run.create(name="running", path="/TEST/running")
+    first = await rpc.list_runs(all=True)
+    with patch.object(db, 'execute_sql', wraps=db.execute_sql) as execute:
+        second = await rpc.get_run_info(run.id)
+    assert execute.call_count == 1, "only the run lookup should reach the database"
+    assert second == first[0]
+    assert [msg.id for msg in await rpc.list_runs(all=True)] == [run.id, running.id]
+    assert (run.id, 0) in RUN_CACHE.entries and (running.id, 0) not in RUN_CACHE.entries
+
+@mark.asyncio
+async def test_writes_invalidate_cached_runs(db):
+    old = datetime.now() - timedelta(hours=2)
+    run = models.Run.create(name="done", path="/TEST/done", status='DONE', ended=old)
+    sheet = models.SampleSheet.create()
+    sample = models.Sample.create(samplesheet=sheet, sample_id="s1", barcode_id="NB01")
+    run.sample_sheet = sheet
+    run.save()
+    file = models.File.create(run=run, path="/TEST/done/reads.fastq", last_modified=old)
+    await rpc.get_run_info(run.id)
+    run.tag("tagged")
+    assert list((await rpc.get_run_info(run.id)).tags) == ["tagged"]
+    sample.tag("sampled")
+    assert list((await rpc.get_run_info(run.id)).samples[0].tags) == ["sampled"]
+    file.ttag("PR", "kind", "reads")
+    assert (await rpc.get_run_info(run.id)).files[0].trip_tags[0].value == "reads"
+    file.present = False
+    file.save()
+    assert not (await rpc.get_run_info(run.id)).files
+
+@mark.asyncio
+async def test_unready_files_are_not_cached(db):
+    run = models.Run.create(name="done", path="/TEST/done", status='DONE', ended=datetime.now())
+    models.File.create(run=run, path="/TEST/done/reads.fastq") # modified just now
+    await rpc.get_run_info(run.id)
+    assert not RUN_CACHE.entries
@@ -0,0 +1,144 @@
+"Tests for off-loop file checksumming."
+
+import asyncio
+import hashlib
+import zlib
+
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from unittest.mock import patch
+
+from pytest import mark
+
+from porerefiner.checksums import checksum_file, new_hasher, HashingPool, ALGORITHMS
+
+from pytest import raises
+
+
+def test_checksum_file_matches_md5():
+    data = b"ACGT" * 100000
+    with NamedTemporaryFile() as tfile:
+        tfile.write(data)
+        tfile.flush()
+        progress = []
+        assert checksum_file(tfile.name, chunk_size=4096, progress=lambda r, t: progress.append((r, t))) == hashlib.md5(data).hexdigest()
+        assert progress[-1] == (len(data), len(data))
+
+@mark.parametrize('algorithm', sorted(ALGORITHMS))
+def test_streamed_checksum_matches_one_shot(algorithm):
+    data = bytes(range(256)) * 1000
+    with NamedTemporaryFile() as tfile:
+        tfile.write(data)
+        tfile.flush()
+        one_shot = new_hasher(algorithm)
+        one_shot.update(data)
+        assert checksum_file(tfile.name, algorithm, chunk_size=1000) == one_shot.hexdigest()
+
+def test_crc32_matches_zlib():
+    ha = new_hasher('crc32')
+    ha.update(b"ACGT")
+    ha.update(b"TTGA")
+    assert ha.hexdigest() == f"{zlib.crc32(b'ACGTTTGA'):08x}"
+
+def test_unknown_algorithm():
+    with raises(ValueError):
+        new_hasher('md4-but-worse')
+    with raises(ValueError):
+        HashingPool().configure(checksum_algorithm='md4-but-worse')
+
+def test_checksum_empty_file():
+    with NamedTemporaryFile() as tfile:
+        assert checksum_file(tfile.name) == hashlib.md5().hexdigest()
+
+@mark.asyncio
+async def test_pool_hashes_in_parallel_off_loop():
+    pool = HashingPool(workers=2, chunk_size=1024)
+    files = []
+    try:
+        for i in range(4):
+            tfile = NamedTemporaryFile()
+            tfile.write(bytes([i]) * 10000)
+            tfile.flush()
+            files.append(tfile)
+        digests = await asyncio.gather(*[pool.checksum(Path(f.name)) for f in files])
+        assert digests == [hashlib.md5(bytes([i]) * 10000).hexdigest() for i in range(4)]
+        assert not pool.in_progress
+    finally:
+        pool.shutdown()
+        [f.close() for f in files]
+
+def test_pool_configure_from_settings():
+    pool = HashingPool()
+    pool.configure(hashing_workers=7, hashing_chunk_size=123, checksum_algorithm='crc32', run_polling_interval=600)
+    assert pool.workers == 7
+    assert pool.chunk_size == 123
+    assert pool.algorithm == 'crc32'
+
+@mark.asyncio
+async def test_follow_then_finish_only_reads_appended_bytes():
+    pool = HashingPool(workers=1, chunk_size=1024)
+    try:
+        with NamedTemporaryFile(suffix='.fastq') as tfile:
+            tfile.write(b"ACGT" * 1000)
+            tfile.flush()
+            running = await pool.follow(1, tfile.name)
+            assert running.offset == 4000
+            tfile.write(b"TTGA" * 1000)
+            tfile.flush()
+            progress = []
+            with patch.object(pool, '_reporter', return_value=lambda r, t: progress.append(r)):
+                digest = await pool.finish(1, tfile.name)
+            assert digest == hashlib.md5(b"ACGT" * 1000 + b"TTGA" * 1000).hexdigest()
+            assert progress[0] > 4000 # resumed, didn't start over
+            assert 1 not in pool.running
+    finally:
+        pool.shutdown()
+
+@mark.asyncio
+async def test_crc32_resumes_from_persisted_state():
+    pool = HashingPool(workers=1, algorithm='crc32')
+    try:
+        with NamedTemporaryFile(suffix='.fastq') as tfile:
+            tfile.write(b"ACGT" * 1000)
+            tfile.flush()
+            running = await pool.follow(1, tfile.name)
+            offset, state = running.offset, running.state
+            pool.forget(1) # as if the service restarted
+            tfile.write(b"TTGA")
+            tfile.flush()
+            assert await pool.finish(1, tfile.name, offset, state, 'crc32') == f"{zlib.crc32(b'ACGT' * 1000 + b'TTGA'):08x}"
+            # state from some other algorithm is ignored
+            assert await pool.finish(2, tfile.name, offset, b"junk", 'crc32c') == f"{zlib.crc32(b'ACGT' * 1000 + b'TTGA'):08x}"
+    finally:
+        pool.shutdown()
+
+@mark.asyncio
+async def test_follow_restarts_on_truncation():
+    pool = HashingPool(workers=1)
+    try:
+        with NamedTemporaryFile(suffix='.fastq') as tfile:
+            tfile.write(b"ACGT" * 1000)
+            tfile.flush()
+            await pool.follow(1, tfile.name)
+            tfile.seek(0)
+            tfile.truncate()
+            tfile.write(b"TTGA")
+            tfile.flush()
+            assert await pool.finish(1, tfile.name) == hashlib.md5(b"TTGA").hexdigest()
+    finally:
+        pool.shutdown()
+
+@mark.asyncio
+async def test_files_that_may_be_rewritten_are_hashed_from_scratch():
+    pool = HashingPool(workers=1)
+    try:
+        with NamedTemporaryFile(suffix='.txt') as tfile:
+            tfile.write(b"ACGT" * 1000)
+            tfile.flush()
+            await pool.follow(1, tfile.name)
+            tfile.seek(0)
+            tfile.write(b"TTGA") # rewritten in place, same size
+            tfile.flush()
+            assert await pool.finish(1, tfile.name, 4000) == hashlib.md5(b"TTGA" + b"ACGT" * 999).hexdigest()
+    finally:
+        pool.shutdown()
@@ -1,3 +1,5 @@
+import json
+
 from tests import paths
 
 # from unittest import TestCase, skip
@@ -6,6 +8,7 @@ from unittest.mock import patch, AsyncMock
 from pytest import mark
 
 from porerefiner import cli
+from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import Run as RunMessage, RunView
 from click.testing import CliRunner
 
 
@@ -34,6 +37,9 @@ def test_untag_h():
 def test_load_h():
     help_runner(cli.load)
 
+def test_poll_h():
+    help_runner(cli.poll)
+
 def test_test_plugins_h():
     help_runner(cli.test_plugins)
 
@@ -71,3 +77,28 @@ def test_untag_invokes_runner(mock):
     _, kwargs = mock.call_args
     assert kwargs.get("untag") is True
 
+
+
+@patch("porerefiner.cli.server")
+def test_ps_streams_runs(mock):
+    requests = []
+    async def fake_stream(client, request):
+        requests.append(request)
+        for i in (1, 2):
+            yield RunMessage(id=i, name=f"run_{i}")
+    with patch("porerefiner.cli.stream_runs", fake_stream):
+        result = ps("-j", "--verify", "--all")
+    assert result.exit_code == 0, result.output
+    assert requests[0].verify and requests[0].all
+    assert [run["id"] for run in json.loads(result.output)] == [1, 2]
+    assert requests[0].view == RunView.FULL
+    with patch("porerefiner.cli.stream_runs", fake_stream):
+        result = ps()
+    assert result.exit_code == 0, result.output
+    assert requests[1].view == RunView.SUMMARY, "table without -e should only ask for summaries"
+
+@patch("porerefiner.cli.server")
+def test_ps_rejects_bad_tag_query(mock):
+    result = ps("--tag", "TEST AND")
+    assert result.exit_code == 2
+    assert "tag query" in result.output
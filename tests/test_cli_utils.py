@@ -1,5 +1,6 @@
 "Tests for cli_utils helpers and output formatters."
 
+import json
 from pathlib import Path
 
 import click
@@ -67,3 +68,26 @@ def test_hr_formatter_smoke():
 def test_json_formatter_smoke():
     with cli_utils.json_formatter() as fmt:
         assert callable(fmt)
+
+
+def test_json_formatter_streams_valid_json(capsys):
+    from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import Run
+    runs = [Run(id=i, name=f"run_{i}", tags=["a"]) for i in range(3)]
+    with cli_utils.json_formatter() as fmt:
+        for run in runs:
+            fmt(run)
+    assert capsys.readouterr().out == json.dumps(runs, cls=cli_utils.MessageAwareEncoder, indent=2) + "\n"
+    with cli_utils.json_formatter() as fmt:
+        pass
+    assert json.loads(capsys.readouterr().out) == []
+
+
+def test_hr_formatter_prints_in_pages(capsys):
+    from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import Run
+    with cli_utils.hr_formatter(page_size=2) as fmt:
+        for i in range(3):
+            fmt(Run(id=i, name=f"run_{i}"))
+            if i == 1:
+                assert capsys.readouterr().out == "" # page not full yet
+        assert "run_1" in capsys.readouterr().out # first page flushed when the third run arrived
+    assert "run_2" in capsys.readouterr().out
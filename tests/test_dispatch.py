@@ -0,0 +1,120 @@
+"Tests for the bounded job dispatcher."
+
+import asyncio
+
+from unittest.mock import patch
+
+from pytest import mark
+
+from tests import db, Submitter
+
+from porerefiner import models
+from porerefiner.dispatch import JobDispatcher
+from porerefiner.jobs import CONFIGURED_JOB_REGISTRY, JOBS, FileJob, RunJob
+
+
+class RecordingSubmitter(Submitter):
+    "Takes a while to submit, remembering what it was given and how many submissions overlapped"
+
+    def __init__(self, concurrency=None, max_batch=1, fail_on=()):
+        self.concurrency = concurrency
+        self.max_batch = max_batch
+        self.fail_on = set(fail_on)
+        self.batches = []
+        self.running = self.most_running = 0
+
+    async def _submit_many(self, jobs):
+        self.batches.append([job.id for job in jobs])
+        self.running += 1
+        self.most_running = max(self.running, self.most_running)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.running -= 1
+        return [RuntimeError("scheduler said no") if job.id in self.fail_on else None for job in jobs]
+
+class DispatchedFileJob(FileJob):
+    def run(self, run, file, datadir, remotedir):
+        yield "true"
+
+class DispatchedRunJob(RunJob):
+    def run(self, run, datadir, remotedir):
+        yield "true"
+
+
+def configure(submitter):
+    "Configure a file job and a run job on the submitter, without leaving them in the job lists."
+    file_job, run_job = DispatchedFileJob(submitter=submitter), DispatchedRunJob(submitter=submitter)
+    JOBS.FILES.remove(file_job)
+    JOBS.RUNS.remove(run_job)
+    return file_job, run_job
+
+def file_duties(job, run, count):
+    return [models.File.create(path=f"{run.path}/{i}.fastq", run=run).spawn(job) for i in range(count)]
+
+
+@mark.asyncio
+async def test_concurrency_is_bounded_per_submitter(db):
+    submitter = RecordingSubmitter(concurrency=3)
+    with patch.dict(CONFIGURED_JOB_REGISTRY):
+        file_job, _ = configure(submitter)
+        run = models.Run.create(name="run", path="/TEST/run")
+        duties = file_duties(file_job, run, 20)
+        dispatcher = JobDispatcher(concurrency=8)
+        assert await dispatcher.dispatch(duties) == 20
+    assert submitter.most_running == 3
+    assert dispatcher.stats()[repr(submitter)] == dict(limit=3, queued=0, running=0, submitted=20, failed=0)
+
+@mark.asyncio
+async def test_run_jobs_first_then_runs_take_turns(db):
+    submitter = RecordingSubmitter(concurrency=1)
+    with patch.dict(CONFIGURED_JOB_REGISTRY):
+        file_job, run_job = configure(submitter)
+        big, small = models.Run.create(name="big", path="/TEST/big"), models.Run.create(name="small", path="/TEST/small")
+        big_files, small_files = file_duties(file_job, big, 4), file_duties(file_job, small, 2)
+        run_duty = small.spawn(run_job)
+        assert await JobDispatcher().dispatch(big_files + small_files + [run_duty]) == 7
+    order = [batch[0] for batch in submitter.batches]
+    assert order == [run_duty.id,
+                     big_files[0].id, small_files[0].id,
+                     big_files[1].id, small_files[1].id,
+                     big_files[2].id, big_files[3].id]
+
+@mark.asyncio
+async def test_batches_up_to_max_batch(db):
+    submitter = RecordingSubmitter(max_batch=4)
+    with patch.dict(CONFIGURED_JOB_REGISTRY):
+        file_job, _ = configure(submitter)
+        duties = file_duties(file_job, models.Run.create(name="run", path="/TEST/run"), 10)
+        assert await JobDispatcher().dispatch(duties) == 10
+    assert [len(batch) for batch in submitter.batches] == [4, 4, 2]
+
+@mark.asyncio
+async def test_failures_are_isolated_and_retried(db):
+    with patch.dict(CONFIGURED_JOB_REGISTRY):
+        submitter = RecordingSubmitter()
+        file_job, _ = configure(submitter)
+        duties = file_duties(file_job, models.Run.create(name="run", path="/TEST/run"), 5)
+        submitter.fail_on = {duties[2].id}
+        dispatcher = JobDispatcher(max_attempts=2)
+        assert await dispatcher.dispatch(duties) == 4
+        failed = models.Duty.get_by_id(duties[2].id)
+        assert (failed.status, failed.attempts) == ('READY', 1)
+        assert await dispatcher.dispatch([failed]) == 0
+    assert models.Duty.get_by_id(duties[2].id).status == 'FAILED'
+    assert dispatcher.stats()[repr(submitter)]['failed'] == 2
+
+@mark.asyncio
+async def test_one_failure_in_a_batch_resets_only_that_duty(db):
+    with patch.dict(CONFIGURED_JOB_REGISTRY):
+        submitter = RecordingSubmitter(max_batch=4)
+        file_job, _ = configure(submitter)
+        duties = file_duties(file_job, models.Run.create(name="run", path="/TEST/run"), 4)
+        async def submit_many(jobs):
+            for job in jobs[:2]:
+                job.job_id, job.status = f"job {job.id}", 'RUNNING'
+                job.save()
+            raise RuntimeError("lost the connection after two") # the first two are already on the cluster
+        with patch.object(submitter, '_submit_many', submit_many):
+            assert await JobDispatcher().dispatch(duties) == 2
+    assert [(duty.status, duty.attempts) for duty in models.Duty.select().order_by(models.Duty.id)] == [('RUNNING', 0), ('RUNNING', 0), ('READY', 1), ('READY', 1)]
@@ -41,3 +41,94 @@ def test_template_route(client):
     resp = client.get('/template')
     assert resp.status_code == 200
     assert b'porerefiner_ver' in resp.data
+
+
+class FakeService:
+    "A porerefiner service answering GetRuns on a unix socket, on its own event loop thread."
+
+    def __init__(self, socket):
+        import asyncio, threading
+        from grpclib.server import Server
+        from porerefiner.protocols.porerefiner.rpc.porerefiner_grpc import PoreRefinerBase
+        from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import RunListResponse, RunList, Run
+        self.calls = 0
+        async def GetRuns(_, stream):
+            await stream.recv_message()
+            self.calls += 1
+            await stream.send_message(RunListResponse(runs=RunList(runs=[Run(id=1, name="run_1")])))
+        async def unimplemented(_, stream):
+            raise NotImplementedError
+        handler = type('Fake', (PoreRefinerBase,), {**{name: unimplemented for name in PoreRefinerBase.__abstractmethods__}, 'GetRuns': GetRuns})()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.protocols = []
+        async def starter():
+            self.server = Server([handler]) # binds to the running loop
+            factory = self.server._protocol_factory
+            def tracking_factory():
+                self.protocols.append(factory())
+                return self.protocols[-1]
+            self.server._protocol_factory = tracking_factory
+            await self.server.start(path=socket)
+        asyncio.run_coroutine_threadsafe(starter(), self.loop).result(5)
+
+    def stop(self):
+        import asyncio
+        async def stopper(): # as if the service had exited, dropping its connections
+            self.server.close()
+            for protocol in self.protocols:
+                protocol.connection._transport.close()
+            await self.server.wait_closed()
+        asyncio.run_coroutine_threadsafe(stopper(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+
+
+def test_views_share_one_channel(client):
+    from tempfile import TemporaryDirectory
+    from porerefiner.app import app
+    from porerefiner.app.client import service
+    with TemporaryDirectory() as t:
+        app.config['socket'] = f"{t}/porerefiner.sock"
+        fake = FakeService(app.config['socket'])
+        try:
+            for _ in range(3):
+                resp = client.get('/api/runs')
+                assert resp.status_code == 200
+                assert b'run_1' in resp.data
+            channel = service(app)._channel
+            assert fake.calls == 3 and channel is not None
+            fake.stop()
+            fake = FakeService(app.config['socket']) # service restarted; the client should reconnect
+            assert client.get('/api/runs').status_code == 200
+            assert fake.calls == 1
+        finally:
+            fake.stop()
+            app.extensions.pop('porerefiner').close()
+            app.config['socket'] = None
+
+
+def test_run_list_request_from_query_string():
+    from werkzeug.datastructures import MultiDict
+    from porerefiner.app.client import run_list_request
+    req = run_list_request(MultiDict([('status', 'DONE'), ('status', ''), ('tags', 'x'), ('after', '2024-01-02'), ('sort', 'started'), ('desc', 'true')]), limit=10, offset=20)
+    assert list(req.status) == ['DONE'] and list(req.tags) == ['x']
+    assert req.order_by == 'started' and req.descending
+    assert (req.limit, req.offset) == (10, 20)
+    assert req.HasField('started_after') and not req.HasField('started_before')
+
+
+def test_view_requests_one_page(client):
+    from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import RunListResponse, RunList, Run, RunView
+    with patch('porerefiner.app.page.service') as service:
+        service.return_value.call.return_value = RunListResponse(runs=RunList(runs=[Run(id=7, name="run_7", sample_count=3)], total=120))
+        resp = client.get('/view?page=2&status=DONE')
+        assert resp.status_code == 200
+        method, req = service.return_value.call.call_args.args
+        assert method == 'GetRuns'
+        assert (req.limit, req.offset, req.descending, req.view) == (50, 50, True, RunView.SUMMARY)
+        assert list(req.status) == ['DONE']
+        assert b'page 2 of 3' in resp.data
+        assert b'page=3' in resp.data and b'page=1' in resp.data
+        assert client.get('/view?after=yesterday').status_code == 400
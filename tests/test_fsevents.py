@@ -1,4 +1,4 @@
-from tests import fsevents, db
+from tests import fsevents, db, Event
 
 
 from unittest.mock import Mock, patch, AsyncMock
@@ -6,11 +6,12 @@ from unittest.mock import Mock, patch, AsyncMock
 from pytest import mark
 
 # from mock import AsyncMock
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 from pathlib import Path
+from datetime import datetime, timedelta
 
-from porerefiner.fsevents import PoreRefinerFSEventHandler as Handler, end_file, end_run, register_new_run
-from porerefiner.models import Run, Tag, TripleTag, File
+from porerefiner.fsevents import PoreRefinerFSEventHandler as Handler, end_file, end_run, register_new_run, MODIFICATIONS, PATHS, PathIndex, reconcile_run_directories, follow_growing_files, ActivityWatch, RUN_ACTIVITY, FILE_ACTIVITY, poll_active_run
+from porerefiner.models import Run, Tag, TripleTag, File, TagJunction
 from porerefiner.cli_utils import relativize_path as r
 
 from hypothesis import given, settings, note
@@ -24,6 +25,7 @@ import hypothesis.strategies as strat
 @given(event=fsevents(min_deep=4, isDirectory=True).filter(lambda e: len(e.src_path.parts) > 3)) #three levels deepl plus one
 @mark.asyncio
 async def test_on_created_run(db, event):
+    PATHS.clear() # mocked runs mustn't be served from the index across examples
     with patch('porerefiner.fsevents.Run') as run:
         assert len(event.src_path.parts) > 2
         note(event.src_path)
@@ -39,6 +41,7 @@ async def test_on_created_run(db, event):
 # @with_database
 @mark.asyncio
 async def test_on_created_file(db, event):
+    PATHS.clear()
     with patch('porerefiner.fsevents.Run') as run:
         with patch('porerefiner.fsevents.File') as file:
             assert len(event.src_path.parts) > 3
@@ -68,3 +71,207 @@ async def test_end_file(file=Mock()):
         file.path = Path(tfile.name)
     await end_file(file)
     file.save.assert_called()
+    assert file.checksum == "d41d8cd98f00b204e9800998ecf8427e" # md5 of an empty file
+
+@mark.asyncio
+async def test_on_modified_coalesces_until_flush(db):
+    with NamedTemporaryFile() as tfile:
+        path = Path(tfile.name)
+        then = datetime.now() - timedelta(hours=2)
+        fi = File.create(path=path, last_modified=then)
+        handler = Handler(path.parent)
+        for _ in range(10):
+            await handler.on_modified(Event(path, False))
+        assert len(MODIFICATIONS) == 1
+        assert File.get_by_id(fi.id).last_modified == then # not yet written
+        assert MODIFICATIONS.flush() == 1
+        assert File.get_by_id(fi.id).last_modified > then
+        assert len(MODIFICATIONS) == 0
+
+@mark.asyncio
+async def test_flushed_files_are_hashed_as_they_grow(db):
+    from porerefiner.checksums import HASHING
+    import zlib
+    with NamedTemporaryFile(suffix='.fastq') as tfile, patch.object(HASHING, 'algorithm', 'crc32'):
+        path = Path(tfile.name)
+        tfile.write(b"ACGT" * 100)
+        tfile.flush()
+        fi = File.create(path=path)
+        await Handler(path.parent).on_modified(Event(path, False))
+        MODIFICATIONS.flush()
+        assert await follow_growing_files(MODIFICATIONS.take_grown()) == 1
+        fi = File.get_by_id(fi.id)
+        assert fi.hashed_bytes == 400
+        assert fi.size == 400
+        assert fi.checksum_algorithm == 'crc32'
+        tfile.write(b"TTGA")
+        tfile.flush()
+        await end_file(fi)
+        assert File.get_by_id(fi.id).checksum == f"{zlib.crc32(b'ACGT' * 100 + b'TTGA'):08x}"
+
+@mark.asyncio
+async def test_growing_files_all_get_their_size_recorded(db):
+    with TemporaryDirectory() as t:
+        fastq, pod5 = Path(t) / "reads.fastq", Path(t) / "reads.pod5"
+        files = [File.create(path=path) for path in (fastq, pod5)]
+        for path in (fastq, pod5):
+            path.write_bytes(b"ACGT" * 250)
+            await Handler(Path(t)).on_modified(Event(path, False))
+        MODIFICATIONS.flush()
+        assert await follow_growing_files(MODIFICATIONS.take_grown()) == 2
+        fastq_file, pod5_file = [File.get_by_id(fi.id) for fi in files]
+        assert (fastq_file.size, fastq_file.hashed_bytes) == (1000, 1000)
+        assert (pod5_file.size, pod5_file.hashed_bytes) == (1000, 0) # hashed once it goes quiet
+
+@mark.asyncio
+async def test_on_modified_flushes_at_buffer_size(db):
+    with TemporaryDirectory() as t:
+        then = datetime.now() - timedelta(hours=2)
+        files = [File.create(path=Path(t) / f"file_{i}", last_modified=then) for i in range(3)]
+        handler = Handler(Path(t))
+        MODIFICATIONS.max_pending = 3
+        try:
+            for fi in files:
+                await handler.on_modified(Event(fi.path, False))
+        finally:
+            MODIFICATIONS.max_pending = 1000
+        assert len(MODIFICATIONS) == 0
+        assert all(f.last_modified > then for f in File.select())
+
+@mark.asyncio
+async def test_on_deleted_discards_pending_modification(db):
+    with NamedTemporaryFile() as tfile:
+        path = Path(tfile.name)
+        File.create(path=path)
+        handler = Handler(path.parent)
+        await handler.on_modified(Event(path, False))
+        assert path in MODIFICATIONS
+        await handler.on_deleted(Event(path, False))
+        assert path not in MODIFICATIONS
+
+def test_path_index_evicts_least_recently_used():
+    index = PathIndex(max_files=2)
+    index.add_file("/a", 1)
+    index.add_file("/b", 2)
+    assert index.file_id("/a") == 1 # /a is now most recent
+    index.add_file("/c", 3)
+    assert index.file_id("/b") is None
+    assert index.file_id(Path("/a")) == 1
+    assert index.file_id("/c") == 3
+
+@mark.asyncio
+async def test_indexed_events_skip_database_lookups(db):
+    with TemporaryDirectory() as t:
+        base = Path(t)
+        run_dir = base / "EXP" / "SAMPLE" / "20240101_dev_fc_run"
+        run_dir.mkdir(parents=True)
+        handler = Handler(base)
+        first, second = run_dir / "read_0.fastq", run_dir / "read_1.fastq"
+        await handler.on_created(Event(first, False))
+        with patch.object(Run, 'get_or_create') as run_lookup, patch.object(File, 'get_or_none') as file_lookup:
+            await handler.on_created(Event(second, False))
+            await handler.on_modified(Event(first, False))
+            run_lookup.assert_not_called()
+            file_lookup.assert_not_called()
+        assert File.select().where(File.run == Run.get().id).count() == 2
+        assert first in MODIFICATIONS
+
+@mark.asyncio
+async def test_reconcile_registers_missing_runs_and_files(db):
+    with TemporaryDirectory() as t:
+        base = Path(t)
+        run_dir = base / "EXP" / "SAMPLE" / "20240101_dev_fc_prot"
+        for sub in ("fastq_pass", "fastq_fail", "_porerefiner_results"):
+            (run_dir / sub).mkdir(parents=True)
+            for i in range(5):
+                (run_dir / sub / f"read_{i}.fastq").write_text("data")
+        handler = Handler(base)
+        await handler.on_created(Event(run_dir / "fastq_pass" / "read_0.fastq", False))
+        assert await reconcile_run_directories(base, reconcile_chunk_size=3) == 9
+        run = Run.get()
+        assert run.flowcell == "fc"
+        assert File.select().count() == 10
+        assert not File.select().where(File.path.contains('_porerefiner')).count()
+        assert TagJunction.select().join(Tag).where(Tag.name == 'fastq_fail').count() == 5
+        assert Tag.select().where(Tag.name == 'fastq_pass').count() == 1
+        assert await reconcile_run_directories(base) == 0 # idempotent
+        assert File.get(File.path == run_dir / "fastq_fail" / "read_0.fastq").size == 4
+        (run_dir / "fastq_fail" / "read_0.fastq").unlink()
+        await reconcile_run_directories(base)
+        assert not File.get(File.path == run_dir / "fastq_fail" / "read_0.fastq").present
+
+@mark.asyncio
+async def test_reconcile_leaves_ended_runs_alone(db):
+    with TemporaryDirectory() as t:
+        base = Path(t)
+        run_dir = base / "EXP" / "SAMPLE" / "20240101_dev_fc_prot"
+        (run_dir / "fastq_pass").mkdir(parents=True)
+        (run_dir / "fastq_pass" / "read_0.fastq").write_text("data")
+        Run.create(name=run_dir.name, path=run_dir, status='DONE')
+        assert await reconcile_run_directories(base) == 0
+        assert File.select().count() == 0
+
+@mark.asyncio
+async def test_startup_marks_missing_files_absent(db):
+    from porerefiner.fsevents import in_progress_run_update
+    with TemporaryDirectory() as t:
+        run = Run.create(name="run", path=Path(t))
+        kept, gone = File.create(run=run, path=Path(t) / "kept.fastq"), File.create(run=run, path=Path(t) / "gone.fastq")
+        kept.path.write_text("data")
+        await in_progress_run_update()
+        assert [(fi.path.name, fi.present) for fi in File.select().order_by(File.id)] == [("kept.fastq", True), ("gone.fastq", False)]
+
+def test_activity_watch_pops_only_quiet_keys():
+    watch = ActivityWatch(quiet_period=timedelta(hours=1))
+    start = datetime(2024, 1, 1)
+    watch.touch('a', start)
+    watch.touch('b', start)
+    watch.touch('b', start + timedelta(minutes=30)) # moved watermark, same heap entry
+    watch.touch('a', start - timedelta(hours=3)) # older times never move a watermark back
+    assert watch.pop_quiet(start + timedelta(minutes=59)) == []
+    assert watch.pop_quiet(start + timedelta(hours=1)) == ['a']
+    assert watch.next_deadline() == start + timedelta(minutes=90)
+    assert watch.pop_quiet(start + timedelta(minutes=90)) == ['b']
+    assert len(watch) == 0 and watch.next_deadline() is None
+
+@mark.asyncio
+async def test_poll_ends_quiet_runs_from_watermarks(db):
+    with TemporaryDirectory() as t:
+        then = datetime.now() - timedelta(hours=2)
+        quiet, busy = Run.create(name="quiet", path=Path(t) / "quiet"), Run.create(name="busy", path=Path(t) / "busy")
+        for run in (quiet, busy):
+            for i in range(3):
+                fi = File.create(run=run, path=Path(t) / f"{run.name}_{i}", last_modified=then)
+                FILE_ACTIVITY.touch(fi.id, then)
+                RUN_ACTIVITY.touch(run.id, then)
+        MODIFICATIONS.touch(Path(t) / "busy_0", File.get(File.path == Path(t) / "busy_0").id)
+        with patch('porerefiner.fsevents.end_file', new_callable=AsyncMock) as end_file_mock:
+            assert await poll_active_run() == 1
+        assert Run.get_by_id(quiet.id).status == 'DONE'
+        assert Run.get_by_id(busy.id).status == 'RUNNING'
+        assert end_file_mock.await_count == 5 # busy_0 is still being written
+        assert busy.id in RUN_ACTIVITY and quiet.id not in RUN_ACTIVITY
+
+@mark.asyncio
+async def test_poll_sweeps_unwatched_quiet_runs(db):
+    then = datetime.now() - timedelta(hours=2)
+    run = Run.create(name="unwatched", path="/unwatched")
+    File.create(run=run, path="/unwatched/read_0.fastq", last_modified=then)
+    with patch('porerefiner.fsevents.end_file', new_callable=AsyncMock) as end_file_mock:
+        assert await poll_active_run(sweep=False) == 0
+        assert await poll_active_run() == 1
+    end_file_mock.assert_awaited_once()
+    assert Run.get_by_id(run.id).status == 'DONE'
+
+@mark.asyncio
+async def test_ended_runs_arent_closed_again(db):
+    from porerefiner.fsevents import close_run
+    run = Run.create(name="ended", path="/ended", status='DONE', ended=datetime.now())
+    File.create(run=run, path="/ended/read_0.fastq")
+    with patch('porerefiner.fsevents.end_file', new_callable=AsyncMock) as end_file_mock, \
+         patch('porerefiner.fsevents.JOBS') as jobs:
+        jobs.RUNS = [object()]
+        await close_run(run)
+        await end_run(run)
+    end_file_mock.assert_not_awaited()
+    assert Run.get_by_id(run.id).duties.count() == 0
@@ -2,10 +2,18 @@ from types import SimpleNamespace
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
-from pytest import mark
+from pytest import mark, raises
+
+from tests import db, login_node # noqa: F401  (fixtures)
 
 from porerefiner.jobs.submitters import REGISTRY
-from porerefiner.jobs.submitters.hpc import HpcSubmitter
+from porerefiner import models
+from porerefiner.jobs import CONFIGURED_JOB_REGISTRY, JOBS, poll_active_jobs
+from porerefiner.dispatch import DISPATCHER
+from porerefiner.jobs.generic import GenericRunJob
+from porerefiner.jobs.submitters import GENERATORS
+from porerefiner.jobs.submitters.hpc import HpcSubmitter, SCHEDULERS, job_key, parse_job_states
+from porerefiner.sshpool import SshPool
 
 
 def make_submitter():
@@ -44,9 +52,192 @@ async def test_begin_job_builds_qsub():
 @mark.asyncio
 async def test_poll_job_running_then_done():
     sub = make_submitter()
+    sub.status_ttl = 0 # ask the scheduler every time
     job = SimpleNamespace(job_id="12345")
     with patch.object(sub, 'send', new_callable=AsyncMock) as send:
         send.return_value = "job-ID  prior   name   ...\n12345  0.5  myjob  r"
         assert await sub.poll_job(job) == 'RUNNING'
         send.return_value = "no active jobs"
         assert await sub.poll_job(job) == 'DONE'
+
+
+@mark.asyncio
+async def test_submitter_reuses_one_connection(login_node):
+    sub = HpcSubmitter(login_host="127.0.0.1",
+                       username="tester",
+                       private_key_path=login_node.private_key_path,
+                       known_hosts_path=login_node.known_hosts_path,
+                       port=login_node.port)
+    pool = SshPool()
+    with patch('porerefiner.jobs.submitters.hpc.SSH_POOL', pool):
+        job = SimpleNamespace(job_id="1")
+        assert (await sub.begin_job("echo hi", "/tmp/d", "/scratch/d")).startswith("Your job 1")
+        for _ in range(200):
+            assert await sub.poll_job(job) == 'RUNNING'
+    assert login_node.commands[1:] == ['qstat -xml'] # polls within the TTL share one status call
+    assert len(login_node.connections) == 1
+    await pool.close()
+
+
+@mark.parametrize("scheduler,output,states", [
+    ("uge",
+     "<?xml version='1.0'?><job_info><queue_info><job_list state='running'><JB_job_number>7</JB_job_number><state>r</state></job_list></queue_info>"
+     "<job_info><job_list state='pending'><JB_job_number>8</JB_job_number><state>Eqw</state></job_list>"
+     "<job_list state='pending'><JB_job_number>8</JB_job_number><state>qw</state></job_list></job_info></job_info>",
+     {"7": "r", "8": "Eqw"}),
+    ("uge",
+     "<?xml version='1.0'?><job_info><queue_info><job_list state='running'><JB_job_number>9</JB_job_number><state>r</state><tasks>2</tasks></job_list></queue_info>"
+     "<job_info><job_list state='pending'><JB_job_number>9</JB_job_number><state>qw</state><tasks>3-7:2</tasks></job_list></job_info></job_info>",
+     {"9": "r", "9.2": "r", "9.3": "qw", "9.5": "qw", "9.7": "qw"}),
+    ("uge", "job-ID  prior   name   user   state\n-----\n12345  0.5  myjob  tester  r", {"12345": "r"}),
+    ("slurm", "101 R\n102_3 PD\n103 F", {"101": "R", "102": "PD", "102.3": "PD", "103": "F"}),
+    ("pbs", "Job id            Name             User              Time Use S Queue\n----------------  ---------------- ----------------  -------- - -----\n"
+            "31[].server       STDIN            tester                   0 B workq\n31[1].server      STDIN            tester            00:00:01 R workq\n"
+            "32.server         STDIN            tester                   0 Q workq",
+     {"31": "B", "31.1": "R", "32": "Q"}),
+    ("slurm", "", {}),
+])
+def test_parse_job_states(scheduler, output, states):
+    assert parse_job_states(output, scheduler) == states
+
+
+@mark.parametrize("scheduler,output,codes", [
+    ("uge", "==============================================================\njobnumber    9\ntaskid       1\nexit_status  0\n"
+            "==============================================================\njobnumber    9\ntaskid       2\nexit_status  137\n",
+     {"9.1": 0, "9.2": 137}),
+    ("uge", "==============================================================\njobnumber    7\ntaskid       undefined\nexit_status  1\n", {"7": 1}),
+    ("slurm", "101|0:0\n102_1|0:0\n102_2|2:0", {"101": 0, "102.1": 0, "102.2": 2}),
+    ("pbs", "Job Id: 31[1].server\n    Job_Name = STDIN\n    Exit_status = 0\n\nJob Id: 31[2].server\n    Exit_status = 3\n", {"31.1": 0, "31.2": 3}),
+])
+def test_parse_exit_codes(scheduler, output, codes):
+    assert SCHEDULERS[scheduler].parse_exit_codes(output) == codes
+
+
+def test_unknown_scheduler():
+    with raises(ValueError):
+        HpcSubmitter(login_host="login.test", username="tester", private_key_path="/dev/null", known_hosts_path="/dev/null", scheduler="lsf")
+
+
+def test_array_script():
+    assert SCHEDULERS['slurm'].script(["echo a", "NCORES=4 echo b"]) == "#!/bin/sh\ncase $SLURM_ARRAY_TASK_ID in\n1) echo a ;;\n2) NCORES=4 echo b ;;\nesac\n"
+
+
+@mark.asyncio
+async def test_jobs_polled_in_one_batch(db, login_node):
+    sub = HpcSubmitter(login_host="127.0.0.1",
+                       username="tester",
+                       private_key_path=login_node.private_key_path,
+                       known_hosts_path=login_node.known_hosts_path,
+                       port=login_node.port)
+    pool = SshPool()
+    login_node.jobs = 50
+    login_node.states[2] = 'Eqw'
+    login_node.finished.add(3)
+    run = models.Run.create(name="run", path="/TEST/run")
+    with patch('porerefiner.jobs.submitters.hpc.SSH_POOL', pool), patch.dict(CONFIGURED_JOB_REGISTRY):
+        job = GenericRunJob(submitter=sub, commands=["true"])
+        JOBS.RUNS.remove(job)
+        duties = [models.Duty.create(job_class='GenericRunJob', run=run, status='RUNNING', step=1, datadir='/tmp', job_id=f'Your job {i} ("STDIN") has been submitted')
+                  for i in range(1, 51)]
+        assert await poll_active_jobs(duties) == 50
+    assert login_node.commands == ['qstat -xml', 'qacct -j 3'] # exit codes only for the job that's gone
+    statuses = {duty.id: duty.status for duty in models.Duty.select()}
+    assert [statuses[duty.id] for duty in duties[:4]] == ['RUNNING', 'FAILED', 'DONE', 'RUNNING']
+    await pool.close()
+
+
+async def submit_array(login_node, pool, commands):
+    "Submit three run duties for a job with these commands to the fake login node; returns the duties."
+    sub = HpcSubmitter(login_host="127.0.0.1",
+                       username="tester",
+                       private_key_path=login_node.private_key_path,
+                       known_hosts_path=login_node.known_hosts_path,
+                       port=login_node.port,
+                       status_ttl=0)
+    job = GenericRunJob(submitter=sub, commands=commands)
+    JOBS.RUNS.remove(job)
+    duties = [models.Run.create(name=f"run{i}", path=f"/TEST/run{i}").spawn(job) for i in range(3)]
+    assert await DISPATCHER.dispatch(duties) == 3
+    return duties
+
+
+@mark.asyncio
+async def test_duties_submitted_as_one_array_job(db, login_node):
+    pool = SshPool()
+    with patch.dict(CONFIGURED_JOB_REGISTRY), patch('porerefiner.jobs.submitters.hpc.SSH_POOL', pool):
+        duties = await submit_array(login_node, pool, ["echo {run.name}"])
+        assert login_node.commands == ['qsub -q long.q -t 1-3']
+        assert "2) echo run1 ;;" in login_node.scripts[0]
+        assert [duty.job_id for duty in duties] == ["1.1", "1.2", "1.3"]
+        assert await poll_active_jobs(duties) == 3
+        assert [duty.status for duty in duties] == ['RUNNING'] * 3
+        login_node.finished.add(1)
+        login_node.exit_codes.update({(1, 1): 0, (1, 2): 1, (1, 3): 0})
+        assert await poll_active_jobs(duties) == 3
+    statuses = {duty.id: duty.status for duty in models.Duty.select()}
+    assert [statuses[duty.id] for duty in duties] == ['DONE', 'FAILED', 'DONE'] # exit codes per task
+    await pool.close()
+
+
+@mark.asyncio
+async def test_array_tasks_go_on_to_their_next_step(db, login_node):
+    pool = SshPool()
+    with patch.dict(CONFIGURED_JOB_REGISTRY), patch('porerefiner.jobs.submitters.hpc.SSH_POOL', pool):
+        duties = await submit_array(login_node, pool, ["echo {run.name}", "echo again"])
+        login_node.finished.add(1)
+        login_node.exit_codes.update({(1, 1): 0, (1, 2): 1, (1, 3): 0})
+        assert await poll_active_jobs(duties) == 3
+        assert [(duty.status, duty.step, job_key(duty.job_id)) for duty in duties] == [('RUNNING', 2, '2'), ('FAILED', 1, '1.2'), ('RUNNING', 2, '3')]
+        assert login_node.commands[-2:] == ['echo "echo again" | qsub -q long.q'] * 2
+        GENERATORS.clear() # as after a restart
+        login_node.finished.update({2, 3})
+        assert await poll_active_jobs([duties[0], duties[2]]) == 2
+        assert [duty.status for duty in duties] == ['DONE', 'FAILED', 'DONE']
+    await pool.close()
+
+
+@mark.asyncio
+async def test_jobs_submitted_after_a_status_call_arent_missing_from_it(db, login_node):
+    pool = SshPool()
+    sub = HpcSubmitter(login_host="127.0.0.1",
+                       username="tester",
+                       private_key_path=login_node.private_key_path,
+                       known_hosts_path=login_node.known_hosts_path,
+                       port=login_node.port,
+                       status_ttl=60)
+    with patch.dict(CONFIGURED_JOB_REGISTRY), patch('porerefiner.jobs.submitters.hpc.SSH_POOL', pool):
+        job = GenericRunJob(submitter=sub, commands=["true"])
+        JOBS.RUNS.remove(job)
+        first, second = [models.Run.create(name=f"run{i}", path=f"/TEST/run{i}").spawn(job) for i in range(2)]
+        assert await DISPATCHER.dispatch([first]) == 1
+        assert await poll_active_jobs([first]) == 1
+        assert await DISPATCHER.dispatch([second]) == 1
+        assert await poll_active_jobs([first, second]) == 2
+        assert await poll_active_jobs([first, second]) == 2
+    assert [duty.status for duty in (first, second)] == ['RUNNING', 'RUNNING']
+    assert login_node.commands.count('qstat -xml') == 2 # refreshed once after the second submission, then cached
+    await pool.close()
+
+
+@mark.asyncio
+async def test_a_job_that_cant_start_doesnt_hold_up_the_array(db, login_node):
+    pool = SshPool()
+    sub = HpcSubmitter(login_host="127.0.0.1",
+                       username="tester",
+                       private_key_path=login_node.private_key_path,
+                       known_hosts_path=login_node.known_hosts_path,
+                       port=login_node.port)
+    with patch.dict(CONFIGURED_JOB_REGISTRY), patch('porerefiner.jobs.submitters.hpc.SSH_POOL', pool):
+        job = GenericRunJob(submitter=sub, commands=["echo {run.name}"])
+        JOBS.RUNS.remove(job)
+        duties = [models.Run.create(name=f"run{i}", path=f"/TEST/run{i}").spawn(job) for i in range(3)]
+        generator = sub._generator
+        def broken(duty):
+            if duty.id == duties[1].id:
+                raise KeyError("no such template field")
+            return generator(duty)
+        with patch.object(sub, '_generator', broken):
+            assert await DISPATCHER.dispatch(duties) == 2
+    assert login_node.commands == ['qsub -q long.q -t 1-2']
+    assert [(duty.status, duty.job_id, duty.attempts) for duty in duties] == [('RUNNING', '1.1', 0), ('READY', None, 1), ('RUNNING', '1.2', 0)] # retried next cycle
+    await pool.close()
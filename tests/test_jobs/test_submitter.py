@@ -1,10 +1,18 @@
 from tests import *
 
-from pytest import mark
+from pytest import mark, raises
 
 # from unittest import TestCase
 
 import porerefiner.jobs.submitters as subs
+import asyncio
+
+from unittest.mock import patch
+
+from porerefiner import models
+from porerefiner.jobs import CONFIGURED_JOB_REGISTRY, JOBS, RunJob
+from porerefiner.jobs.generic import GenericRunJob
+from porerefiner.jobs.submitters.local import LocalSubmitter
 
 from hypothesis import given
 
@@ -17,4 +25,77 @@ async def test_submit(db, job_rec, job_code, run):
     run.save()
     job_rec.run = run
     job_rec.save()
-    await job_code.submitter._submit(job_rec)
\ No newline at end of file
+    await job_code.submitter._submit(job_rec)
+
+@mark.asyncio
+async def test_local_job_advances_a_step_per_poll(db):
+    sub = LocalSubmitter()
+    with patch.dict(CONFIGURED_JOB_REGISTRY):
+        job = GenericRunJob(submitter=sub, commands=["true", "exit 3"])
+        JOBS.RUNS.remove(job)
+        duty = models.Run.create(name="run", path="/TEST/run").spawn(job)
+        await sub._submit(duty)
+        assert (duty.status, duty.step) == ('RUNNING', 1)
+        seen = []
+        for _ in range(500):
+            await asyncio.sleep(0.01)
+            await sub._poll(duty) # never waits on the process
+            seen.append((duty.status, duty.step))
+            if duty.status != 'RUNNING':
+                break
+    assert ('RUNNING', 2) in seen
+    assert (duty.status, duty.step, duty.last_result) == ('FAILED', 2, 3)
+
+@mark.asyncio
+async def test_status_call_errors_leave_jobs_running(db):
+    sub = LocalSubmitter()
+    with patch.dict(CONFIGURED_JOB_REGISTRY), patch.object(sub, 'poll_jobs', side_effect=OSError("scheduler unreachable")):
+        job = GenericRunJob(submitter=sub, commands=["true"])
+        JOBS.RUNS.remove(job)
+        duty = models.Duty.create(job_class='GenericRunJob', run=models.Run.create(name="run", path="/TEST/run"), status='RUNNING', step=1, datadir='/tmp', job_id="1")
+        with raises(OSError):
+            await sub._poll_many([duty])
+    assert models.Duty.get_by_id(duty.id).status == 'RUNNING'
+
+
+class SteppingSubmitter(Submitter):
+    "Finishes every step as soon as it's polled, with a result naming the step"
+
+    def __init__(self):
+        self.commands = []
+
+    async def begin_job(self, command, datadir, remotedir, environment_hints={}):
+        self.commands.append(command)
+        return str(len(self.commands))
+
+    async def poll_job(self, job):
+        return 'DONE'
+
+    async def closeout_job(self, job, datadir, remotedir):
+        return f"result{job.step}"
+
+class ThreeStepJob(RunJob):
+    def run(self, run, datadir, remotedir):
+        first = yield "one"
+        second = yield f"two {first}"
+        third = yield f"three {second}"
+        yield f"four {first} {second} {third}"
+
+@mark.asyncio
+async def test_restarted_jobs_get_every_earlier_result_back(db):
+    sub = SteppingSubmitter()
+    with patch.dict(CONFIGURED_JOB_REGISTRY):
+        job = ThreeStepJob(submitter=sub)
+        JOBS.RUNS.remove(job)
+        duty = models.Run.create(name="run", path="/TEST/run").spawn(job)
+        await sub._submit(duty)
+        await sub._poll(duty)
+        assert duty.step == 2
+        subs.GENERATORS.clear() # restarted after step 2 was submitted
+        await sub._poll(duty)
+        subs.GENERATORS.clear()
+        await sub._poll(duty)
+        await sub._poll(duty)
+    assert sub.commands == ["one", "two result1", "three result2", "four result1 result2 result3"]
+    duty = models.Duty.get_by_id(duty.id)
+    assert (duty.status, duty.results) == ('DONE', ["result1", "result2", "result3", "result4"])
@@ -0,0 +1,91 @@
+"Tests for following MinKNOW acquisitions, against a fake MinKNOW served locally by grpclib."
+
+import asyncio
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from grpclib.server import Server
+from pytest import mark
+
+from tests import db
+
+from porerefiner.minknow import MinknowListener, update_run_from_acquisition, start_minknow_listener
+from porerefiner.models import Run, File
+from porerefiner.protocols.minknow.rpc.manager_grpc import ManagerServiceBase
+from porerefiner.protocols.minknow.rpc.manager_pb2 import ListDevicesResponse
+from porerefiner.protocols.minknow.rpc.acquisition_grpc import AcquisitionServiceBase
+from porerefiner.protocols.minknow.rpc.acquisition_pb2 import AcquisitionRunInfo, AcquisitionState
+
+
+def fake(base, **methods):
+    "Concrete subclass of a generated service base; anything not given answers UNIMPLEMENTED."
+    async def unimplemented(self, stream):
+        from grpclib.const import Status
+        from grpclib.exceptions import GRPCError
+        raise GRPCError(Status.UNIMPLEMENTED)
+    return type(f"Fake{base.__name__}", (base,), {**{name: unimplemented for name in base.__abstractmethods__}, **methods})()
+
+def acquisition(run_id, state, reads_directory):
+    info = AcquisitionRunInfo(run_id=run_id, state=state)
+    info.config_summary.reads_directory = str(reads_directory)
+    info.start_time.GetCurrentTime()
+    return info
+
+@mark.asyncio
+async def test_acquisition_starts_and_ends_run(db):
+    with TemporaryDirectory() as t:
+        run_dir = Path(t) / "EXP" / "SAMPLE" / "20240101_dev_fc_prot"
+        run = await update_run_from_acquisition(acquisition("abc", AcquisitionState.ACQUISITION_RUNNING, run_dir / "fastq_pass"), t)
+        assert run.run_id == "abc"
+        assert run.status == 'RUNNING'
+        assert Run.select().count() == 1
+        await update_run_from_acquisition(acquisition("abc", AcquisitionState.ACQUISITION_COMPLETED, run_dir), t)
+        assert Run.get().status == 'DONE'
+        assert await update_run_from_acquisition(acquisition("xyz", AcquisitionState.ACQUISITION_RUNNING, "/elsewhere"), t) is None
+
+@mark.asyncio
+async def test_listener_follows_fake_minknow(db):
+    with TemporaryDirectory() as t:
+        run_dir = Path(t) / "EXP" / "SAMPLE" / "20240101_dev_fc_prot"
+        run_dir.mkdir(parents=True)
+        (run_dir / "read_0.fastq").write_text("ACGT")
+        finished = asyncio.Event()
+
+        async def list_devices(self, stream):
+            await stream.recv_message()
+            response = ListDevicesResponse()
+            device = response.active.add(name="X1")
+            device.ports.insecure_grpc = port
+            await stream.send_message(response)
+
+        async def watch_current_acquisition_run(self, stream):
+            await stream.recv_message()
+            await stream.send_message(acquisition("abc", AcquisitionState.ACQUISITION_RUNNING, run_dir))
+            await asyncio.sleep(0.05)
+            await stream.send_message(acquisition("abc", AcquisitionState.ACQUISITION_COMPLETED, run_dir))
+            finished.set()
+
+        server = Server([fake(ManagerServiceBase, list_devices=list_devices),
+                         fake(AcquisitionServiceBase, watch_current_acquisition_run=watch_current_acquisition_run)])
+        await server.start('127.0.0.1', 0)
+        port = server._server.sockets[0].getsockname()[1]
+        listener = MinknowListener(t, '127.0.0.1', port, retry_interval=0.01)
+        listener.start()
+        try:
+            await asyncio.wait_for(finished.wait(), 5)
+            for _ in range(100): # let the listener handle the last message
+                if Run.select().where(Run.status == 'DONE').count():
+                    break
+                await asyncio.sleep(0.01)
+            run = Run.get()
+            assert run.run_id == "abc"
+            assert run.status == 'DONE'
+        finally:
+            await listener.stop()
+            server.close()
+            await server.wait_closed()
+
+@mark.asyncio
+async def test_listener_is_optional():
+    assert await start_minknow_listener("/data", api=None) is None
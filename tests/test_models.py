@@ -13,10 +13,13 @@ from porerefiner.fsevents import PoreRefinerFSEventHandler as Handler
 from hypothesis import given, strategies as strat, example, seed, settings, HealthCheck
 #from hypothesis_fspaths import fspaths, _PathLike
 
-from datetime import datetime
+from datetime import datetime, timedelta
+import peewee
 import pathlib
 import sys
 
+from unittest.mock import patch
+
 
 
 # safe_paths = lambda: fspaths().filter(lambda x: isinstance(x, str) or isinstance(x, _PathLike))
@@ -186,6 +189,22 @@ def test_new_sheet_from_message(db, ss):
     s = models.SampleSheet.new_sheet_from_message(ss, run)
     assert run.sample_sheet == s
 
+def test_new_sheet_replaces_unused_sheet(db):
+    from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import SampleSheet as SheetMessage
+    sheet = SheetMessage(library_id="LIB", tags=["plate"])
+    for i in range(3):
+        sample = sheet.samples.add(sample_id=f"s{i}", barcode_id=f"NB0{i}")
+        sample.trip_tags.add(namespace="PR", name="well", value=f"A{i}")
+        sample.trip_tags.add(namespace="PR", name="plate", value="1")
+    old = models.SampleSheet.new_sheet_from_message(sheet)
+    stale = models.File.create(sample=old.samples[0], path="/stale.fastq")
+    new = models.SampleSheet.new_sheet_from_message(sheet)
+    assert [ss.id for ss in models.SampleSheet.select()] == [new.id]
+    assert [(sam.sample_id, sam.accession, sam.tags.PR.well) for sam in new.samples] == [(f"s{i}", f"SAM_{i:06}", f"A{i}") for i in range(3)]
+    assert [str(ta) for ta in new.tags] == ["plate"]
+    assert models.TTagJunction.select().count() == 6 and models.TagJunction.select().count() == 1
+    assert models.File.get_by_id(stale.id).sample is None
+
 
 #@mark.skip("hangs")
 @given(pk=sql_ints(),
@@ -283,4 +302,99 @@ async def test_tags_arent_deleted_on_file_deletion(db, tag, file_event, run):
     await Handler(event.src_path.parts[0]).on_deleted(event)
     assert models.File.get_or_none(models.File.path==event.src_path) is None # check file record is gone
     assert len(list(run.tags)) == 1
-    assert tag in run.tags
\ No newline at end of file
+    assert tag in run.tags
+
+def test_upgrade_tables_adds_new_columns(db):
+    "Databases created before a column was added get it on startup."
+    db.execute_sql('ALTER TABLE file DROP COLUMN checksum_algorithm')
+    assert 'checksum_algorithm' not in {c.name for c in db.get_columns('file')}
+    assert models.upgrade_tables() == 1
+    assert 'checksum_algorithm' in {c.name for c in db.get_columns('file')}
+    assert models.upgrade_tables() == 0
+
+def test_get_quiet_runs_includes_sample_files(db):
+    now = datetime.now()
+    old = now - timedelta(hours=2)
+    direct = models.Run.create(name="direct", path="/direct")
+    sampled = models.Run.create(name="sampled", path="/sampled")
+    sheet = models.SampleSheet.create()
+    sampled.sample_sheet = sheet
+    sampled.save()
+    sample = models.Sample.create(sample_id="s", barcode_id="b", samplesheet=sheet)
+    models.File.create(run=direct, path="/direct/1", last_modified=old)
+    models.File.create(run=sampled, path="/sampled/1", last_modified=old)
+    models.File.create(sample=sample, path="/sampled/2", last_modified=now) # still being written
+    models.Run.create(name="empty", path="/empty") # no files, never quiet
+    assert [(run_id, latest) for run_id, latest in models.Run.get_quiet_runs(now - timedelta(hours=1))] == [(direct.id, old)]
+    models.File.update(last_modified=old).execute()
+    assert {run_id for run_id, _ in models.Run.get_quiet_runs(now - timedelta(hours=1))} == {direct.id, sampled.id}
+
+def test_upgrade_tables_merges_duplicate_tags(db):
+    "Tags weren't unique before; older databases get their duplicates merged so the unique indexes can be built."
+    db.execute_sql('DROP INDEX tag_name')
+    db.execute_sql('DROP INDEX tripletag_namespace_name_value')
+    run = models.Run.create(name="TEST", path="/TEST")
+    other = models.Run.create(name="OTHER", path="/OTHER")
+    for owner in (run, other):
+        tag = models.Tag.create(name="dupe")
+        models.TagJunction.create(tag=tag, run=owner)
+        ttag = models.TripleTag.create(namespace="ONT", name="device", value="X1")
+        models.TTagJunction.create(tag=ttag, run=owner)
+    models.upgrade_tables()
+    assert models.Tag.select().count() == 1
+    assert models.TripleTag.select().count() == 1
+    assert sorted(run.name for run in models.Run.get_by_tags("dupe AND ONT:device=X1")) == ["OTHER", "TEST"]
+    with raises(peewee.IntegrityError):
+        models.Tag.create(name="dupe")
+
+def test_tag_many(db):
+    runs = [models.Run.create(name=f"run_{i}", path=f"/run_{i}") for i in range(3)]
+    runs[0].tag("b")
+    with patch.object(db, 'execute_sql', wraps=db.execute_sql) as execute:
+        tags = models.Run.tag_many(runs, ["a", "b", "a"])
+    assert execute.call_count < 10, "tagging shouldn't take a query per run or tag"
+    assert [ta.name for ta in tags] == ["a", "b"]
+    models.Run.tag_many(runs, ["a", "b"]) # already tagged, so nothing happens
+    assert models.TagJunction.select().count() == 6
+    assert sorted(run.name for run in models.Run.get_by_tags("a AND b")) == ["run_0", "run_1", "run_2"]
+    with raises(ValueError):
+        models.Run.tag_many(runs, [""])
+
+def test_ttag_many(db):
+    sheet = models.SampleSheet.create()
+    samples = [models.Sample.create(samplesheet=sheet, sample_id=f"s{i}", barcode_id=f"NB0{i}") for i in range(2)]
+    tags = models.Sample.ttag_many(samples, [("ONT", "kit", "LSK109"), ("PR", "organism", "E. coli")])
+    assert [(ta.namespace, ta.name, ta.value) for ta in tags] == [("ONT", "kit", "LSK109"), ("PR", "organism", "E. coli")]
+    assert samples[1].ttag("ONT", "kit", "LSK109").id == tags[0].id
+    assert models.TTagJunction.select().count() == 4
+    assert samples[0].tags.PR.organism == "E. coli"
+    with raises(ValueError):
+        models.Sample.ttag_many(samples, [("ONT", "kit", None)])
+
+def test_upgrade_tables_makes_junctions_unique(db):
+    "Junction indexes weren't unique before; older databases lose their duplicate junctions and get the index rebuilt."
+    db.execute_sql('DROP INDEX tagjunction_tag_id_run_id')
+    db.execute_sql('CREATE INDEX tagjunction_tag_id_run_id ON tagjunction (tag_id, run_id)')
+    run = models.Run.create(name="TEST", path="/TEST")
+    tag = models.Tag.create(name="TEST")
+    for _ in range(2):
+        models.TagJunction.create(tag=tag, run=run)
+    models.upgrade_tables()
+    assert models.TagJunction.select().count() == 1
+    assert {index.name: index.unique for index in db.get_indexes('tagjunction')}['tagjunction_tag_id_run_id']
+    with raises(peewee.IntegrityError):
+        models.TagJunction.create(tag=tag, run=run)
+
+def test_upgrade_tables_adds_not_null_columns_to_tables_with_rows(db):
+    "Adding a NOT NULL column rebuilds the table, which mustn't trip the foreign keys pointing at its rows."
+    run = models.Run.create(name="TEST", path="/TEST")
+    fi = models.File.create(run=run, path="/TEST/1.fastq")
+    fi._duties.add(models.Duty.create(job_class="TestJob", run=run, file=fi, datadir="/tmp"))
+    fi.tag("finished")
+    for table, column in (('file', 'hashed_bytes'), ('file', 'size'), ('file', 'present'), ('duty', 'step')):
+        db.execute_sql(f'ALTER TABLE {table} DROP COLUMN {column}')
+    assert models.upgrade_tables() == 4
+    assert db.pragma('foreign_keys') == 1
+    fi = models.File.get_by_id(fi.id)
+    assert (fi.run.id, fi.hashed_bytes, fi.size, [duty.step for duty in models.Duty.select()]) == (run.id, 0, 0, [0])
+    assert [tag.name for tag in fi.tags] == ["finished"]
@@ -9,6 +9,7 @@ from pytest import mark
 from tests import db, Event  # noqa: F401  (db fixture, Event namedtuple)
 
 from porerefiner import models
+from porerefiner.protocols.porerefiner.rpc.porerefiner_pb2 import SampleSheet as SheetMessage
 from porerefiner.fsevents import PoreRefinerFSEventHandler as Handler
 
 
@@ -23,6 +24,29 @@ def test_bulk_run_creation(db):
     assert elapsed < 30, f"bulk insert too slow: {elapsed:.1f}s"
 
 
+@mark.parametrize("samples", [96, 384, 1536])
+def test_sample_sheet_ingestion(db, samples):
+    "A plate's sample sheet is ingested, and replaced, in a few statements whatever its size."
+    from unittest.mock import patch
+    sheet = SheetMessage(library_id="PLATE", tags=["plate"])
+    for i in range(samples):
+        sample = sheet.samples.add(sample_id=f"s_{i}", barcode_id=f"NB{i % 96:02}", organism="E. coli")
+        sample.trip_tags.add(namespace="PR", name="well", value=f"{chr(65 + i // 96 % 16)}{i % 96}")
+        sample.trip_tags.add(namespace="PR", name="plate", value=f"{i // 96}")
+        sample.trip_tags.add(namespace="ONT", name="kit", value="SQK-LSK109")
+    models.SampleSheet.new_sheet_from_message(sheet)
+    with patch.object(db, 'execute_sql', wraps=db.execute_sql) as execute:
+        start = time.perf_counter()
+        ss = models.SampleSheet.new_sheet_from_message(sheet) # replaces the first, still unused, sheet
+        elapsed = time.perf_counter() - start
+    assert execute.call_count < 50 + samples // 10, f"{execute.call_count} statements for {samples} samples"
+    assert models.SampleSheet.select().count() == 1
+    assert models.Sample.select().where(models.Sample.samplesheet == ss).count() == samples
+    assert models.TTagJunction.select().count() == 3 * samples
+    assert ss.samples[-1].tags.PR.plate == str((samples - 1) // 96)
+    assert elapsed < 5, f"sample sheet ingestion too slow: {elapsed:.1f}s"
+
+
 @mark.asyncio
 async def test_many_file_events(db):
     "The event handler should register many files under one run without error."
@@ -37,3 +61,127 @@ async def test_many_file_events(db):
             await handler.on_created(Event(fp, False))
         assert models.Run.select().count() == 1
         assert models.File.select().count() == 50
+
+
+@mark.asyncio
+async def test_reconcile_large_run_directory(db):
+    "Startup reconciliation should bulk-register a large pre-existing run directory quickly."
+    from porerefiner.fsevents import reconcile_run_directories
+    with TemporaryDirectory() as t:
+        base = Path(t)
+        run_dir = base / "EXP" / "SAMPLE" / "20240101_dev_fc_run"
+        for sub in ("fastq_pass", "fastq_fail"):
+            (run_dir / sub).mkdir(parents=True)
+            for i in range(2500):
+                (run_dir / sub / f"read_{i}.fastq").touch()
+        start = time.perf_counter()
+        assert await reconcile_run_directories(base) == 5000
+        elapsed = time.perf_counter() - start
+        assert models.File.select().count() == 5000
+        assert models.TagJunction.select().count() == 5000
+        assert elapsed < 10, f"reconciliation too slow: {elapsed:.1f}s"
+
+
+def test_quiet_run_sweep_is_one_fast_query(db):
+    "The fallback sweep for quiet runs should be a single indexed query, even over many runs and files."
+    from datetime import datetime, timedelta
+    now = datetime.now()
+    runs, files_per_run = 10000, 10
+    with db.atomic():
+        models.Run.insert_many([dict(name=f"run_{i}", path=f"/data/run_{i}", alt_name=f"run_{i}") for i in range(runs)]).execute()
+        for i in range(0, runs, 500):
+            models.File.insert_many([(run_id, f"/data/run_{run_id}/read_{j}.fastq", now - timedelta(hours=2 if run_id % 2 else 0, seconds=j))
+                                     for run_id in range(i + 1, i + 501) for j in range(files_per_run)],
+                                    fields=[models.File.run, models.File.path, models.File.last_modified]).execute()
+    start = time.perf_counter()
+    quiet = list(models.Run.get_quiet_runs(now - timedelta(hours=1)))
+    elapsed = time.perf_counter() - start
+    assert len(quiet) == runs // 2
+    assert all(run_id % 2 for run_id, _ in quiet)
+    assert elapsed < 2, f"quiet-run sweep too slow: {elapsed:.2f}s"
+
+
+@mark.asyncio
+async def test_list_runs_query_count_is_constant(db):
+    "Assembling run messages shouldn't cost queries per run, file or tag."
+    from unittest.mock import patch
+    from porerefiner import rpc
+    with TemporaryDirectory() as t:
+        def populate(first, count):
+            for i in range(first, first + count):
+                sheet = models.SampleSheet.create(barcoding_kit="EXP-NBD104")
+                run = models.Run.create(name=f"run_{i}", path=f"{t}/run_{i}", _sample_sheet=sheet)
+                run.tag("TEST")
+                run.ttag("ONT", "experiment", f"exp_{i}")
+                for j in range(2):
+                    sample = models.Sample.create(samplesheet=sheet, sample_id=f"s_{i}_{j}", barcode_id="NB01")
+                    sample.tag("sampled")
+                    path = Path(t) / f"run_{i}_sample_{j}.fastq"
+                    path.touch()
+                    models.File.create(sample=sample, path=path).tag("fastq_pass")
+                for j in range(3):
+                    path = Path(t) / f"run_{i}_{j}.fastq"
+                    path.touch()
+                    models.File.create(run=run, path=path).ttag("PR", "kind", "reads")
+
+        populate(0, 5)
+        with patch.object(db, 'execute_sql', wraps=db.execute_sql) as execute:
+            few = await rpc.list_runs(all=True)
+        few_queries = execute.call_count
+
+        populate(5, 295)
+        with patch.object(db, 'execute_sql', wraps=db.execute_sql) as execute:
+            start = time.perf_counter()
+            many = await rpc.list_runs(all=True)
+            elapsed = time.perf_counter() - start
+        assert execute.call_count == few_queries <= 6
+        assert len(few) == 5 and len(many) == 300
+        run = many[-1]
+        assert len(run.files) == 3 and len(run.samples) == 2
+        assert list(run.tags) == ["TEST"] and run.trip_tags[0].value == "exp_299"
+        assert run.samples[0].barcode_seq == "AAGAAAGTTGTCGGTGTCTTTGTG"
+        assert list(run.samples[0].tags) == ["sampled"]
+        assert list(run.samples[0].files[0].tags) == ["fastq_pass"]
+        assert run.files[0].trip_tags[0].value == "reads"
+        with patch.object(db, 'execute_sql', wraps=db.execute_sql) as execute:
+            tagged = await rpc.list_runs(tags=["TEST"])
+        assert len(tagged) == 300
+        assert execute.call_count == few_queries
+        assert elapsed < 10, f"run listing too slow: {elapsed:.1f}s"
+
+        with patch.object(db, 'execute_sql', wraps=db.execute_sql) as execute:
+            start = time.perf_counter()
+            summaries = await rpc.list_runs(all=True, view=rpc.RunView.SUMMARY)
+            summary_elapsed = time.perf_counter() - start
+        assert execute.call_count <= 7
+        assert [(s.id, s.sample_count, s.file_count) for s in summaries] == [(r.id, 2, 5) for r in many]
+        assert not summaries[-1].samples and not summaries[-1].files
+        assert list(summaries[-1].tags) == ["TEST"] and summaries[-1].sequencing_kit == "EXP-NBD104"
+        assert summaries[-1].ByteSize() * 4 < run.ByteSize()
+        assert summary_elapsed < elapsed
+
+
+def test_tag_query_on_100k_files(db):
+    "A compound tag query over 100k tagged files should be answered from the tag indexes, in one query."
+    from unittest.mock import patch
+    from peewee import chunked
+    from porerefiner.tagquery import matches
+    run = models.Run.create(name="run", path="/data/run")
+    passed, failed = models.Tag.create(name="fastq_pass"), models.Tag.create(name="fastq_fail")
+    devices = [models.TripleTag.create(namespace="ONT", name="device", value=f"X{n}") for n in range(5)]
+    with db.atomic():
+        for batch in chunked(range(100000), 1000):
+            models.File.insert_many([dict(run=run.id, path=f"/data/run/read_{i}.fastq") for i in batch]).execute()
+            models.TagJunction.insert_many([dict(tag=(passed, failed)[i % 10 == 1], file=i + 1) for i in batch]).execute()
+            models.TTagJunction.insert_many([dict(tag=devices[i % 5], file=i + 1) for i in batch]).execute()
+    query = models.File.select(models.File.id).where(matches(models.File, "fastq_pass AND ONT:device=X1 AND NOT ONT:device=X2"))
+    plan = " ".join(str(row) for row in db.execute_sql(f"EXPLAIN QUERY PLAN {query.sql()[0]}", query.sql()[1]))
+    assert "SCAN" not in plan, plan
+    assert "tagjunction_tag_id_file_id" in plan and "tripletag_namespace_name_value" in plan, plan
+    with patch.object(db, 'execute_sql', wraps=db.execute_sql) as execute:
+        start = time.perf_counter()
+        found = len(list(query.tuples()))
+        elapsed = time.perf_counter() - start
+    assert execute.call_count == 1
+    assert found == 10000 # device X1 is i % 5 == 1, half of which failed
+    assert elapsed < 2, f"tag query too slow: {elapsed:.2f}s"
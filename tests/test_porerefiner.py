@@ -41,6 +41,7 @@ import os, sys
 
 from datetime import datetime, timedelta
 
+import peewee
 from peewee import JOIN
 
 
@@ -122,6 +123,51 @@ async def test_list_runs_tags(run):
     assert len(await rpc.list_runs(tags=['TEST', 'other tag'])) == 1
 
 
+@mark.asyncio
+async def test_list_runs_filters_sorts_and_pages(db):
+    now = datetime.now()
+    runs = [models.Run.create(name=f"run_{i}", path=f"TEST/TEST/run_{i}", started=now - timedelta(days=i), status=('DONE', 'RUNNING')[i % 2]) for i in range(6)]
+    ids = [run.id for run in runs]
+    assert [msg.id for msg in await rpc.list_runs(status=['DONE'])] == ids[0::2]
+    assert [msg.id for msg in await rpc.list_runs(all=True, started_after=now - timedelta(days=2, hours=1), started_before=now - timedelta(hours=1))] == ids[1:3]
+    assert [msg.id for msg in await rpc.list_runs(all=True, order_by='started')] == ids[::-1]
+    assert [msg.id for msg in await rpc.list_runs(all=True, order_by='name', descending=True, limit=2, offset=1)] == ids[4:2:-1]
+    assert [msg.id for msg in await rpc.list_runs(all=True, offset=4)] == ids[4:]
+    with raises(ValueError):
+        await rpc.list_runs(all=True, order_by='path; drop table run')
+
+@mark.asyncio
+async def test_get_runs_handler_pages(db):
+    ids = [models.Run.create(name=f"run_{i}", path=f"TEST/TEST/run_{i}").id for i in range(5)]
+    ut = rpc.PoreRefinerDispatchServer()
+    strm = AsyncMock()
+    strm.recv_message.return_value = messages.RunListRequest(all=True, limit=2, offset=2, descending=True)
+    await ut.GetRuns(strm)
+    resp = strm.send_message.call_args.args[0]
+    assert [run.id for run in resp.runs.runs] == ids[2:0:-1]
+    assert resp.runs.total == 5
+    strm.recv_message.return_value = messages.RunListRequest(order_by='nope')
+    await ut.GetRuns(strm)
+    assert strm.send_message.call_args.args[0].error.type == 'ValueError'
+
+
+@mark.asyncio
+async def test_stream_runs_pages(db):
+    runs = [models.Run.create(name=f"run_{i}", path=f"TEST/TEST/run_{i}") for i in range(7)]
+    ids = [run.id for run in runs]
+    assert [msg.id async for msg in rpc.stream_runs(batch_size=3)] == ids
+    assert [msg.id async for msg in rpc.stream_runs(page_size=4, batch_size=3)] == ids[:4]
+    assert [msg.id async for msg in rpc.stream_runs(page_size=4, after_id=ids[4], batch_size=3)] == ids[5:]
+
+@mark.asyncio
+async def test_stream_runs_handler(run):
+    ut = rpc.PoreRefinerDispatchServer()
+    strm = AsyncMock()
+    strm.recv_message.return_value = messages.RunStreamRequest(all=True)
+    await ut.StreamRuns(strm)
+    assert [call.args[0].id for call in strm.send_message.call_args_list] == [run.id]
+
+
 # #@skip('not implemented')
 # @patch('porerefiner.fsevents.end_run', new_callable=AsyncMock)
 # def test_poll_active_run(self, mock):
@@ -269,6 +315,42 @@ async def test_attach_sheet_to_run(ss, run):
     strm.send_message.assert_called_once()
 
 
+@mark.asyncio
+async def test_run_info_uses_stored_sizes_unless_verified(db):
+    with TemporaryDirectory() as t:
+        path = pathlib.Path(t) / "read_0.fastq"
+        path.write_text("ACGT")
+        run = models.Run.create(name="TEST", path=t)
+        models.File.create(run=run, path=path, size=2)
+        with patch.object(pathlib.Path, 'stat', side_effect=AssertionError("stat()ed without being asked")):
+            assert (await rpc.get_run_info(run.id)).files[0].size == 2
+        assert (await rpc.get_run_info(run.id, verify=True)).files[0].size == 4
+        assert models.File.get().size == 4
+        path.unlink()
+        assert not (await rpc.get_run_info(run.id, verify=True)).files
+        assert not models.File.get().present
+        assert not (await rpc.get_run_info(run.id)).files
+
+@mark.asyncio
+async def test_trigger_scheduled_task():
+    from porerefiner.scheduler import Scheduler
+    scheduler = Scheduler()
+    async def tick():
+        pass
+    scheduler.add('runs', tick, 3600, delay=3600)
+    ut = rpc.PoreRefinerDispatchServer()
+    with patch('porerefiner.rpc.SCHEDULER', scheduler):
+        strm = AsyncMock()
+        strm.recv_message.return_value = messages.TriggerRequest(task='runs')
+        await ut.Trigger(strm)
+        resp = strm.send_message.call_args.args[0]
+        assert not resp.HasField('error')
+        assert scheduler.tasks['runs'].runs == 1
+        strm.recv_message.return_value = messages.TriggerRequest(task='nope')
+        await ut.Trigger(strm)
+        assert strm.send_message.call_args.args[0].error.type == 'NoSuchTask'
+    await scheduler.stop()
+
 
 #@skip('no test')
 @patch('porerefiner.rpc.graceful_exit')
@@ -294,3 +376,31 @@ def test_config_dictlike_access():
     c = config.Config(f)
     assert config.Config['server']['socket']
 
+
+@mark.asyncio
+async def test_serve_starts_on_a_database_with_duplicate_tags(tmp_path):
+    "Tags weren't unique before; the service has to merge them before it builds the unique indexes."
+    db_path = str(tmp_path / 'database.db')
+    pragmas = {'foreign_keys': 1}
+    models._db.bind(models.REGISTRY, bind_refs=True, bind_backrefs=True)
+    models._db.init(db_path, pragmas)
+    models._db.create_tables(models.REGISTRY)
+    for table in models._db.get_tables():
+        for index in models._db.get_indexes(table):
+            if index.unique:
+                models._db.execute_sql(f'DROP INDEX "{index.name}"')
+    run = models.Run.create(name="TEST", path="/TEST")
+    for _ in range(2):
+        models.TagJunction.create(tag=models.Tag.create(name="dupe"), run=run)
+        models.TTagJunction.create(tag=models.TripleTag.create(namespace="ONT", name="device", value="X1"), run=run)
+    models._db.close()
+    startup = dict.fromkeys(['start_server', 'start_fs_watchdog', 'start_minknow_listener', 'start_run_end_polling', 'start_job_polling',
+                             'start_modification_flushing', 'in_progress_run_update', 'reconcile_run_directories'], AsyncMock(return_value=None))
+    try:
+        with patch.multiple(porerefiner, **startup):
+            await porerefiner.serve(None, db_path, pragmas, {'path': str(tmp_path)}, {'socket': None}, {'run_polling_interval': 600})
+        assert [str(tag) for tag in models.Run.get_by_id(run.id).tags] == ["dupe", "ONT:device=X1"]
+        with raises(peewee.IntegrityError):
+            models.Tag.create(name="dupe")
+    finally:
+        models._db.close()
@@ -0,0 +1,114 @@
+"Tests for the periodic task scheduler."
+
+import asyncio
+
+from pytest import mark, raises
+
+from porerefiner.scheduler import Scheduler
+
+
+@mark.asyncio
+async def test_tasks_tick_repeatedly():
+    scheduler = Scheduler(jitter=0)
+    ticks = []
+    async def tick():
+        ticks.append(asyncio.get_running_loop().time())
+    scheduler.add('tick', tick, 0.01)
+    scheduler.start()
+    try:
+        await asyncio.sleep(0.1)
+    finally:
+        await scheduler.stop()
+    assert len(ticks) >= 3
+    assert all(b - a >= 0.01 for a, b in zip(ticks, ticks[1:]))
+
+@mark.asyncio
+async def test_ticks_never_overlap():
+    scheduler = Scheduler(jitter=0)
+    active = []
+    overlapped = []
+    async def slow():
+        overlapped.append(bool(active))
+        active.append(1)
+        await asyncio.sleep(0.03)
+        active.pop()
+    task = scheduler.add('slow', slow, 0.01)
+    scheduler.start()
+    try:
+        await asyncio.sleep(0.02)
+        assert scheduler.trigger('slow') is task.current # coalesced onto the tick in flight
+        await asyncio.sleep(0.1)
+    finally:
+        await scheduler.stop()
+    assert overlapped and not any(overlapped)
+    assert task.overruns == task.runs
+
+@mark.asyncio
+async def test_trigger_runs_now_and_records_metrics():
+    scheduler = Scheduler(jitter=0)
+    async def tick():
+        return 5
+    task = scheduler.add('tick', tick, 3600, delay=3600)
+    scheduler.start()
+    try:
+        assert await scheduler.trigger('tick') == 5
+        stats = scheduler.stats()['tick']
+        assert stats['runs'] == 1
+        assert stats['last_duration'] is not None
+        assert not stats['running']
+        assert task.due > asyncio.get_running_loop().time() + 3000 # rescheduled a full interval out
+        with raises(ValueError):
+            scheduler.trigger('nope')
+    finally:
+        await scheduler.stop()
+
+@mark.asyncio
+async def test_wake_brings_next_tick_forward():
+    scheduler = Scheduler(jitter=0)
+    ticks = []
+    async def tick():
+        ticks.append(1)
+        if len(ticks) == 1:
+            scheduler.wake('tick', 0.01) # from inside its own tick
+    scheduler.add('tick', tick, 3600)
+    scheduler.start()
+    try:
+        await asyncio.sleep(0.05)
+        assert len(ticks) == 2
+        scheduler.wake('tick', 0)
+        await asyncio.sleep(0.01)
+        assert len(ticks) == 3
+    finally:
+        await scheduler.stop()
+
+@mark.asyncio
+async def test_failures_are_recorded_and_rescheduled():
+    scheduler = Scheduler(jitter=0)
+    async def broken():
+        raise OSError("disk gone")
+    task = scheduler.add('broken', broken, 0.01)
+    scheduler.start()
+    try:
+        await asyncio.sleep(0.05)
+    finally:
+        await scheduler.stop()
+    assert task.failures >= 2
+    assert task.last_error == "OSError: disk gone"
+
+@mark.asyncio
+async def test_stop_cancels_ticks_in_flight():
+    scheduler = Scheduler()
+    cancelled = asyncio.Event()
+    async def forever():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+    scheduler.add('forever', forever, 1)
+    runner = scheduler.start()
+    await asyncio.sleep(0.01)
+    await scheduler.stop()
+    assert cancelled.is_set()
+    assert runner.done()
+    assert not scheduler.tasks
@@ -0,0 +1,61 @@
+"Tests for the pooled SSH connections submitters send commands over."
+
+import asyncio
+
+from pytest import raises
+
+from tests import login_node
+
+from porerefiner.sshpool import SshPool
+
+
+def run_on(pool, node, command):
+    return pool.run(command, '127.0.0.1', port=node.port, username='tester',
+                    client_keys=[node.private_key_path], known_hosts=node.known_hosts_path)
+
+async def test_commands_share_a_connection(login_node):
+    pool = SshPool()
+    for _ in range(200):
+        result = await run_on(pool, login_node, 'qstat')
+    assert result.exit_status == 0
+    assert len(login_node.connections) == 1
+    assert pool.stats() == dict(connections=1, opened=1, channels=0)
+    await pool.close()
+
+async def test_channels_per_connection_are_capped(login_node):
+    pool = SshPool(max_channels=4, max_connections=2)
+    login_node.delay = 0.01
+    results = await asyncio.gather(*(run_on(pool, login_node, 'qstat') for _ in range(50)))
+    assert all(result.exit_status == 0 for result in results)
+    assert len(login_node.connections) == 2
+    assert login_node.most_running <= 8
+    await pool.close()
+
+async def test_reconnects_after_drop(login_node):
+    pool = SshPool()
+    await run_on(pool, login_node, 'qstat')
+    login_node.drop()
+    await asyncio.sleep(0.1) # let the client notice
+    assert (await run_on(pool, login_node, 'echo "sleep 1" | qsub -q long.q')).stdout.startswith("Your job 1")
+    assert len(login_node.connections) == 2
+    assert pool.stats()['connections'] == 1
+    await pool.close()
+
+async def test_idle_connections_are_closed(login_node):
+    pool = SshPool(idle_timeout=0.05)
+    await run_on(pool, login_node, 'qstat')
+    await asyncio.sleep(0.2)
+    assert pool.stats()['connections'] == 0
+    assert login_node.connections[0].is_closed()
+    await run_on(pool, login_node, 'qstat')
+    assert pool.stats() == dict(connections=1, opened=2, channels=0)
+    await pool.close()
+
+async def test_failed_commands_keep_the_connection(login_node):
+    import asyncssh
+    pool = SshPool()
+    with raises(asyncssh.ProcessError):
+        await run_on(pool, login_node, 'qdel 1')
+    await run_on(pool, login_node, 'qstat')
+    assert pool.stats() == dict(connections=1, opened=1, channels=0)
+    await pool.close()
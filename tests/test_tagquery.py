@@ -0,0 +1,72 @@
+"Tests for parsing and compiling tag queries."
+
+from pytest import mark, raises
+
+from tests import db
+
+from porerefiner.models import Run, File
+from porerefiner.tagquery import parse, matches, TagQueryError
+
+
+@mark.parametrize("expression,tree", [
+    ("TEST", ('tag', 'TEST')),
+    ("another tag", ('tag', 'another tag')), # no operators: the whole thing is one tag, as before
+    ("a OR b AND NOT c", ('or', ('tag', 'a'), ('and', ('tag', 'b'), ('not', ('tag', 'c'))))),
+    ("(a OR b) AND c", ('and', ('or', ('tag', 'a'), ('tag', 'b')), ('tag', 'c'))),
+    ('"another tag" AND ONT:device=X1', ('and', ('tag', 'another tag'), ('tag', 'ONT:device=X1'))),
+    ("NOT NOT a", ('not', ('not', ('tag', 'a')))),
+])
+def test_parse(expression, tree):
+    assert parse(expression) == tree
+
+@mark.parametrize("expression", ["", "a AND", "(a OR b", "a b AND c", "NOT", '"open', "a )"])
+def test_parse_errors(expression):
+    with raises(TagQueryError):
+        parse(expression)
+
+def test_matches(db):
+    runs = {name: Run.create(name=name, path=f"/{name}") for name in ("a", "b", "c")}
+    runs['a'].tag("TEST")
+    runs['a'].ttag("ONT", "device", "X1")
+    runs['b'].tag("TEST")
+    runs['b'].ttag("ONT", "device", "X2")
+    runs['c'].ttag("Porerefiner", "device", "X1")
+    runs['c'].tag("another tag")
+
+    def query(*expressions):
+        return sorted(run.name for run in Run.select().where(matches(Run, *expressions)))
+
+    assert query("TEST") == ["a", "b"]
+    assert query("X1") == ["a", "c"] # plain tags also match triple tag values, as before
+    assert query("ONT:device=X1") == ["a"]
+    assert query("device=X1") == ["a", "c"]
+    assert query("ONT:device=*") == ["a", "b"]
+    assert query("TEST AND NOT ONT:device=X1") == ["b"]
+    assert query("NOT TEST") == ["c"]
+    assert query("(TEST AND X2) OR \"another tag\"") == ["b", "c"]
+    assert query("TEST", "another tag") == ["a", "b", "c"] # separate queries are alternatives
+    assert query("missing") == []
+
+def test_matches_other_taggables(db):
+    run = Run.create(name="a", path="/a")
+    tagged = File.create(run=run, path="/a/1.fastq")
+    File.create(run=run, path="/a/2.fastq")
+    tagged.tag("fastq_pass")
+    run.tag("fastq_pass")
+    assert [fi.id for fi in File.get_by_tags("fastq_pass")] == [tagged.id]
+
+def test_not_ignores_other_owners_of_a_tag(db):
+    runs = {name: Run.create(name=name, path=f"/{name}") for name in ("a", "b")}
+    runs['a'].tag("keep")
+    runs['a'].ttag("ONT", "device", "X1")
+    tagged = File.create(run=runs['a'], path="/a/1.fastq")
+    tagged.tag("keep")
+    tagged.tag("fastq_pass")
+    tagged.ttag("ONT", "device", "X1")
+
+    def query(*expressions):
+        return sorted(run.name for run in Run.select().where(matches(Run, *expressions)))
+
+    assert query("NOT keep") == ["b"]
+    assert query("NOT fastq_pass") == ["a", "b"]
+    assert query("NOT ONT:device=X1") == ["b"]